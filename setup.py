@@ -1,6 +1,50 @@
 from distutils.core import setup, Extension
+from distutils.command.build_ext import build_ext
+from distutils.errors import CompileError, LinkError
 
 import numpy as np
+import tempfile
+import warnings
+import os
+
+
+OPENMP_TEST = """#include <omp.h>
+
+int main(void)
+{
+    return omp_get_max_threads() < 1;
+}
+"""
+
+
+class BuildExt(build_ext):
+    """Builds the c-extension with OpenMP if the compiler supports it and serially otherwise"""
+
+    def build_extensions(self):
+        if self.supports_openmp():
+            for extension in self.extensions:
+                extension.extra_compile_args.append("-fopenmp")
+                extension.extra_link_args.append("-fopenmp")
+        else:
+            warnings.warn(
+                "The compiler does not support OpenMP. The 'threads'-backend of 'GPCSystemGroup' will compute"
+                " GPC-systems with one thread only."
+            )
+        super().build_extensions()
+
+    def supports_openmp(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "openmp_test.c")
+            with open(source, "w") as source_file:
+                source_file.write(OPENMP_TEST)
+            try:
+                objects = self.compiler.compile([source], output_dir=directory, extra_postargs=["-fopenmp"])
+                self.compiler.link_executable(
+                    objects, os.path.join(directory, "openmp_test"), extra_postargs=["-fopenmp"]
+                )
+            except (CompileError, LinkError):
+                return False
+        return True
 
 
 c_extension = Extension(
@@ -12,5 +56,6 @@ c_extension = Extension(
 
 if __name__ == "__main__":
     setup(
-        ext_modules=[c_extension]
+        ext_modules=[c_extension],
+        cmdclass={"build_ext": BuildExt}
     )
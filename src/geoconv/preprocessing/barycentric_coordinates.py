@@ -69,6 +69,85 @@ def interpolation(query_point, gpc_triangles, gpc_triangles_node_indices):
     return np.array([0., 0., 0.]), np.array([0, 0, 0])
 
 
+def _batch_dot(vectors_a, vectors_b):
+    vectors_a, vectors_b = np.broadcast_arrays(vectors_a, vectors_b)
+    return (vectors_a[..., None, :] @ vectors_b[..., :, None])[..., 0, 0]
+
+
+def compute_barycentric_batch(query_vertices, triangles):
+    """Computes barycentric coordinates of multiple query vertices w.r.t. multiple triangles at once
+
+    Vectorized version of `compute_barycentric`, which yields identical results for every pair of query vertex and
+    triangle.
+
+    Parameters
+    ----------
+    query_vertices: np.ndarray
+        2D-array of shape (n_queries, 2) that contains query-vertices in cartesian coordinates
+    triangles: np.ndarray
+        3D-array of shape (n_triangles, 3, 2) that contains triangles in cartesian coordinates
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray)
+        An array of shape (n_queries, n_triangles, 3) that contains the barycentric coordinates for the vertices of
+        each triangle and a boolean array of shape (n_queries, n_triangles) that tells whether a query-vertex is within
+        a triangle.
+    """
+    v0 = triangles[:, 2] - triangles[:, 0]
+    v1 = triangles[:, 1] - triangles[:, 0]
+    v2 = query_vertices[:, None, :] - triangles[None, :, 0]
+
+    # Batched dot products via `matmul` round like `np.ndarray.dot` in `compute_barycentric`
+    dot00, dot01 = _batch_dot(v0, v0), _batch_dot(v0, v1)
+    dot11 = _batch_dot(v1, v1)
+    dot02, dot12 = _batch_dot(v0[None], v2), _batch_dot(v1[None], v2)
+
+    denominator = dot00 * dot11 - dot01 * dot01
+    denominator[denominator == 0] += sys.float_info.min
+    point_2_weight = (dot11 * dot02 - dot01 * dot12) / denominator
+    point_1_weight = (dot00 * dot12 - dot01 * dot02) / denominator
+    point_0_weight = 1 - point_2_weight - point_1_weight
+
+    is_inside_triangle = (point_2_weight > 0) & (point_1_weight > 0) & (point_2_weight + point_1_weight <= 1)
+
+    return np.stack([point_0_weight, point_1_weight, point_2_weight], axis=-1), is_inside_triangle
+
+
+def interpolate_template(template_matrix, gpc_triangles, gpc_triangles_node_indices):
+    """Interpolates all template vertices within a GPC-system
+
+    All template vertices are tested against all triangles in one batch (see `compute_barycentric_batch`). Like in
+    `interpolation`, a template vertex is interpolated within the first triangle that contains it.
+
+    Parameters
+    ----------
+    template_matrix: np.ndarray
+        The template in cartesian coordinates (see `create_template_matrix`)
+    gpc_triangles: np.ndarray
+        The triangles contained in the GPC-system in cartesian coordinates
+    gpc_triangles_node_indices: np.ndarray
+        The indices of the triangles contained in the GPC-system
+
+    Returns
+    -------
+    np.ndarray:
+        The barycentric coordinates of the template vertices of shape (n_radial, n_angular, 3, 2) in the format of
+        `compute_barycentric_coordinates`.
+    """
+    n_radial, n_angular = template_matrix.shape[:2]
+    barycentric_coordinates = np.zeros((n_radial * n_angular, 3, 2))
+    if len(gpc_triangles) > 0:
+        b_coordinates, lies_within = compute_barycentric_batch(template_matrix.reshape((-1, 2)), gpc_triangles)
+        # Select the first triangle that contains the template vertex. Template vertices outside all triangles keep
+        # zero indices and zero barycentric coordinates.
+        first_hit = np.argmax(lies_within, axis=-1)
+        hit = np.nonzero(lies_within.any(axis=-1))[0]
+        barycentric_coordinates[hit, :, 0] = np.asarray(gpc_triangles_node_indices)[first_hit[hit]]
+        barycentric_coordinates[hit, :, 1] = b_coordinates[hit, first_hit[hit]]
+    return barycentric_coordinates.reshape((n_radial, n_angular, 3, 2))
+
+
 def polar_to_cart(angles, scales=1.):
     """Returns x and y for a given angle.
 
@@ -108,25 +187,61 @@ def create_template_matrix(n_radial, n_angular, radius, in_cart=False):
         A template matrix K with K[i, j] containing polar coordinates (radial, angular) of point (i. j)
     """
 
-    coordinates = np.zeros((n_radial, n_angular, 2))
-    for j in range(1, n_radial + 1):
-        radial_coordinate = (j * radius) / n_radial
-        for k in range(1, n_angular + 1):
-            angular_coordinate = (2 * k * np.pi) / n_angular
-            coordinates[j - 1, k - 1, 0] = radial_coordinate
-            coordinates[j - 1, k - 1, 1] = angular_coordinate
+    radial_coordinates = (np.arange(1, n_radial + 1) * radius) / n_radial
+    angular_coordinates = (2 * np.arange(1, n_angular + 1) * np.pi) / n_angular
+    coordinates = np.stack(np.meshgrid(radial_coordinates, angular_coordinates, indexing="ij"), axis=-1)
 
     if in_cart:
-        for rc in range(coordinates.shape[0]):
-            for ac in range(coordinates.shape[1]):
-                coordinates[rc, ac] = polar_to_cart(coordinates[rc, ac, 1], coordinates[rc, ac, 0])
+        coordinates = polar_to_cart(coordinates[:, :, 1], coordinates[:, :, 0])
 
     return coordinates
 
 
-def compute_barycentric_coordinates(gpc_systems, n_radial=2, n_angular=4, radius=0.05):
+def interpolate_local_gpc_system(template_matrix, vertex_ids, radial_coordinates, angular_coordinates, faces):
+    """Interpolates all template vertices within a GPC-system that is given by its vertex-local coordinates
+
+    Parameters
+    ----------
+    template_matrix: np.ndarray
+        The template in cartesian coordinates (see `create_template_matrix`)
+    vertex_ids: np.ndarray
+        The indices of the vertices which have coordinates in the GPC-system
+    radial_coordinates: np.ndarray
+        The radial coordinates of `vertex_ids`
+    angular_coordinates: np.ndarray
+        The angular coordinates of `vertex_ids`
+    faces: np.ndarray
+        The sorted faces of the GPC-system in face-cache order
+
+    Returns
+    -------
+    np.ndarray:
+        The barycentric coordinates of the template vertices of shape (n_radial, n_angular, 3, 2) in the format of
+        `compute_barycentric_coordinates`.
+    """
+    # Translate mesh vertex indices of the faces into positions within `vertex_ids`
+    faces = np.asarray(faces, dtype=np.int64)
+    order = np.argsort(vertex_ids)
+    local_faces = order[np.searchsorted(vertex_ids, faces, sorter=order)]
+    gpc_triangles = polar_to_cart(angles=angular_coordinates[local_faces], scales=radial_coordinates[local_faces])
+    return interpolate_template(template_matrix, gpc_triangles, faces)
+
+
+def compute_barycentric_coordinates(gpc_systems,
+                                    n_radial=2,
+                                    n_angular=4,
+                                    radius=0.05,
+                                    processes=None,
+                                    path=None):
     """Compute the barycentric coordinates for the given GPC-systems
 
+    The GPC-systems are split into chunks which are interpolated by `processes` worker processes (see
+    `GPCSystemGroup.interpolate_template`). Results are written into the returned array as soon as a chunk is done.
+    Given a `path`, this array is a memory-mapped `.npy`-file, such that its size is only bounded by the disk.
+
+    If the GPC-systems are only needed to compute barycentric coordinates, consider
+    `GPCSystemGroup.compute_barycentric_coordinates`, which does not keep all GPC-systems in memory.
+
     Parameters
     ----------
     gpc_systems: GPCSystemGroup
@@ -137,8 +252,10 @@ def compute_barycentric_coordinates(gpc_systems, n_radial=2, n_angular=4, radius
         The amount of angular coordinates of the template you wish to use
     radius: float
         The radius of the template of the template you wish to use
-    verbose: bool
-        Whether to print progress on terminal
+    processes: int
+        The amount of worker processes. Defaults to the amount of processes of `gpc_systems`.
+    path: str
+        If given, the barycentric coordinates are written into a memory-mapped `.npy`-file at this path.
 
     Returns
     -------
@@ -157,19 +274,40 @@ def compute_barycentric_coordinates(gpc_systems, n_radial=2, n_angular=4, radius
     # Define template vertices at which interpolation values will be needed
     template_matrix = create_template_matrix(n_radial=n_radial, n_angular=n_angular, radius=radius, in_cart=True)
     n_gpc_systems = gpc_systems.object_mesh_gpc_systems.shape[0]
-    barycentric_coordinates = np.zeros((n_gpc_systems, n_radial, n_angular, 3, 2))
-
-    for gpc_system_idx in tqdm(range(n_gpc_systems), postfix=f"Computing barycentric coordinates"):
-        gpc_system = gpc_systems.object_mesh_gpc_systems[gpc_system_idx]
-        gpc_triangles = gpc_system.get_gpc_triangles(in_cart=True)
-        for radial_coordinate in range(n_radial):
-            for angular_coordinate in range(n_angular):
-                bc, indices = interpolation(
-                    template_matrix[radial_coordinate, angular_coordinate],
-                    gpc_triangles,
-                    gpc_system.faces[(-1, -1)]
-                )
-                barycentric_coordinates[gpc_system_idx, radial_coordinate, angular_coordinate, :, 0] = indices
-                barycentric_coordinates[gpc_system_idx, radial_coordinate, angular_coordinate, :, 1] = bc
-
+    shape = (n_gpc_systems, n_radial, n_angular, 3, 2)
+    if path is None:
+        barycentric_coordinates = np.zeros(shape)
+    else:
+        barycentric_coordinates = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=shape)
+
+    with tqdm(total=n_gpc_systems, postfix=f"Computing barycentric coordinates") as progress_bar:
+        for gpc_system_indices, blocks in gpc_systems.interpolate_template(template_matrix, processes=processes):
+            barycentric_coordinates[gpc_system_indices] = blocks
+            progress_bar.update(len(gpc_system_indices))
+
+    if path is not None:
+        barycentric_coordinates.flush()
     return barycentric_coordinates
+
+
+def split_barycentric_coordinates(barycentric_coordinates, weight_dtype=np.float32):
+    """Splits barycentric coordinates into vertex indices and barycentric weights
+
+    The split format stores the vertex indices as int32 and the weights in `weight_dtype`, whereas the format returned
+    by `compute_barycentric_coordinates` stores both as float64. The split format is accepted by the `ConvIntrinsic`
+    layers of both frameworks, which then do not need to cast the vertex indices in every forward pass.
+
+    Parameters
+    ----------
+    barycentric_coordinates: np.ndarray
+        Barycentric coordinates of shape (n_vertices, n_radial, n_angular, 3, 2) (see
+        `compute_barycentric_coordinates`).
+    weight_dtype: type
+        The floating point type of the barycentric weights, e.g. `np.float32` or `np.float16`.
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray):
+        The vertex indices and the barycentric weights, both of shape (n_vertices, n_radial, n_angular, 3).
+    """
+    return barycentric_coordinates[..., 0].astype(np.int32), barycentric_coordinates[..., 1].astype(weight_dtype)
@@ -3,6 +3,8 @@
 
 #include <Python.h>
 #include <math.h>
+#include <float.h>
+#include <string.h>
 #include "numpy/arrayobject.h"
 #include "cblas.h"
 
@@ -144,6 +146,808 @@ void compute_dist_and_dir(double vertex_i[],
     result[1] = theta_i;
 }
 
+/*********************************************************************************************************************
+ * Native GPC-system engine
+ *
+ * Implements the whole algorithm of Melvær and Reimers as done by `GPCSystemGroup.compute_gpc_system` (heap loop,
+ * edge- and face-caches and intersection tests) without crossing the Python/C boundary.
+ *********************************************************************************************************************/
+
+typedef struct {
+    npy_int64 *data;
+    npy_int64 size;
+    npy_int64 capacity;
+} IntArray;
+
+static int int_array_push(IntArray *array, npy_int64 value)
+{
+    if (array->size == array->capacity) {
+        npy_int64 new_capacity = array->capacity ? 2 * array->capacity : 64;
+        npy_int64 *new_data = realloc(array->data, new_capacity * sizeof(npy_int64));
+        if (new_data == NULL) {
+            return -1;
+        }
+        array->data = new_data;
+        array->capacity = new_capacity;
+    }
+    array->data[array->size++] = value;
+    return 0;
+}
+
+// Open addressing hash map from non-negative integer keys onto integer values
+typedef struct {
+    npy_int64 *keys;
+    npy_int64 *values;
+    npy_int64 capacity;
+    npy_int64 size;
+} HashMap;
+
+static npy_uint64 hash_key(npy_int64 key)
+{
+    npy_uint64 x = (npy_uint64)key + 0x9E3779B97F4A7C15ULL;
+    x = (x ^ (x >> 30)) * 0xBF58476D1CE4E5B9ULL;
+    x = (x ^ (x >> 27)) * 0x94D049BB133111EBULL;
+    return x ^ (x >> 31);
+}
+
+static int hash_map_init(HashMap *map, npy_int64 capacity)
+{
+    map->keys = malloc(capacity * sizeof(npy_int64));
+    map->values = malloc(capacity * sizeof(npy_int64));
+    if (map->keys == NULL || map->values == NULL) {
+        return -1;
+    }
+    for (npy_int64 i = 0; i < capacity; i++) {
+        map->keys[i] = -1;
+    }
+    map->capacity = capacity;
+    map->size = 0;
+    return 0;
+}
+
+static void hash_map_clear(HashMap *map)
+{
+    for (npy_int64 i = 0; i < map->capacity; i++) {
+        map->keys[i] = -1;
+    }
+    map->size = 0;
+}
+
+static npy_int64 hash_map_get(const HashMap *map, npy_int64 key)
+{
+    npy_int64 mask = map->capacity - 1;
+    npy_int64 slot = (npy_int64)(hash_key(key) & (npy_uint64)mask);
+    while (map->keys[slot] != -1) {
+        if (map->keys[slot] == key) {
+            return map->values[slot];
+        }
+        slot = (slot + 1) & mask;
+    }
+    return -1;
+}
+
+static int hash_map_put(HashMap *map, npy_int64 key, npy_int64 value)
+{
+    if (2 * (map->size + 1) > map->capacity) {
+        HashMap grown;
+        if (hash_map_init(&grown, 2 * map->capacity) < 0) {
+            return -1;
+        }
+        for (npy_int64 i = 0; i < map->capacity; i++) {
+            if (map->keys[i] != -1) {
+                hash_map_put(&grown, map->keys[i], map->values[i]);
+            }
+        }
+        free(map->keys);
+        free(map->values);
+        *map = grown;
+    }
+    npy_int64 mask = map->capacity - 1;
+    npy_int64 slot = (npy_int64)(hash_key(key) & (npy_uint64)mask);
+    while (map->keys[slot] != -1 && map->keys[slot] != key) {
+        slot = (slot + 1) & mask;
+    }
+    if (map->keys[slot] == -1) {
+        map->size++;
+    }
+    map->keys[slot] = key;
+    map->values[slot] = value;
+    return 0;
+}
+
+static void hash_map_free(HashMap *map)
+{
+    free(map->keys);
+    free(map->values);
+}
+
+// Min-heap over (radial distance, vertex) which is ordered like Python's tuples in `heapq`
+typedef struct {
+    double *dists;
+    npy_int64 *vertices;
+    npy_int64 size;
+    npy_int64 capacity;
+} MinHeap;
+
+static int heap_less(const MinHeap *heap, npy_int64 a, npy_int64 b)
+{
+    return heap->dists[a] < heap->dists[b] || (heap->dists[a] == heap->dists[b] && heap->vertices[a] < heap->vertices[b]);
+}
+
+static void heap_swap(MinHeap *heap, npy_int64 a, npy_int64 b)
+{
+    double dist = heap->dists[a];
+    npy_int64 vertex = heap->vertices[a];
+    heap->dists[a] = heap->dists[b];
+    heap->vertices[a] = heap->vertices[b];
+    heap->dists[b] = dist;
+    heap->vertices[b] = vertex;
+}
+
+static int heap_push(MinHeap *heap, double dist, npy_int64 vertex)
+{
+    if (heap->size == heap->capacity) {
+        npy_int64 new_capacity = heap->capacity ? 2 * heap->capacity : 64;
+        double *new_dists = realloc(heap->dists, new_capacity * sizeof(double));
+        if (new_dists == NULL) {
+            return -1;
+        }
+        heap->dists = new_dists;
+        npy_int64 *new_vertices = realloc(heap->vertices, new_capacity * sizeof(npy_int64));
+        if (new_vertices == NULL) {
+            return -1;
+        }
+        heap->vertices = new_vertices;
+        heap->capacity = new_capacity;
+    }
+    npy_int64 child = heap->size++;
+    heap->dists[child] = dist;
+    heap->vertices[child] = vertex;
+    while (child > 0) {
+        npy_int64 parent = (child - 1) / 2;
+        if (!heap_less(heap, child, parent)) {
+            break;
+        }
+        heap_swap(heap, child, parent);
+        child = parent;
+    }
+    return 0;
+}
+
+static void heap_pop(MinHeap *heap, double *dist, npy_int64 *vertex)
+{
+    *dist = heap->dists[0];
+    *vertex = heap->vertices[0];
+    heap->size--;
+    heap->dists[0] = heap->dists[heap->size];
+    heap->vertices[0] = heap->vertices[heap->size];
+    npy_int64 parent = 0;
+    while (1) {
+        npy_int64 smallest = parent;
+        npy_int64 left = 2 * parent + 1;
+        npy_int64 right = left + 1;
+        if (left < heap->size && heap_less(heap, left, smallest)) {
+            smallest = left;
+        }
+        if (right < heap->size && heap_less(heap, right, smallest)) {
+            smallest = right;
+        }
+        if (smallest == parent) {
+            break;
+        }
+        heap_swap(heap, parent, smallest);
+        parent = smallest;
+    }
+}
+
+// Read-only mesh topology (see `MeshTopology`)
+typedef struct {
+    npy_int64 n_vertices;
+    const double *vertices;
+    const double *vertex_normals;
+    const npy_int64 *faces;
+    const npy_int64 *adjacency_offsets;
+    const npy_int64 *adjacency_indices;
+    const npy_int64 *adjacency_edge_ids;
+    const npy_int64 *edge_faces_offsets;
+    const npy_int64 *edge_faces;
+} Mesh;
+
+// State of one GPC-system. Dense per-vertex arrays are allocated once and reset only where they have been touched.
+typedef struct {
+    const Mesh *mesh;
+    npy_int64 source_point;
+    double rotation_axis[3];
+
+    // Coordinates
+    double *radial;
+    double *angular;
+    double *x;
+    double *y;
+    IntArray touched;
+
+    // Edge-cache: edges, edge-key -> edge index and per-vertex incidence as linked lists of edge indices
+    IntArray edges;
+    HashMap edge_ids;
+    npy_int64 *incidence_head;
+    npy_int64 *incidence_tail;
+    IntArray incidence_edge;
+    IntArray incidence_next;
+
+    // Face-cache: faces and edge-key -> linked list of face indices
+    IntArray faces;
+    HashMap edge_face_lists;
+    IntArray list_head;
+    IntArray list_tail;
+    IntArray list_face;
+    IntArray list_next;
+
+    // Scratch buffer for the third vertices of the faces of an edge
+    npy_int64 *k_vertices;
+    npy_int64 max_edge_faces;
+} GPCEngine;
+
+#define ENGINE_OK 0
+#define ENGINE_NO_MEMORY -1
+#define ENGINE_MISSING_GPC -2
+
+static int engine_init(GPCEngine *engine, const Mesh *mesh, npy_int64 n_edges)
+{
+    memset(engine, 0, sizeof(GPCEngine));
+    engine->mesh = mesh;
+    npy_int64 n = mesh->n_vertices;
+    engine->radial = malloc(n * sizeof(double));
+    engine->angular = malloc(n * sizeof(double));
+    engine->x = malloc(n * sizeof(double));
+    engine->y = malloc(n * sizeof(double));
+    engine->incidence_head = malloc(n * sizeof(npy_int64));
+    engine->incidence_tail = malloc(n * sizeof(npy_int64));
+    if (engine->radial == NULL || engine->angular == NULL || engine->x == NULL || engine->y == NULL
+        || engine->incidence_head == NULL || engine->incidence_tail == NULL) {
+        return ENGINE_NO_MEMORY;
+    }
+    for (npy_int64 v = 0; v < n; v++) {
+        engine->radial[v] = INFINITY;
+        engine->angular[v] = -1.0;
+        engine->x[v] = INFINITY;
+        engine->y[v] = INFINITY;
+        engine->incidence_head[v] = -1;
+        engine->incidence_tail[v] = -1;
+    }
+    engine->max_edge_faces = 1;
+    for (npy_int64 e = 0; e < n_edges; e++) {
+        npy_int64 n_faces = mesh->edge_faces_offsets[e + 1] - mesh->edge_faces_offsets[e];
+        if (n_faces > engine->max_edge_faces) {
+            engine->max_edge_faces = n_faces;
+        }
+    }
+    engine->k_vertices = malloc(engine->max_edge_faces * sizeof(npy_int64));
+    if (engine->k_vertices == NULL) {
+        return ENGINE_NO_MEMORY;
+    }
+    if (hash_map_init(&engine->edge_ids, 256) < 0 || hash_map_init(&engine->edge_face_lists, 256) < 0) {
+        return ENGINE_NO_MEMORY;
+    }
+    return ENGINE_OK;
+}
+
+static void engine_reset(GPCEngine *engine)
+{
+    for (npy_int64 idx = 0; idx < engine->touched.size; idx++) {
+        npy_int64 v = engine->touched.data[idx];
+        engine->radial[v] = INFINITY;
+        engine->angular[v] = -1.0;
+        engine->x[v] = INFINITY;
+        engine->y[v] = INFINITY;
+        engine->incidence_head[v] = -1;
+        engine->incidence_tail[v] = -1;
+    }
+    engine->touched.size = 0;
+    engine->edges.size = 0;
+    engine->incidence_edge.size = 0;
+    engine->incidence_next.size = 0;
+    engine->faces.size = 0;
+    engine->list_head.size = 0;
+    engine->list_tail.size = 0;
+    engine->list_face.size = 0;
+    engine->list_next.size = 0;
+    hash_map_clear(&engine->edge_ids);
+    hash_map_clear(&engine->edge_face_lists);
+}
+
+static void engine_free(GPCEngine *engine)
+{
+    free(engine->radial);
+    free(engine->angular);
+    free(engine->x);
+    free(engine->y);
+    free(engine->incidence_head);
+    free(engine->incidence_tail);
+    free(engine->k_vertices);
+    free(engine->touched.data);
+    free(engine->edges.data);
+    free(engine->incidence_edge.data);
+    free(engine->incidence_next.data);
+    free(engine->faces.data);
+    free(engine->list_head.data);
+    free(engine->list_tail.data);
+    free(engine->list_face.data);
+    free(engine->list_next.data);
+    hash_map_free(&engine->edge_ids);
+    hash_map_free(&engine->edge_face_lists);
+}
+
+static int engine_set_coordinates(GPCEngine *engine, npy_int64 vertex, double rho, double theta)
+{
+    if (isinf(engine->radial[vertex]) && engine->x[vertex] == INFINITY) {
+        if (int_array_push(&engine->touched, vertex) < 0) {
+            return ENGINE_NO_MEMORY;
+        }
+    }
+    engine->radial[vertex] = rho;
+    engine->angular[vertex] = theta;
+    engine->x[vertex] = rho * cos(theta);
+    engine->y[vertex] = rho * sin(theta);
+    return ENGINE_OK;
+}
+
+static npy_int64 edge_key(const GPCEngine *engine, npy_int64 a, npy_int64 b)
+{
+    return a < b ? a * engine->mesh->n_vertices + b : b * engine->mesh->n_vertices + a;
+}
+
+// Returns the range of the faces of the mesh edge (a, b) within `mesh->edge_faces`
+static void mesh_faces_of_edge(const Mesh *mesh, npy_int64 a, npy_int64 b, npy_int64 *start, npy_int64 *end)
+{
+    *start = 0;
+    *end = 0;
+    for (npy_int64 idx = mesh->adjacency_offsets[a]; idx < mesh->adjacency_offsets[a + 1]; idx++) {
+        if (mesh->adjacency_indices[idx] == b) {
+            npy_int64 edge_id = mesh->adjacency_edge_ids[idx];
+            *start = mesh->edge_faces_offsets[edge_id];
+            *end = mesh->edge_faces_offsets[edge_id + 1];
+            return;
+        }
+    }
+}
+
+static void sort_three(npy_int64 *a, npy_int64 *b, npy_int64 *c)
+{
+    npy_int64 tmp;
+    if (*a > *b) { tmp = *a; *a = *b; *b = tmp; }
+    if (*b > *c) { tmp = *b; *b = *c; *c = tmp; }
+    if (*a > *b) { tmp = *a; *a = *b; *b = tmp; }
+}
+
+static int edge_cache_contains(const GPCEngine *engine, npy_int64 a, npy_int64 b)
+{
+    return hash_map_get(&engine->edge_ids, edge_key(engine, a, b)) != -1;
+}
+
+static int incidence_push(GPCEngine *engine, npy_int64 vertex, npy_int64 edge_id)
+{
+    npy_int64 node = engine->incidence_edge.size;
+    if (int_array_push(&engine->incidence_edge, edge_id) < 0 || int_array_push(&engine->incidence_next, -1) < 0) {
+        return ENGINE_NO_MEMORY;
+    }
+    if (engine->incidence_head[vertex] == -1) {
+        engine->incidence_head[vertex] = node;
+    } else {
+        engine->incidence_next.data[engine->incidence_tail[vertex]] = node;
+    }
+    engine->incidence_tail[vertex] = node;
+    return ENGINE_OK;
+}
+
+static int edge_cache_add(GPCEngine *engine, npy_int64 a, npy_int64 b)
+{
+    if (isinf(engine->x[a]) || isinf(engine->x[b])) {
+        return ENGINE_MISSING_GPC;
+    }
+    if (a > b) {
+        npy_int64 tmp = a;
+        a = b;
+        b = tmp;
+    }
+    npy_int64 key = edge_key(engine, a, b);
+    if (hash_map_get(&engine->edge_ids, key) != -1) {
+        return ENGINE_OK;
+    }
+    npy_int64 edge_id = engine->edges.size / 2;
+    if (int_array_push(&engine->edges, a) < 0 || int_array_push(&engine->edges, b) < 0
+        || hash_map_put(&engine->edge_ids, key, edge_id) < 0) {
+        return ENGINE_NO_MEMORY;
+    }
+    if (incidence_push(engine, a, edge_id) < 0 || incidence_push(engine, b, edge_id) < 0) {
+        return ENGINE_NO_MEMORY;
+    }
+    return ENGINE_OK;
+}
+
+// Expects a sorted face
+static int face_cache_contains(const GPCEngine *engine, npy_int64 a, npy_int64 b, npy_int64 c)
+{
+    npy_int64 list = hash_map_get(&engine->edge_face_lists, edge_key(engine, a, b));
+    if (list == -1) {
+        return 0;
+    }
+    for (npy_int64 node = engine->list_head.data[list]; node != -1; node = engine->list_next.data[node]) {
+        const npy_int64 *face = engine->faces.data + 3 * engine->list_face.data[node];
+        if (face[0] == a && face[1] == b && face[2] == c) {
+            return 1;
+        }
+    }
+    return 0;
+}
+
+static int face_list_push(GPCEngine *engine, npy_int64 a, npy_int64 b, npy_int64 face_id)
+{
+    npy_int64 key = edge_key(engine, a, b);
+    npy_int64 list = hash_map_get(&engine->edge_face_lists, key);
+    npy_int64 node = engine->list_face.size;
+    if (int_array_push(&engine->list_face, face_id) < 0 || int_array_push(&engine->list_next, -1) < 0) {
+        return ENGINE_NO_MEMORY;
+    }
+    if (list == -1) {
+        list = engine->list_head.size;
+        if (int_array_push(&engine->list_head, node) < 0 || int_array_push(&engine->list_tail, node) < 0
+            || hash_map_put(&engine->edge_face_lists, key, list) < 0) {
+            return ENGINE_NO_MEMORY;
+        }
+    } else {
+        engine->list_next.data[engine->list_tail.data[list]] = node;
+        engine->list_tail.data[list] = node;
+    }
+    return ENGINE_OK;
+}
+
+// Expects a sorted face. Returns 1 if the face has been added, 0 if it was already known and < 0 on error.
+static int face_cache_add(GPCEngine *engine, npy_int64 a, npy_int64 b, npy_int64 c)
+{
+    if (face_cache_contains(engine, a, b, c)) {
+        return 0;
+    }
+    npy_int64 face_id = engine->faces.size / 3;
+    if (int_array_push(&engine->faces, a) < 0 || int_array_push(&engine->faces, b) < 0
+        || int_array_push(&engine->faces, c) < 0) {
+        return ENGINE_NO_MEMORY;
+    }
+    if (face_list_push(engine, a, b, face_id) < 0 || face_list_push(engine, b, c, face_id) < 0
+        || face_list_push(engine, a, c, face_id) < 0) {
+        return ENGINE_NO_MEMORY;
+    }
+    return 1;
+}
+
+static int line_segment_intersection(const GPCEngine *engine, double x1, double y1, double x2, double y2)
+{
+    const double eps = 1e-5;
+    for (npy_int64 edge_id = 0; edge_id < engine->edges.size / 2; edge_id++) {
+        npy_int64 v3 = engine->edges.data[2 * edge_id];
+        npy_int64 v4 = engine->edges.data[2 * edge_id + 1];
+        double x3 = engine->x[v3], y3 = engine->y[v3], x4 = engine->x[v4], y4 = engine->y[v4];
+
+        double denominator = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4);
+        if (denominator == 0.) {
+            denominator = DBL_MIN;
+        }
+        double nominator_1 = (x1 - x3) * (y3 - y4) - (y1 - y3) * (x3 - x4);
+        double nominator_2 = (x1 - x3) * (y1 - y2) - (y1 - y3) * (x1 - x2);
+        double t = nominator_1 / denominator;
+        double u = nominator_2 / denominator;
+        if (0. + eps < t && t < 1. - eps && 0. + eps < u && u < 1. - eps) {
+            return 1;
+        }
+    }
+    return 0;
+}
+
+static int engine_add_face(GPCEngine *engine, npy_int64 a, npy_int64 b, npy_int64 c);
+
+// Returns 1 if the update succeeded, 0 if it caused an intersection and < 0 on error (see `GPCSystem.update`)
+static int engine_update(GPCEngine *engine,
+                         npy_int64 vertex_i,
+                         double rho_i,
+                         double theta_i,
+                         npy_int64 vertex_j,
+                         const npy_int64 *k_vertices,
+                         npy_int64 n_k_vertices,
+                         int update)
+{
+    // Only consider third vertices which are already part of the GPC-system
+    npy_int64 valid_k_vertices[n_k_vertices > 0 ? n_k_vertices : 1];
+    npy_int64 n_valid = 0;
+    for (npy_int64 idx = 0; idx < n_k_vertices; idx++) {
+        if (!isinf(engine->radial[k_vertices[idx]])) {
+            valid_k_vertices[n_valid++] = k_vertices[idx];
+        }
+    }
+
+    for (npy_int64 k_idx = 0; k_idx < n_valid; k_idx++) {
+        npy_int64 f0 = vertex_i, f1 = vertex_j, f2 = valid_k_vertices[k_idx];
+        sort_three(&f0, &f1, &f2);
+        npy_int64 face_edges[3][2] = {{f0, f1}, {f1, f2}, {f0, f2}};
+
+        // Collect all edges of `vertex_i` that will be added or are captured by the current GPC-system
+        IntArray edges_of_interest = {NULL, 0, 0};
+        for (npy_int64 node = engine->incidence_head[vertex_i]; node != -1; node = engine->incidence_next.data[node]) {
+            npy_int64 edge_id = engine->incidence_edge.data[node];
+            if (int_array_push(&edges_of_interest, engine->edges.data[2 * edge_id]) < 0
+                || int_array_push(&edges_of_interest, engine->edges.data[2 * edge_id + 1]) < 0) {
+                free(edges_of_interest.data);
+                return ENGINE_NO_MEMORY;
+            }
+        }
+        for (int e = 0; e < 3; e++) {
+            int incident = face_edges[e][0] == vertex_i || face_edges[e][1] == vertex_i;
+            if (!(incident && edge_cache_contains(engine, face_edges[e][0], face_edges[e][1]))) {
+                if (int_array_push(&edges_of_interest, face_edges[e][0]) < 0
+                    || int_array_push(&edges_of_interest, face_edges[e][1]) < 0) {
+                    free(edges_of_interest.data);
+                    return ENGINE_NO_MEMORY;
+                }
+            }
+        }
+
+        // Check collected edges for intersections
+        double x = rho_i * cos(theta_i);
+        double y = rho_i * sin(theta_i);
+        for (npy_int64 e = 0; e < edges_of_interest.size / 2; e++) {
+            npy_int64 v0 = edges_of_interest.data[2 * e], v1 = edges_of_interest.data[2 * e + 1];
+            double x1 = v0 == vertex_i ? x : engine->x[v0];
+            double y1 = v0 == vertex_i ? y : engine->y[v0];
+            double x2 = v1 == vertex_i ? x : engine->x[v1];
+            double y2 = v1 == vertex_i ? y : engine->y[v1];
+            if (line_segment_intersection(engine, x1, y1, x2, y2)) {
+                free(edges_of_interest.data);
+                return 0;
+            }
+        }
+
+        // Update GPC of `vertex_i`
+        if (update) {
+            if (engine_set_coordinates(engine, vertex_i, rho_i, theta_i) < 0) {
+                free(edges_of_interest.data);
+                return ENGINE_NO_MEMORY;
+            }
+        }
+
+        // Add new edges
+        for (npy_int64 e = 0; e < edges_of_interest.size / 2; e++) {
+            int status = edge_cache_add(engine, edges_of_interest.data[2 * e], edges_of_interest.data[2 * e + 1]);
+            if (status < 0) {
+                free(edges_of_interest.data);
+                return status;
+            }
+        }
+        free(edges_of_interest.data);
+
+        // Add new face
+        int status = engine_add_face(engine, f0, f1, f2);
+        if (status < 0) {
+            return status;
+        }
+    }
+    return 1;
+}
+
+// Adds a sorted face and checks whether neighboring faces are entirely describable with GPCs (see `GPCSystem.add_face`)
+static int engine_add_face(GPCEngine *engine, npy_int64 a, npy_int64 b, npy_int64 c)
+{
+    const Mesh *mesh = engine->mesh;
+    int status = face_cache_add(engine, a, b, c);
+    if (status < 0) {
+        return status;
+    }
+    npy_int64 face_edges[3][2] = {{a, b}, {b, c}, {a, c}};
+    for (int e = 0; e < 3; e++) {
+        npy_int64 start, end;
+        mesh_faces_of_edge(mesh, face_edges[e][0], face_edges[e][1], &start, &end);
+        for (npy_int64 idx = start; idx < end; idx++) {
+            const npy_int64 *mesh_face = mesh->faces + 3 * mesh->edge_faces[idx];
+            npy_int64 n0 = mesh_face[0], n1 = mesh_face[1], n2 = mesh_face[2];
+            sort_three(&n0, &n1, &n2);
+            if ((n0 != a || n1 != b || n2 != c)
+                && !isinf(engine->radial[n0]) && !isinf(engine->radial[n1]) && !isinf(engine->radial[n2])
+                && !face_cache_contains(engine, n0, n1, n2)) {
+                status = engine_update(engine, n0, engine->radial[n0], engine->angular[n0], n1, &n2, 1, 0);
+                if (status < 0) {
+                    return status;
+                }
+            }
+        }
+    }
+    return ENGINE_OK;
+}
+
+// See `compute_distance_and_angle` in `gpc_system_utils.py`. Writes the third vertices into `engine->k_vertices`.
+static void engine_distance_and_angle(GPCEngine *engine,
+                                      npy_int64 vertex_i,
+                                      npy_int64 vertex_j,
+                                      double *u_ijk,
+                                      double *theta_i,
+                                      npy_int64 *n_k_vertices)
+{
+    const Mesh *mesh = engine->mesh;
+    npy_int64 faces[engine->max_edge_faces][3];
+    npy_int64 n_faces = 0;
+
+    // Use face-cache if possible. Otherwise, use the faces of the mesh.
+    npy_int64 list = hash_map_get(&engine->edge_face_lists, edge_key(engine, vertex_i, vertex_j));
+    if (list != -1) {
+        for (npy_int64 node = engine->list_head.data[list];
+             node != -1 && n_faces < engine->max_edge_faces;
+             node = engine->list_next.data[node]) {
+            const npy_int64 *face = engine->faces.data + 3 * engine->list_face.data[node];
+            faces[n_faces][0] = face[0];
+            faces[n_faces][1] = face[1];
+            faces[n_faces][2] = face[2];
+            n_faces++;
+        }
+    } else {
+        npy_int64 start, end;
+        mesh_faces_of_edge(mesh, vertex_i < vertex_j ? vertex_i : vertex_j, vertex_i < vertex_j ? vertex_j : vertex_i, &start, &end);
+        for (npy_int64 idx = start; idx < end; idx++) {
+            const npy_int64 *face = mesh->faces + 3 * mesh->edge_faces[idx];
+            faces[n_faces][0] = face[0];
+            faces[n_faces][1] = face[1];
+            faces[n_faces][2] = face[2];
+            n_faces++;
+        }
+    }
+
+    int found = 0;
+    double best_u = INFINITY, best_theta = -1.0;
+    npy_int64 best_k = -1;
+    *n_k_vertices = 0;
+    for (npy_int64 f = 0; f < n_faces; f++) {
+        npy_int64 vertex_k = -1;
+        for (int idx = 0; idx < 3; idx++) {
+            if (faces[f][idx] != vertex_i && faces[f][idx] != vertex_j) {
+                vertex_k = faces[f][idx];
+                break;
+            }
+        }
+        engine->k_vertices[(*n_k_vertices)++] = vertex_k;
+        if (engine->radial[vertex_k] < INFINITY && engine->angular[vertex_k] >= 0.) {
+            double vertex_i_coordinates[3], vertex_j_coordinates[3], vertex_k_coordinates[3], result[2];
+            for (int d = 0; d < 3; d++) {
+                vertex_i_coordinates[d] = mesh->vertices[3 * vertex_i + d];
+                vertex_j_coordinates[d] = mesh->vertices[3 * vertex_j + d];
+                vertex_k_coordinates[d] = mesh->vertices[3 * vertex_k + d];
+            }
+            compute_dist_and_dir(
+                vertex_i_coordinates,
+                vertex_j_coordinates,
+                vertex_k_coordinates,
+                engine->radial[vertex_j],
+                engine->radial[vertex_k],
+                engine->angular[vertex_j],
+                engine->angular[vertex_k],
+                engine->rotation_axis,
+                result
+            );
+            // Return the smallest update (compared like Python tuples)
+            if (!found
+                || result[0] < best_u
+                || (result[0] == best_u && (result[1] < best_theta || (result[1] == best_theta && vertex_k < best_k)))) {
+                best_u = result[0];
+                best_theta = result[1];
+                best_k = vertex_k;
+                found = 1;
+            }
+        }
+    }
+    if (!found) {
+        *n_k_vertices = 0;
+    }
+    *u_ijk = best_u;
+    *theta_i = best_theta;
+}
+
+// Computes one GPC-system (see `GPCSystemGroup.compute_gpc_system`). Writes the largest initialization distance into
+// `max_init_dist`. The engine has to be reset before it can compute the next GPC-system.
+static int engine_compute(GPCEngine *engine, npy_int64 source_point, double u_max, double eps, double *max_init_dist)
+{
+    const Mesh *mesh = engine->mesh;
+    engine->source_point = source_point;
+    for (int d = 0; d < 3; d++) {
+        engine->rotation_axis[d] = mesh->vertex_normals[3 * source_point + d];
+    }
+
+    npy_int64 neighbors_start = mesh->adjacency_offsets[source_point];
+    npy_int64 neighbors_end = mesh->adjacency_offsets[source_point + 1];
+    const double *source_coordinates = mesh->vertices + 3 * source_point;
+
+    // Calculate initial radial and angular coordinates
+    *max_init_dist = 0.;
+    const double *ref_coordinates = mesh->vertices + 3 * mesh->adjacency_indices[neighbors_start];
+    for (npy_int64 idx = neighbors_start; idx < neighbors_end; idx++) {
+        npy_int64 neighbor = mesh->adjacency_indices[idx];
+        const double *neighbor_coordinates = mesh->vertices + 3 * neighbor;
+        double vector_a[3], vector_b[3];
+        for (int d = 0; d < 3; d++) {
+            vector_a[d] = ref_coordinates[d] - source_coordinates[d];
+            vector_b[d] = neighbor_coordinates[d] - source_coordinates[d];
+        }
+        double rho = sqrt(vector_b[0] * vector_b[0] + vector_b[1] * vector_b[1] + vector_b[2] * vector_b[2]);
+        double theta = compute_angle_360(vector_a, vector_b, engine->rotation_axis);
+        if (engine_set_coordinates(engine, neighbor, rho, theta) < 0) {
+            return ENGINE_NO_MEMORY;
+        }
+        *max_init_dist = rho > *max_init_dist ? rho : *max_init_dist;
+    }
+    if (engine_set_coordinates(engine, source_point, 0., 0.) < 0) {
+        return ENGINE_NO_MEMORY;
+    }
+    engine->x[source_point] = 0.;
+    engine->y[source_point] = 0.;
+
+    // Initialize face- and edge-cache with one-hop-neighborhood edges from source-point
+    for (npy_int64 idx = neighbors_start; idx < neighbors_end; idx++) {
+        npy_int64 neighbor = mesh->adjacency_indices[idx];
+        int status = edge_cache_add(engine, source_point, neighbor);
+        if (status < 0) {
+            return status;
+        }
+        npy_int64 start, end;
+        mesh_faces_of_edge(
+            mesh, source_point < neighbor ? source_point : neighbor, source_point < neighbor ? neighbor : source_point, &start, &end
+        );
+        for (npy_int64 f = start; f < end; f++) {
+            const npy_int64 *mesh_face = mesh->faces + 3 * mesh->edge_faces[f];
+            npy_int64 a = mesh_face[0], b = mesh_face[1], c = mesh_face[2];
+            sort_three(&a, &b, &c);
+            status = engine_add_face(engine, a, b, c);
+            if (status < 0) {
+                return status;
+            }
+        }
+    }
+
+    // Initialize min-heap over radial distances
+    MinHeap candidates = {NULL, NULL, 0, 0};
+    for (npy_int64 idx = neighbors_start; idx < neighbors_end; idx++) {
+        npy_int64 neighbor = mesh->adjacency_indices[idx];
+        if (heap_push(&candidates, engine->radial[neighbor], neighbor) < 0) {
+            free(candidates.dists);
+            free(candidates.vertices);
+            return ENGINE_NO_MEMORY;
+        }
+    }
+
+    // Algorithm to compute GPC-systems
+    int status = ENGINE_OK;
+    while (candidates.size > 0 && status == ENGINE_OK) {
+        double j_dist;
+        npy_int64 j;
+        heap_pop(&candidates, &j_dist, &j);
+        for (npy_int64 idx = mesh->adjacency_offsets[j]; idx < mesh->adjacency_offsets[j + 1]; idx++) {
+            npy_int64 i = mesh->adjacency_indices[idx];
+            if (i == source_point) {
+                continue;
+            }
+            double new_u_i, new_theta_i;
+            npy_int64 n_k_vertices;
+            engine_distance_and_angle(engine, i, j, &new_u_i, &new_theta_i, &n_k_vertices);
+            if (new_u_i < u_max && engine->radial[i] / new_u_i > 1 + eps) {
+                int updated = engine_update(engine, i, new_u_i, new_theta_i, j, engine->k_vertices, n_k_vertices, 1);
+                if (updated < 0) {
+                    status = updated;
+                    break;
+                }
+                if (updated && heap_push(&candidates, new_u_i, i) < 0) {
+                    status = ENGINE_NO_MEMORY;
+                    break;
+                }
+            }
+        }
+    }
+    free(candidates.dists);
+    free(candidates.vertices);
+    return status;
+}
+
 static PyObject *compute_dist_and_dir_wrapper(PyObject *self, PyObject *args) {
 
     // Parse numpy array
@@ -262,10 +1066,660 @@ static PyObject *compute_angle_360_wrapper(PyObject *self, PyObject *args) {
     return PyFloat_FromDouble(angle);
 }
 
+static PyArrayObject *as_array(PyObject *object, int type, int ndim, const char *name)
+{
+    PyArrayObject *array = (PyArrayObject *)PyArray_FROM_OTF(object, type, NPY_ARRAY_IN_ARRAY);
+    if (array == NULL) {
+        return NULL;
+    }
+    if (PyArray_NDIM(array) != ndim) {
+        PyErr_Format(PyExc_ValueError, "Array '%s' must be %d-dimensional!", name, ndim);
+        Py_DECREF(array);
+        return NULL;
+    }
+    return array;
+}
+
+static PyObject *int_array_to_numpy(const IntArray *array, npy_intp columns)
+{
+    npy_intp dims[2] = {array->size / columns, columns};
+    PyObject *result = PyArray_SimpleNew(columns == 1 ? 1 : 2, dims, NPY_INT64);
+    if (result != NULL && array->size > 0) {
+        memcpy(PyArray_DATA((PyArrayObject *)result), array->data, array->size * sizeof(npy_int64));
+    }
+    return result;
+}
+
+// Result of one GPC-system, which is computed without holding the GIL and converted into Python objects afterwards
+typedef struct {
+    IntArray vertex_ids;
+    double *radial;
+    double *angular;
+    IntArray edges;
+    IntArray faces;
+    IntArray face_ids;
+    double max_init_dist;
+    int status;
+    int overflow;
+} GPCResult;
+
+static int int_array_copy(IntArray *target, const IntArray *source)
+{
+    target->data = malloc((source->size > 0 ? source->size : 1) * sizeof(npy_int64));
+    if (target->data == NULL) {
+        return -1;
+    }
+    memcpy(target->data, source->data, source->size * sizeof(npy_int64));
+    target->size = source->size;
+    target->capacity = source->size;
+    return 0;
+}
+
+static int engine_store(const GPCEngine *engine, GPCResult *result)
+{
+    npy_int64 n_touched = engine->touched.size;
+    result->radial = malloc((n_touched > 0 ? n_touched : 1) * sizeof(double));
+    result->angular = malloc((n_touched > 0 ? n_touched : 1) * sizeof(double));
+    if (result->radial == NULL || result->angular == NULL || int_array_copy(&result->vertex_ids, &engine->touched) < 0
+        || int_array_copy(&result->edges, &engine->edges) < 0 || int_array_copy(&result->faces, &engine->faces) < 0) {
+        return ENGINE_NO_MEMORY;
+    }
+    for (npy_int64 idx = 0; idx < n_touched; idx++) {
+        npy_int64 vertex = engine->touched.data[idx];
+        result->radial[idx] = engine->radial[vertex];
+        result->angular[idx] = engine->angular[vertex];
+    }
+    return ENGINE_OK;
+}
+
+static void gpc_result_free(GPCResult *result)
+{
+    free(result->vertex_ids.data);
+    free(result->radial);
+    free(result->angular);
+    free(result->edges.data);
+    free(result->faces.data);
+    free(result->face_ids.data);
+}
+
+static PyObject *gpc_result_to_python(const GPCResult *result)
+{
+    npy_intp n_touched = result->vertex_ids.size;
+    PyObject *vertex_ids = int_array_to_numpy(&result->vertex_ids, 1);
+    PyObject *radial = PyArray_SimpleNew(1, &n_touched, NPY_DOUBLE);
+    PyObject *angular = PyArray_SimpleNew(1, &n_touched, NPY_DOUBLE);
+    PyObject *edges = int_array_to_numpy(&result->edges, 2);
+    PyObject *faces = int_array_to_numpy(&result->faces, 3);
+    if (vertex_ids == NULL || radial == NULL || angular == NULL || edges == NULL || faces == NULL) {
+        Py_XDECREF(vertex_ids);
+        Py_XDECREF(radial);
+        Py_XDECREF(angular);
+        Py_XDECREF(edges);
+        Py_XDECREF(faces);
+        return NULL;
+    }
+    if (n_touched > 0) {
+        memcpy(PyArray_DATA((PyArrayObject *)radial), result->radial, n_touched * sizeof(double));
+        memcpy(PyArray_DATA((PyArrayObject *)angular), result->angular, n_touched * sizeof(double));
+    }
+    return Py_BuildValue("(NNNNNd)", vertex_ids, radial, angular, edges, faces, result->max_init_dist);
+}
+
+// Returns the mesh index of a sorted face of the face-cache. Duplicate faces resolve to the smallest index (see
+// `MeshTopology.get_face_ids`).
+static npy_int64 mesh_face_id(const Mesh *mesh, const npy_int64 *face)
+{
+    npy_int64 start, end, face_id = -1;
+    mesh_faces_of_edge(mesh, face[0], face[1], &start, &end);
+    for (npy_int64 idx = start; idx < end; idx++) {
+        const npy_int64 *mesh_face = mesh->faces + 3 * mesh->edge_faces[idx];
+        npy_int64 a = mesh_face[0], b = mesh_face[1], c = mesh_face[2];
+        sort_three(&a, &b, &c);
+        if (a == face[0] && b == face[1] && c == face[2] && (face_id == -1 || mesh->edge_faces[idx] < face_id)) {
+            face_id = mesh->edge_faces[idx];
+        }
+    }
+    return face_id;
+}
+
+static int engine_store_face_ids(const GPCEngine *engine, GPCResult *result)
+{
+    npy_int64 n_faces = engine->faces.size / 3;
+    result->face_ids.data = malloc((n_faces > 0 ? n_faces : 1) * sizeof(npy_int64));
+    if (result->face_ids.data == NULL) {
+        return ENGINE_NO_MEMORY;
+    }
+    for (npy_int64 f = 0; f < n_faces; f++) {
+        result->face_ids.data[f] = mesh_face_id(engine->mesh, engine->faces.data + 3 * f);
+    }
+    result->face_ids.size = n_faces;
+    result->face_ids.capacity = n_faces;
+    return ENGINE_OK;
+}
+
+// The arrays of a `GPCSystemBuffer`, which contain one row per source point
+typedef struct {
+    npy_int32 *vertex_ids;
+    void *coordinates;
+    int coordinates_type;
+    npy_int32 *face_ids;
+    npy_int32 *n_local_vertices;
+    npy_int32 *n_faces;
+    npy_intp max_vertices;
+    npy_intp max_faces;
+} Buffer;
+
+// Writes the GPC-system of the engine into the row of its source point (see `GPCSystemBuffer.write`). Returns 0 if
+// it does not fit into the row.
+static int engine_write(const GPCEngine *engine, const Buffer *buffer)
+{
+    npy_int64 row = engine->source_point;
+    npy_int64 n_touched = engine->touched.size;
+    npy_int64 n_faces = engine->faces.size / 3;
+    if (n_touched > buffer->max_vertices || n_faces > buffer->max_faces) {
+        buffer->n_local_vertices[row] = -1;
+        return 0;
+    }
+    npy_int32 *vertex_ids = buffer->vertex_ids + row * buffer->max_vertices;
+    for (npy_int64 idx = 0; idx < n_touched; idx++) {
+        npy_int64 vertex = engine->touched.data[idx];
+        vertex_ids[idx] = (npy_int32)vertex;
+        if (buffer->coordinates_type == NPY_FLOAT) {
+            float *coordinates = (float *)buffer->coordinates + 2 * (row * buffer->max_vertices + idx);
+            coordinates[0] = (float)engine->radial[vertex];
+            coordinates[1] = (float)engine->angular[vertex];
+        } else {
+            double *coordinates = (double *)buffer->coordinates + 2 * (row * buffer->max_vertices + idx);
+            coordinates[0] = engine->radial[vertex];
+            coordinates[1] = engine->angular[vertex];
+        }
+    }
+    npy_int32 *face_ids = buffer->face_ids + row * buffer->max_faces;
+    for (npy_int64 f = 0; f < n_faces; f++) {
+        face_ids[f] = (npy_int32)mesh_face_id(engine->mesh, engine->faces.data + 3 * f);
+    }
+    buffer->n_local_vertices[row] = (npy_int32)n_touched;
+    buffer->n_faces[row] = (npy_int32)n_faces;
+    return 1;
+}
+
+static PyObject *gpc_overflow_to_python(npy_int64 source_point, const GPCResult *result)
+{
+    npy_intp n_touched = result->vertex_ids.size;
+    PyObject *vertex_ids = int_array_to_numpy(&result->vertex_ids, 1);
+    PyObject *radial = PyArray_SimpleNew(1, &n_touched, NPY_DOUBLE);
+    PyObject *angular = PyArray_SimpleNew(1, &n_touched, NPY_DOUBLE);
+    PyObject *face_ids = int_array_to_numpy(&result->face_ids, 1);
+    if (vertex_ids == NULL || radial == NULL || angular == NULL || face_ids == NULL) {
+        Py_XDECREF(vertex_ids);
+        Py_XDECREF(radial);
+        Py_XDECREF(angular);
+        Py_XDECREF(face_ids);
+        return NULL;
+    }
+    if (n_touched > 0) {
+        memcpy(PyArray_DATA((PyArrayObject *)radial), result->radial, n_touched * sizeof(double));
+        memcpy(PyArray_DATA((PyArrayObject *)angular), result->angular, n_touched * sizeof(double));
+    }
+    return Py_BuildValue("(LNNNN)", (long long)source_point, vertex_ids, radial, angular, face_ids);
+}
+
+static PyObject *compute_dist_and_dir_batch_wrapper(PyObject *self, PyObject *args) {
+    PyObject *array_objects[4];
+
+    if(!PyArg_ParseTuple(args, "OOOO", &array_objects[0], &array_objects[1], &array_objects[2], &array_objects[3])) {
+        return NULL;
+    }
+
+    // Translate inputs into contiguous arrays of the expected types
+    const char *names[] = {"vertices", "triangles", "u", "theta"};
+    const int types[] = {NPY_DOUBLE, NPY_INT64, NPY_DOUBLE, NPY_DOUBLE};
+    PyArrayObject *arrays[4] = {NULL};
+    PyObject *result = NULL;
+    for (int i = 0; i < 4; i++) {
+        arrays[i] = as_array(array_objects[i], types[i], 2, names[i]);
+        if (arrays[i] == NULL) {
+            goto cleanup;
+        }
+    }
+    npy_intp n_vertices = PyArray_DIM(arrays[0], 0);
+    npy_intp n_triangles = PyArray_DIM(arrays[1], 0);
+    if (PyArray_DIM(arrays[0], 1) != 3 || PyArray_DIM(arrays[1], 1) != 3
+        || PyArray_DIM(arrays[2], 0) != n_triangles || PyArray_DIM(arrays[2], 1) != 2
+        || PyArray_DIM(arrays[3], 0) != n_triangles || PyArray_DIM(arrays[3], 1) != 2) {
+        PyErr_SetString(
+            PyExc_ValueError, "Expected vertices (n, 3), triangles (m, 3), u (m, 2) and theta (m, 2)!"
+        );
+        goto cleanup;
+    }
+    const double *vertices = PyArray_DATA(arrays[0]);
+    const npy_int64 *triangles = PyArray_DATA(arrays[1]);
+    const double *u = PyArray_DATA(arrays[2]);
+    const double *theta = PyArray_DATA(arrays[3]);
+    for (npy_intp idx = 0; idx < 3 * n_triangles; idx++) {
+        if (triangles[idx] < 0 || triangles[idx] >= n_vertices) {
+            PyErr_Format(PyExc_IndexError, "Vertex %lld is out of bounds!", (long long)triangles[idx]);
+            goto cleanup;
+        }
+    }
+
+    npy_intp dims[2] = {n_triangles, 2};
+    result = PyArray_SimpleNew(2, dims, NPY_DOUBLE);
+    if (result == NULL) {
+        goto cleanup;
+    }
+    double *results = PyArray_DATA((PyArrayObject *)result);
+
+    Py_BEGIN_ALLOW_THREADS
+    for (npy_intp idx = 0; idx < n_triangles; idx++) {
+        // `compute_dist_and_dir` modifies the vertices, hence, work on copies
+        double vertex_i[3], vertex_j[3], vertex_k[3], rotation_axis[3] = {0., 0., 0.};
+        memcpy(vertex_i, vertices + 3 * triangles[3 * idx], 3 * sizeof(double));
+        memcpy(vertex_j, vertices + 3 * triangles[3 * idx + 1], 3 * sizeof(double));
+        memcpy(vertex_k, vertices + 3 * triangles[3 * idx + 2], 3 * sizeof(double));
+        compute_dist_and_dir(
+            vertex_i,
+            vertex_j,
+            vertex_k,
+            u[2 * idx],
+            u[2 * idx + 1],
+            theta[2 * idx],
+            theta[2 * idx + 1],
+            rotation_axis,
+            results + 2 * idx
+        );
+    }
+    Py_END_ALLOW_THREADS
+
+cleanup:
+    for (int i = 0; i < 4; i++) {
+        Py_XDECREF(arrays[i]);
+    }
+    return result;
+}
+
+static PyObject *compute_angle_360_batch_wrapper(PyObject *self, PyObject *args) {
+    PyObject *array_objects[3];
+
+    if(!PyArg_ParseTuple(args, "OOO", &array_objects[0], &array_objects[1], &array_objects[2])) {
+        return NULL;
+    }
+
+    // Translate inputs into contiguous arrays of the expected types
+    const char *names[] = {"vectors_1", "vectors_2", "rotation_axis"};
+    const int ndims[] = {2, 2, 1};
+    PyArrayObject *arrays[3] = {NULL};
+    PyObject *result = NULL;
+    for (int i = 0; i < 3; i++) {
+        arrays[i] = as_array(array_objects[i], NPY_DOUBLE, ndims[i], names[i]);
+        if (arrays[i] == NULL) {
+            goto cleanup;
+        }
+    }
+    npy_intp n_vectors = PyArray_DIM(arrays[0], 0);
+    if (PyArray_DIM(arrays[0], 1) != 3 || PyArray_DIM(arrays[1], 0) != n_vectors || PyArray_DIM(arrays[1], 1) != 3
+        || PyArray_DIM(arrays[2], 0) != 3) {
+        PyErr_SetString(PyExc_ValueError, "Expected vectors_1 (n, 3), vectors_2 (n, 3) and rotation_axis (3,)!");
+        goto cleanup;
+    }
+    double *vectors_1 = PyArray_DATA(arrays[0]);
+    double *vectors_2 = PyArray_DATA(arrays[1]);
+    double *rotation_axis = PyArray_DATA(arrays[2]);
+
+    result = PyArray_SimpleNew(1, &n_vectors, NPY_DOUBLE);
+    if (result == NULL) {
+        goto cleanup;
+    }
+    double *angles = PyArray_DATA((PyArrayObject *)result);
+
+    Py_BEGIN_ALLOW_THREADS
+    for (npy_intp idx = 0; idx < n_vectors; idx++) {
+        angles[idx] = compute_angle_360(vectors_1 + 3 * idx, vectors_2 + 3 * idx, rotation_axis);
+    }
+    Py_END_ALLOW_THREADS
+
+cleanup:
+    for (int i = 0; i < 3; i++) {
+        Py_XDECREF(arrays[i]);
+    }
+    return result;
+}
+
+// Translates the arrays of a `MeshTopology` and the source points into contiguous arrays of the expected types
+static int mesh_from_arrays(PyObject *array_objects[8],
+                            PyObject *source_points_object,
+                            PyArrayObject *arrays[9],
+                            Mesh *mesh,
+                            npy_int64 *n_edges)
+{
+    const char *names[] = {
+        "vertices",
+        "vertex_normals",
+        "faces",
+        "adjacency_offsets",
+        "adjacency_indices",
+        "adjacency_edge_ids",
+        "edge_faces_offsets",
+        "edge_faces",
+        "source_points"
+    };
+    const int types[] = {
+        NPY_DOUBLE, NPY_DOUBLE, NPY_INT64, NPY_INT64, NPY_INT64, NPY_INT64, NPY_INT64, NPY_INT64, NPY_INT64
+    };
+    const int ndims[] = {2, 2, 2, 1, 1, 1, 1, 1, 1};
+    for (int i = 0; i < 9; i++) {
+        arrays[i] = as_array(i < 8 ? array_objects[i] : source_points_object, types[i], ndims[i], names[i]);
+        if (arrays[i] == NULL) {
+            return -1;
+        }
+    }
+
+    mesh->n_vertices = PyArray_DIM(arrays[0], 0);
+    mesh->vertices = PyArray_DATA(arrays[0]);
+    mesh->vertex_normals = PyArray_DATA(arrays[1]);
+    mesh->faces = PyArray_DATA(arrays[2]);
+    mesh->adjacency_offsets = PyArray_DATA(arrays[3]);
+    mesh->adjacency_indices = PyArray_DATA(arrays[4]);
+    mesh->adjacency_edge_ids = PyArray_DATA(arrays[5]);
+    mesh->edge_faces_offsets = PyArray_DATA(arrays[6]);
+    mesh->edge_faces = PyArray_DATA(arrays[7]);
+    if (PyArray_DIM(arrays[0], 1) != 3 || PyArray_DIM(arrays[1], 0) != mesh->n_vertices
+        || PyArray_DIM(arrays[2], 1) != 3 || PyArray_DIM(arrays[3], 0) != mesh->n_vertices + 1) {
+        PyErr_SetString(PyExc_ValueError, "Mesh arrays have inconsistent shapes!");
+        return -1;
+    }
+    *n_edges = PyArray_DIM(arrays[6], 0) - 1;
+
+    // Validate all source points while holding the GIL
+    npy_intp n_source_points = PyArray_DIM(arrays[8], 0);
+    const npy_int64 *source_points = PyArray_DATA(arrays[8]);
+    for (npy_intp idx = 0; idx < n_source_points; idx++) {
+        npy_int64 source_point = source_points[idx];
+        if (source_point < 0 || source_point >= mesh->n_vertices) {
+            PyErr_Format(PyExc_IndexError, "Source point %lld is out of bounds!", (long long)source_point);
+            return -1;
+        }
+        if (mesh->adjacency_offsets[source_point] == mesh->adjacency_offsets[source_point + 1]) {
+            PyErr_Format(PyExc_ValueError, "Source point %lld has no neighbors!", (long long)source_point);
+            return -1;
+        }
+    }
+    return 0;
+}
+
+// Raises the error of a failed GPC-system. Returns -1 if the status describes an error and 0 otherwise.
+static int raise_engine_status(int status, npy_int64 source_point)
+{
+    if (status == ENGINE_NO_MEMORY) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    if (status == ENGINE_MISSING_GPC) {
+        PyErr_Format(PyExc_RuntimeError, "GPC-system of source point %lld contains an edge which lacks GPC.", (long long)source_point);
+        return -1;
+    }
+    return 0;
+}
+
+static PyObject *compute_gpc_systems_wrapper(PyObject *self, PyObject *args) {
+    PyObject *source_points_object, *array_objects[8];
+    double u_max, eps;
+    int n_threads = 1;
+
+    if(!PyArg_ParseTuple(args,
+                         "OddOOOOOOOO|i",
+                         &source_points_object,
+                         &u_max,
+                         &eps,
+                         &array_objects[0],
+                         &array_objects[1],
+                         &array_objects[2],
+                         &array_objects[3],
+                         &array_objects[4],
+                         &array_objects[5],
+                         &array_objects[6],
+                         &array_objects[7],
+                         &n_threads)) {
+        return NULL;
+    }
+    if (n_threads < 1) {
+        PyErr_SetString(PyExc_ValueError, "The amount of threads must be positive!");
+        return NULL;
+    }
+
+    PyArrayObject *arrays[9] = {NULL};
+    PyObject *result = NULL;
+    Mesh mesh;
+    npy_int64 n_edges;
+    if (mesh_from_arrays(array_objects, source_points_object, arrays, &mesh, &n_edges) < 0) {
+        goto cleanup;
+    }
+    npy_intp n_source_points = PyArray_DIM(arrays[8], 0);
+    const npy_int64 *source_points = PyArray_DATA(arrays[8]);
+
+    GPCResult *results = calloc(n_source_points > 0 ? n_source_points : 1, sizeof(GPCResult));
+    if (results == NULL) {
+        PyErr_NoMemory();
+        goto cleanup;
+    }
+
+    // Every thread owns one engine, whereas all threads read the same mesh
+    Py_BEGIN_ALLOW_THREADS
+    #pragma omp parallel num_threads(n_threads) if(n_threads > 1)
+    {
+        GPCEngine engine;
+        int init_status = engine_init(&engine, &mesh, n_edges);
+        #pragma omp for schedule(dynamic, 16)
+        for (npy_intp idx = 0; idx < n_source_points; idx++) {
+            if (init_status != ENGINE_OK) {
+                results[idx].status = init_status;
+                continue;
+            }
+            results[idx].status = engine_compute(&engine, source_points[idx], u_max, eps, &results[idx].max_init_dist);
+            if (results[idx].status == ENGINE_OK) {
+                results[idx].status = engine_store(&engine, &results[idx]);
+            }
+            engine_reset(&engine);
+        }
+        engine_free(&engine);
+    }
+    Py_END_ALLOW_THREADS
+
+    result = PyList_New(n_source_points);
+    for (npy_intp idx = 0; result != NULL && idx < n_source_points; idx++) {
+        if (raise_engine_status(results[idx].status, source_points[idx]) < 0) {
+            Py_CLEAR(result);
+            break;
+        }
+        PyObject *gpc_system = gpc_result_to_python(&results[idx]);
+        if (gpc_system == NULL) {
+            Py_CLEAR(result);
+            break;
+        }
+        PyList_SET_ITEM(result, idx, gpc_system);
+    }
+    for (npy_intp idx = 0; idx < n_source_points; idx++) {
+        gpc_result_free(&results[idx]);
+    }
+    free(results);
+
+cleanup:
+    for (int i = 0; i < 9; i++) {
+        Py_XDECREF(arrays[i]);
+    }
+    return result;
+}
+
+// Checks that an array of a `GPCSystemBuffer` can be written in place
+static int check_buffer_array(PyObject *object, int type, int ndim, const char *name)
+{
+    if (!PyArray_Check(object)) {
+        PyErr_Format(PyExc_TypeError, "Buffer array '%s' must be a numpy array!", name);
+        return -1;
+    }
+    PyArrayObject *array = (PyArrayObject *)object;
+    if (PyArray_TYPE(array) != type || PyArray_NDIM(array) != ndim || !PyArray_ISCARRAY(array)) {
+        PyErr_Format(PyExc_ValueError, "Buffer array '%s' must be a writeable, C-contiguous %d-dimensional array of the buffer's type!", name, ndim);
+        return -1;
+    }
+    return 0;
+}
+
+static PyObject *write_gpc_systems_wrapper(PyObject *self, PyObject *args) {
+    PyObject *source_points_object, *array_objects[8], *buffer_objects[5];
+    double u_max, eps;
+    int n_threads = 1;
+
+    if(!PyArg_ParseTuple(args,
+                         "OddOOOOOOOOOOOOO|i",
+                         &source_points_object,
+                         &u_max,
+                         &eps,
+                         &array_objects[0],
+                         &array_objects[1],
+                         &array_objects[2],
+                         &array_objects[3],
+                         &array_objects[4],
+                         &array_objects[5],
+                         &array_objects[6],
+                         &array_objects[7],
+                         &buffer_objects[0],
+                         &buffer_objects[1],
+                         &buffer_objects[2],
+                         &buffer_objects[3],
+                         &buffer_objects[4],
+                         &n_threads)) {
+        return NULL;
+    }
+    if (n_threads < 1) {
+        PyErr_SetString(PyExc_ValueError, "The amount of threads must be positive!");
+        return NULL;
+    }
+
+    PyArrayObject *arrays[9] = {NULL};
+    PyObject *result = NULL, *overflow = NULL, *max_init_dists = NULL;
+    Mesh mesh;
+    npy_int64 n_edges;
+    if (mesh_from_arrays(array_objects, source_points_object, arrays, &mesh, &n_edges) < 0) {
+        goto cleanup;
+    }
+    npy_intp n_source_points = PyArray_DIM(arrays[8], 0);
+    const npy_int64 *source_points = PyArray_DATA(arrays[8]);
+
+    // The rows of the buffer are written in place (see `GPCSystemBuffer`)
+    PyObject *coordinates_object = buffer_objects[1];
+    int coordinates_type = PyArray_Check(coordinates_object) ? PyArray_TYPE((PyArrayObject *)coordinates_object) : NPY_DOUBLE;
+    if (coordinates_type != NPY_FLOAT && coordinates_type != NPY_DOUBLE) {
+        PyErr_SetString(PyExc_ValueError, "Buffer coordinates must be of type float32 or float64!");
+        goto cleanup;
+    }
+    if (check_buffer_array(buffer_objects[0], NPY_INT32, 2, "vertex_ids") < 0
+        || check_buffer_array(buffer_objects[1], coordinates_type, 3, "coordinates") < 0
+        || check_buffer_array(buffer_objects[2], NPY_INT32, 2, "face_ids") < 0
+        || check_buffer_array(buffer_objects[3], NPY_INT32, 1, "n_local_vertices") < 0
+        || check_buffer_array(buffer_objects[4], NPY_INT32, 1, "n_faces") < 0) {
+        goto cleanup;
+    }
+    Buffer buffer;
+    buffer.vertex_ids = PyArray_DATA((PyArrayObject *)buffer_objects[0]);
+    buffer.coordinates = PyArray_DATA((PyArrayObject *)buffer_objects[1]);
+    buffer.coordinates_type = coordinates_type;
+    buffer.face_ids = PyArray_DATA((PyArrayObject *)buffer_objects[2]);
+    buffer.n_local_vertices = PyArray_DATA((PyArrayObject *)buffer_objects[3]);
+    buffer.n_faces = PyArray_DATA((PyArrayObject *)buffer_objects[4]);
+    buffer.max_vertices = PyArray_DIM((PyArrayObject *)buffer_objects[0], 1);
+    buffer.max_faces = PyArray_DIM((PyArrayObject *)buffer_objects[2], 1);
+    for (int i = 0; i < 5; i++) {
+        if (PyArray_DIM((PyArrayObject *)buffer_objects[i], 0) != mesh.n_vertices) {
+            PyErr_SetString(PyExc_ValueError, "The buffer must contain one row per vertex!");
+            goto cleanup;
+        }
+    }
+    if (PyArray_DIM((PyArrayObject *)buffer_objects[1], 1) != buffer.max_vertices
+        || PyArray_DIM((PyArrayObject *)buffer_objects[1], 2) != 2) {
+        PyErr_SetString(PyExc_ValueError, "Buffer arrays have inconsistent shapes!");
+        goto cleanup;
+    }
+
+    max_init_dists = PyArray_SimpleNew(1, &n_source_points, NPY_DOUBLE);
+    GPCResult *results = calloc(n_source_points > 0 ? n_source_points : 1, sizeof(GPCResult));
+    if (max_init_dists == NULL || results == NULL) {
+        free(results);
+        PyErr_NoMemory();
+        goto cleanup;
+    }
+
+    // Every thread owns one engine and writes its GPC-systems into their rows. Only GPC-systems which do not fit
+    // into their rows are kept as results.
+    Py_BEGIN_ALLOW_THREADS
+    #pragma omp parallel num_threads(n_threads) if(n_threads > 1)
+    {
+        GPCEngine engine;
+        int init_status = engine_init(&engine, &mesh, n_edges);
+        #pragma omp for schedule(dynamic, 16)
+        for (npy_intp idx = 0; idx < n_source_points; idx++) {
+            if (init_status != ENGINE_OK) {
+                results[idx].status = init_status;
+                continue;
+            }
+            results[idx].status = engine_compute(&engine, source_points[idx], u_max, eps, &results[idx].max_init_dist);
+            if (results[idx].status == ENGINE_OK && !engine_write(&engine, &buffer)) {
+                results[idx].overflow = 1;
+                results[idx].status = engine_store(&engine, &results[idx]);
+                if (results[idx].status == ENGINE_OK) {
+                    results[idx].status = engine_store_face_ids(&engine, &results[idx]);
+                }
+            }
+            engine_reset(&engine);
+        }
+        engine_free(&engine);
+    }
+    Py_END_ALLOW_THREADS
+
+    overflow = PyList_New(0);
+    double *max_init_dists_data = PyArray_DATA((PyArrayObject *)max_init_dists);
+    for (npy_intp idx = 0; overflow != NULL && idx < n_source_points; idx++) {
+        if (raise_engine_status(results[idx].status, source_points[idx]) < 0) {
+            Py_CLEAR(overflow);
+            break;
+        }
+        max_init_dists_data[idx] = results[idx].max_init_dist;
+        if (!results[idx].overflow) {
+            continue;
+        }
+        PyObject *gpc_system = gpc_overflow_to_python(source_points[idx], &results[idx]);
+        if (gpc_system == NULL || PyList_Append(overflow, gpc_system) < 0) {
+            Py_XDECREF(gpc_system);
+            Py_CLEAR(overflow);
+            break;
+        }
+        Py_DECREF(gpc_system);
+    }
+    for (npy_intp idx = 0; idx < n_source_points; idx++) {
+        gpc_result_free(&results[idx]);
+    }
+    free(results);
+    if (overflow != NULL) {
+        result = Py_BuildValue("(OO)", overflow, max_init_dists);
+    }
+
+cleanup:
+    Py_XDECREF(overflow);
+    Py_XDECREF(max_init_dists);
+    for (int i = 0; i < 9; i++) {
+        Py_XDECREF(arrays[i]);
+    }
+    return result;
+}
+
 static PyMethodDef C_Extension_Methods[] = {
     {"compute_dist_and_dir", compute_dist_and_dir_wrapper, METH_VARARGS, "Compute GPC in C."},
     {"compute_angle", compute_angle_wrapper, METH_VARARGS, "Compute the angle between two vectors."},
     {"compute_angle_360", compute_angle_360_wrapper, METH_VARARGS, "Compute the angle between two vectors (range 360)."},
+    {"compute_dist_and_dir_batch", compute_dist_and_dir_batch_wrapper, METH_VARARGS, "Compute GPC for many triangles in C."},
+    {"compute_angle_360_batch", compute_angle_360_batch_wrapper, METH_VARARGS, "Compute the angles between many pairs of vectors (range 360)."},
+    {"compute_gpc_systems", compute_gpc_systems_wrapper, METH_VARARGS, "Compute GPC-systems for source points in C (optionally with multiple threads)."},
+    {"write_gpc_systems", write_gpc_systems_wrapper, METH_VARARGS, "Compute GPC-systems for source points in C and write them into the arrays of a GPC-system buffer."},
     {NULL, NULL, 0, NULL}
 };
 
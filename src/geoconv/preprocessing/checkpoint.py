@@ -0,0 +1,84 @@
+import numpy as np
+import warnings
+import json
+import time
+import os
+
+
+class Checkpoint:
+    def __init__(self, path, n_vertices, parameters, interval=30.):
+        """Remembers which source points have been finished, such that an interrupted computation can be resumed.
+
+        The finished source points are stored as vertex ranges within a JSON-sidecar file next to the (memory-mapped)
+        results. The sidecar is rewritten atomically at most every `interval` seconds. Callers have to flush their
+        results to disk before calling `save`, such that the sidecar never refers to results which are not on disk.
+
+        Parameters
+        ----------
+        path: str
+            The path of the sidecar file.
+        n_vertices: int
+            The amount of source points.
+        parameters: dict
+            The parameters of the computation. A checkpoint is only resumed if they are equal.
+        interval: float
+            The minimal amount of seconds between two writes of the sidecar file.
+        """
+        self.path = path
+        # Round trip through JSON, such that parameters can be compared to the ones of a loaded checkpoint
+        self.parameters = json.loads(
+            json.dumps(dict(parameters, n_vertices=int(n_vertices)), default=lambda value: value.item())
+        )
+        self.interval = interval
+        self.finished = np.zeros((n_vertices,), dtype=bool)
+        self._last_save = time.perf_counter()
+
+    def load(self):
+        """Loads the finished source points from the sidecar file
+
+        Returns
+        -------
+        bool:
+            Whether a matching checkpoint has been found.
+        """
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path, "r") as sidecar:
+            checkpoint = json.load(sidecar)
+        if checkpoint["parameters"] != self.parameters:
+            warnings.warn(
+                f"Ignoring checkpoint '{self.path}', as it has been created with different parameters:"
+                f" {checkpoint['parameters']}",
+                RuntimeWarning
+            )
+            return False
+        for start, stop in checkpoint["finished"]:
+            self.finished[start:stop] = True
+        return True
+
+    def mark(self, source_points):
+        """Marks source points as finished
+
+        Parameters
+        ----------
+        source_points: np.ndarray
+            The finished source points.
+        """
+        self.finished[source_points] = True
+
+    def is_due(self):
+        """Whether `interval` seconds have passed since the sidecar file has been written"""
+        return time.perf_counter() - self._last_save >= self.interval
+
+    def save(self):
+        """Writes the finished source points as vertex ranges into the sidecar file"""
+        # Start and stop (exclusive) of each run of finished source points
+        changes = np.diff(np.concatenate([[0], self.finished.astype(np.int8), [0]]))
+        starts, stops = np.where(changes == 1)[0], np.where(changes == -1)[0]
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w") as sidecar:
+            json.dump(
+                {"parameters": self.parameters, "finished": np.stack([starts, stops], axis=-1).tolist()}, sidecar
+            )
+        os.replace(temporary_path, self.path)
+        self._last_save = time.perf_counter()
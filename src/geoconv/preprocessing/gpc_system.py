@@ -1,5 +1,8 @@
 from geoconv.preprocessing.barycentric_coordinates import polar_to_cart
-from geoconv.utils.misc import get_neighbors, get_faces_of_edge, compute_vector_angle, gpc_systems_into_cart
+from geoconv.preprocessing.gpc_system_cache import (
+    EdgeCache, FaceCache, EdgeGrid, VertexStorage, CoordinateView, MeshCache
+)
+from geoconv.utils.misc import compute_vector_angle, gpc_systems_into_cart
 
 from matplotlib import pyplot as plt
 from matplotlib.patches import Polygon
@@ -10,40 +13,47 @@ import sys
 
 
 class GPCSystem:
-    def __init__(self, source_point, object_mesh, use_c=True, soft_clear=False):
+    def __init__(self, source_point, object_mesh, use_c=True, mesh_cache=None, dtype=np.float64):
         """Compute the initial radial and angular coordinates around a source point and setup caches.
 
         Angle coordinates are always given w.r.t. some reference direction. The choice of a reference
         direction can be arbitrary. Here, we choose the vector `x - source_point` with `x` being the
         first neighbor return by `get_neighbors` as the reference direction.
 
+        Coordinates are only stored for vertices which are part of the GPC-system (see `VertexStorage`).
+        `radial_coordinates`, `angular_coordinates`, `x_coordinates` and `y_coordinates` are views which can be
+        indexed like dense arrays over all mesh vertices (see `CoordinateView`).
+
         This class handles two caches which connect GPC-system- with mesh information:
-            - Edge-cache: Remembers all edges to a vertex
-            - Face-cache: Remembers all faces to a sorted edge
+            - Edge-cache: Remembers all edges to a vertex (see `EdgeCache`)
+            - Face-cache: Remembers all faces to a sorted edge (see `FaceCache`)
+        Additionally, the edges are indexed in a uniform grid within the GPC-system's cartesian frame (see `EdgeGrid`),
+        such that intersection tests only consider nearby edges. Mesh lookups (neighbors and faces of edges) are
+        memoized in a mesh-cache, which can be shared among GPC-systems of the same mesh (see `MeshCache`).
 
         Parameters
         ----------
         source_point: int
             The index of the source point around which a window (GPC-system) shall be established.
-        object_mesh: trimesh.Trimesh
-            A loaded object mesh.
+        object_mesh: trimesh.Trimesh | MeshTopology
+            A loaded object mesh or its precomputed topology. The latter allows for O(1) topology lookups.
         use_c: bool
             A flag whether to use the c-extension.
-        soft_clear: bool
-            Whether to re-use old edge- and face-caches.
+        mesh_cache: MeshCache
+            A mesh-cache of `object_mesh` to re-use. If not given, a new one is created.
+        dtype: type
+            The floating point type in which coordinates are stored.
         """
         # Remember the underlying mesh
         self.object_mesh = object_mesh
         self.source_point = source_point
-        self.radial_coordinates = np.full((object_mesh.vertices.shape[0],), np.inf)
-        self.angular_coordinates = np.full((object_mesh.vertices.shape[0],), -1.0)
-        self.x_coordinates = np.full((object_mesh.vertices.shape[0],), np.inf)
-        self.y_coordinates = np.full((object_mesh.vertices.shape[0],), np.inf)
+        self.mesh_cache = MeshCache(object_mesh) if mesh_cache is None else mesh_cache
+        self._init_coordinates(dtype)
 
         #######################################
         # Calculate initial radial coordinates
         #######################################
-        source_point_neighbors = get_neighbors(source_point, object_mesh)
+        source_point_neighbors = self.mesh_cache.get_neighbors(source_point)
         r3_source_point = object_mesh.vertices[source_point]
         r3_neighbors = object_mesh.vertices[source_point_neighbors]
         self.radial_coordinates[source_point_neighbors] = np.linalg.norm(
@@ -56,14 +66,16 @@ class GPCSystem:
         ########################################
         ref_neighbor = source_point_neighbors[0]
         rotation_axis = object_mesh.vertex_normals[source_point]
-        theta_neighbors = np.full((len(source_point_neighbors, )), .0)
-        for idx, neighbor in enumerate(source_point_neighbors):
-            vector_a = object_mesh.vertices[ref_neighbor] - object_mesh.vertices[source_point]
-            vector_b = object_mesh.vertices[neighbor] - object_mesh.vertices[source_point]
-            if use_c:
-                theta_neighbors[idx] = c_extension.compute_angle_360(vector_a, vector_b, rotation_axis)
-            else:
-                theta_neighbors[idx] = compute_vector_angle(vector_a, vector_b, rotation_axis)
+        vectors_a = np.tile(
+            object_mesh.vertices[ref_neighbor] - object_mesh.vertices[source_point], (len(source_point_neighbors), 1)
+        )
+        vectors_b = object_mesh.vertices[source_point_neighbors] - object_mesh.vertices[source_point]
+        if use_c:
+            theta_neighbors = c_extension.compute_angle_360_batch(vectors_a, vectors_b, rotation_axis)
+        else:
+            theta_neighbors = np.array(
+                [compute_vector_angle(a, b, rotation_axis) for a, b in zip(vectors_a, vectors_b)]
+            )
         self.angular_coordinates[source_point_neighbors] = theta_neighbors
         self.angular_coordinates[source_point] = 0.0
 
@@ -80,21 +92,130 @@ class GPCSystem:
         ####################################################################################
         # Initialize face- and edge-cache with one-hop-neighborhood edges from source-point
         ####################################################################################
-        if not soft_clear:
-            self.edges = {-1: []}
-            self.faces = {(-1, -1): []}
-        self.edges[source_point] = []
+        self.edges = EdgeCache(object_mesh.vertices.shape[0])
+        self.faces = FaceCache(object_mesh.vertices.shape[0])
+        # The longest initialization edge determines the grid resolution of the spatial edge index
+        cell_size = self.radial_coordinates[source_point_neighbors].max()
+        self.edge_grid = EdgeGrid(cell_size if cell_size > 0. else 1.)
+        self.edges.add_vertex(source_point)
         for neighbor in source_point_neighbors:
-            edge, considered_faces = get_faces_of_edge(np.array([source_point, neighbor]), object_mesh)
-            edge = list(edge)
+            edge = sorted((int(source_point), neighbor))
             # Add edges to edge-cache
             self.add_edge(edge)
             # Add faces to face-cache
-            for face in considered_faces:
+            for face in self.mesh_cache.get_faces_of_edge(*edge):
                 self.add_face(face)
 
+    @classmethod
+    def from_arrays(cls,
+                    source_point,
+                    object_mesh,
+                    vertex_ids,
+                    radial_coordinates,
+                    angular_coordinates,
+                    edges,
+                    faces,
+                    dtype=np.float64):
+        """Creates a GPC-system from the arrays returned by the native engine (see `c_extension.compute_gpc_systems`).
+
+        Parameters
+        ----------
+        source_point: int
+            The index of the source point of the GPC-system.
+        object_mesh: trimesh.Trimesh | MeshTopology
+            The object mesh on which the GPC-system has been computed.
+        vertex_ids: np.ndarray
+            The indices of the vertices that have received coordinates.
+        radial_coordinates: np.ndarray
+            The radial coordinates of the vertices in `vertex_ids`.
+        angular_coordinates: np.ndarray
+            The angular coordinates of the vertices in `vertex_ids`.
+        edges: np.ndarray
+            The sorted edges of the GPC-system in edge-cache order.
+        faces: np.ndarray
+            The sorted faces of the GPC-system in face-cache order.
+        dtype: type
+            The floating point type in which coordinates are stored.
+
+        Returns
+        -------
+        GPCSystem:
+            The GPC-system described by the given arrays.
+        """
+        n_vertices = object_mesh.vertices.shape[0]
+        gpc_system = cls.__new__(cls)
+        gpc_system.object_mesh = object_mesh
+        gpc_system.source_point = source_point
+        gpc_system.mesh_cache = MeshCache(object_mesh)
+        gpc_system._init_coordinates(dtype)
+        x, y = polar_to_cart(angles=angular_coordinates, scales=radial_coordinates).T
+        gpc_system.storage.set_values(vertex_ids, np.stack([radial_coordinates, angular_coordinates, x, y], axis=-1))
+
+        gpc_system.edges = EdgeCache.from_array(n_vertices, edges)
+        gpc_system.edges.add_vertex(source_point)
+        gpc_system.faces = FaceCache.from_array(n_vertices, faces)
+        # The spatial edge index is only needed for further updates. Thus, it is built on first access.
+        gpc_system.edge_grid = None
+        return gpc_system
+
+    def _init_coordinates(self, dtype):
+        """Creates an empty vertex-local storage and the coordinate views onto it
+
+        Parameters
+        ----------
+        dtype: type
+            The floating point type in which coordinates are stored.
+        """
+        n_vertices = self.object_mesh.vertices.shape[0]
+        self.storage = VertexStorage(dtype=dtype)
+        self.radial_coordinates = CoordinateView(self.storage, 0, n_vertices, np.inf)
+        self.angular_coordinates = CoordinateView(self.storage, 1, n_vertices, -1.0)
+        self.x_coordinates = CoordinateView(self.storage, 2, n_vertices, np.inf)
+        self.y_coordinates = CoordinateView(self.storage, 3, n_vertices, np.inf)
+
+    @property
+    def vertex_ids(self):
+        """The indices of all vertices which have coordinates in the GPC-system"""
+        return self.storage.vertex_ids
+
+    def astype(self, dtype):
+        """Casts the stored coordinates into another floating point type
+
+        Parameters
+        ----------
+        dtype: type
+            The new floating point type of the coordinates.
+
+        Returns
+        -------
+        GPCSystem:
+            The GPC-system itself.
+        """
+        self.storage.astype(dtype)
+        return self
+
+    @property
+    def edge_grid(self):
+        if self._edge_grid is None:
+            cell_size = self.radial_coordinates[self.mesh_cache.get_neighbors(self.source_point)].max()
+            self._edge_grid = EdgeGrid(cell_size if cell_size > 0. else 1.)
+            for edge_id, (v0, v1) in enumerate(self.edges[-1].tolist()):
+                self._edge_grid.insert(
+                    edge_id,
+                    (self.x_coordinates[v0], self.y_coordinates[v0]),
+                    (self.x_coordinates[v1], self.y_coordinates[v1])
+                )
+        return self._edge_grid
+
+    @edge_grid.setter
+    def edge_grid(self, edge_grid):
+        self._edge_grid = edge_grid
+
     def soft_clear(self, source_point, use_c=True):
-        """Reset radial- and angular coordinates, keep underlying mesh and edge- and face-caches.
+        """Re-initialize the GPC-system for a new source point, keep underlying mesh and mesh-cache.
+
+        Edge- and face-cache describe the GPC-system of the former source point and are therefore reset. The
+        mesh-cache, however, is kept such that mesh lookups of overlapping GPC-systems are only computed once.
 
         Parameters
         ----------
@@ -103,7 +224,9 @@ class GPCSystem:
         use_c: bool
             A flag whether to use the c-extension
         """
-        self.__init__(source_point, self.object_mesh, use_c=use_c, soft_clear=True)
+        self.__init__(
+            source_point, self.object_mesh, use_c=use_c, mesh_cache=self.mesh_cache
+        )
 
     def add_edge(self, edge):
         """Add an edge to the GPC-system
@@ -115,18 +238,13 @@ class GPCSystem:
         """
         if np.inf in [self.x_coordinates[edge[0]], self.x_coordinates[edge[1]]]:
             raise RuntimeError(f"Edge {edge} lacks GPC: {[self.x_coordinates[edge[0]], self.x_coordinates[edge[1]]]}")
-
-        edge = list(np.sort(edge))
-        # Check if edge was seen once
-        if edge not in self.edges[-1]:
-            self.edges[-1].append(edge)
-        for vertex in edge:
-            # Check whether node already exists
-            if vertex not in self.edges.keys():
-                self.edges[vertex] = []
-            # Check whether edge is already saved under node
-            if edge not in self.edges[vertex]:
-                self.edges[vertex].append(edge)
+        edge_id, is_new = self.edges.add(edge)
+        if is_new:
+            self.edge_grid.insert(
+                edge_id,
+                (self.x_coordinates[edge[0]], self.y_coordinates[edge[0]]),
+                (self.x_coordinates[edge[1]], self.y_coordinates[edge[1]])
+            )
 
     def add_face(self, face):
         """Add a face to the GPC-system
@@ -136,25 +254,17 @@ class GPCSystem:
         face: np.ndarray
             The face to add
         """
-        face = list(np.sort(face))
-        if face not in self.faces[(-1, -1)]:
-            self.faces[(-1, -1)].append(face)
+        face, _ = self.faces.add(face)
         face_edges = [
             [face[0], face[1]], [face[1], face[2]], [face[0], face[2]]
         ]
         for edge in face_edges:
-            if (edge[0], edge[1]) not in self.faces.keys():
-                self.faces[(edge[0], edge[1])] = [face]
-            elif face not in self.faces[(edge[0], edge[1])]:
-                self.faces[(edge[0], edge[1])].append(face)
-
             # Recursively check all edges on whether their 2nd face is entirely describable with GPCs
-            for new_face in get_faces_of_edge(edge, self.object_mesh)[1]:
-                new_face = np.sort(new_face)
+            for new_face in self.mesh_cache.get_faces_of_edge(*edge):
                 # If all face coordinates are known and face has not been seen, then update GPC-system with `new_face`
-                if (not np.array_equal(new_face, face)
-                    and not np.any(np.isinf(self.radial_coordinates[new_face]))
-                    and list(new_face) not in self.faces[(-1, -1)]):
+                if (new_face != face
+                    and all(self.radial_coordinates[v] < np.inf for v in new_face)
+                    and new_face not in self.faces):
                     self.update(
                         new_face[0],
                         self.radial_coordinates[new_face[0]],
@@ -191,23 +301,20 @@ class GPCSystem:
         """
         for vertex_k in [k for k in k_vertices if not np.isinf(self.radial_coordinates[k])]:
             # Sort vertex indices such that edge-cache does not store edges twice
-            sorted_face = np.sort([vertex_i, vertex_j, vertex_k])
+            sorted_face = sorted((int(vertex_i), int(vertex_j), int(vertex_k)))
 
             ###############################################################################################
             # Collect all edges of `vertex_i` that will be added or are captured by the current GPC-system
             ###############################################################################################
             updated_face_edges = [
-                [sorted_face[0], sorted_face[1]], [sorted_face[1], sorted_face[2]], [sorted_face[0], sorted_face[2]]
+                (sorted_face[0], sorted_face[1]), (sorted_face[1], sorted_face[2]), (sorted_face[0], sorted_face[2])
             ]
 
-            if vertex_i in self.edges.keys():
-                edges_of_interest = self.edges[vertex_i].copy()
-            else:
-                self.edges[vertex_i] = []
-                edges_of_interest = []
-
+            self.edges.add_vertex(vertex_i)
+            edges_of_interest = [tuple(edge) for edge in self.edges[vertex_i].tolist()]
+            known_edges = set(edges_of_interest)
             for edge in updated_face_edges:
-                if edge not in edges_of_interest:
+                if edge not in known_edges:
                     edges_of_interest.append(edge)
 
             ##########################################
@@ -239,6 +346,15 @@ class GPCSystem:
                 self.x_coordinates[vertex_i] = x
                 self.y_coordinates[vertex_i] = y
 
+                # Already captured edges of `vertex_i` moved within the GPC-system
+                for edge_id in self.edges.get_edge_ids(vertex_i):
+                    v0, v1 = self.edges[-1][edge_id]
+                    self.edge_grid.move(
+                        edge_id,
+                        (self.x_coordinates[v0], self.y_coordinates[v0]),
+                        (self.x_coordinates[v1], self.y_coordinates[v1])
+                    )
+
             ################
             # Add new edges
             ################
@@ -301,6 +417,8 @@ class GPCSystem:
     def line_segment_intersection(self, edge_fst_vertex, edge_snd_vertex):
         """Checks, whether a line segment intersects previously existing ones.
 
+        Only edges that are close to the line segment according to the spatial edge index are tested.
+
         Implements:
         https://en.wikipedia.org/wiki/Line%E2%80%93line_intersection#Given_two_points_on_each_line_segment
 
@@ -316,33 +434,40 @@ class GPCSystem:
         bool:
             Whether the new line segment intersect already existing ones.
         """
-        x1, y1 = edge_fst_vertex[0], edge_fst_vertex[1]
-        x2, y2 = edge_snd_vertex[0], edge_snd_vertex[1]
-        all_edges = np.array(self.edges[-1])
-        xs3, ys3 = self.x_coordinates[all_edges[:, 0]], self.y_coordinates[all_edges[:, 0]]
-        xs4, ys4 = self.x_coordinates[all_edges[:, 1]], self.y_coordinates[all_edges[:, 1]]
-
-        denominators = (x1 - x2) * (ys3 - ys4) - (y1 - y2) * (xs3 - xs4)
-        if 0. in denominators:
-            denominators += sys.float_info.min
-        nominators_1 = (x1 - xs3) * (ys3 - ys4) - (y1 - ys3) * (xs3 - xs4)
-        nominators_2 = (x1 - xs3) * (y1 - y2) - (y1 - ys3) * (x1 - x2)
-
-        xs = nominators_1 / denominators
-        ys = nominators_2 / denominators
+        x1, y1 = float(edge_fst_vertex[0]), float(edge_fst_vertex[1])
+        x2, y2 = float(edge_snd_vertex[0]), float(edge_snd_vertex[1])
 
         eps = 1e-5
-        return np.any(
-            np.logical_and(np.logical_and(0. + eps < xs, xs < 1. - eps), np.logical_and(0. + eps < ys, ys < 1. - eps))
-        )
+        for x3, y3, x4, y4 in self.edge_grid.query(edge_fst_vertex, edge_snd_vertex):
+            denominator = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4)
+            if denominator == 0.:
+                denominator = sys.float_info.min
+            nominator_1 = (x1 - x3) * (y3 - y4) - (y1 - y3) * (x3 - x4)
+            nominator_2 = (x1 - x3) * (y1 - y2) - (y1 - y3) * (x1 - x2)
+
+            if 0. + eps < nominator_1 / denominator < 1. - eps and 0. + eps < nominator_2 / denominator < 1. - eps:
+                return True
+        return False
 
     def get_gpc_system(self):
         """Return the GPC-system as one numpy array.
 
         An array `self.radial_coordinates` of radial coordinates from the source point to other points in the object
         mesh. An array `self.angular_coordinates` of angular coordinates of neighbors from `source_point` in its window.
+        The returned array is dense, i.e. it has one row for each vertex of the object mesh.
+        """
+        return np.stack([self.radial_coordinates.dense(), self.angular_coordinates.dense()], axis=1)
+
+    def get_local_gpc_system(self):
+        """Return the GPC-system only for the vertices which have coordinates.
+
+        Returns
+        -------
+        (np.ndarray, np.ndarray):
+            The vertex indices of shape (n_local_vertices,) and their radial and angular coordinates of shape
+            (n_local_vertices, 2).
         """
-        return np.stack([self.radial_coordinates, self.angular_coordinates], axis=1)
+        return self.storage.vertex_ids, self.storage.values[:, :2]
 
     def get_gpc_triangles(self, in_cart=False):
         """Return all triangles captured by the current GPC-system.
@@ -352,8 +477,8 @@ class GPCSystem:
         in_cart: bool
             Whether to translate geodesic polar coordinates into cartesian.
         """
-        gpc_system_triangles = self.get_gpc_system()
-        gpc_system_triangles = gpc_system_triangles[np.array(self.faces[(-1, -1)])]
+        faces = self.faces[(-1, -1)]
+        gpc_system_triangles = np.stack([self.radial_coordinates[faces], self.angular_coordinates[faces]], axis=-1)
         if in_cart:
             return gpc_systems_into_cart(gpc_system_triangles)
         else:
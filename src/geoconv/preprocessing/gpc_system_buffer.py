@@ -0,0 +1,304 @@
+from geoconv.preprocessing.gpc_system import GPCSystem
+from geoconv.utils.shared_arrays import allocate_arrays, attach_arrays
+
+import numpy as np
+import os
+import weakref
+
+
+BUFFER_ARRAYS = ["vertex_ids", "coordinates", "face_ids", "n_local_vertices", "n_faces"]
+
+
+def _release_shared_memory(block, owner):
+    block.close()
+    if owner:
+        block.unlink()
+
+
+class GPCSystemBuffer:
+    def __init__(self, mesh_topology, arrays, overflow=None, location=None):
+        """Fixed-size, compact storage for the GPC-systems of all vertices of a mesh.
+
+        Every GPC-system occupies one row in each of the following arrays:
+            - `vertex_ids`: (n_systems, max_vertices) the vertices which have coordinates in the GPC-system (-1 pads)
+            - `coordinates`: (n_systems, max_vertices, 2) the radial and angular coordinates of these vertices
+            - `face_ids`: (n_systems, max_faces) the mesh faces captured by the GPC-system in face-cache order (-1 pads)
+            - `n_local_vertices` and `n_faces`: (n_systems,) the amount of used entries per row
+
+        The arrays live in shared memory or in memory-mapped `.npy`-files, such that worker processes can write their
+        results directly into them. GPC-systems which do not fit into a row are kept in `overflow`.
+
+        The buffer can be indexed like the former array of `GPCSystem`-objects. A `GPCSystem` is only created on
+        access.
+
+        Parameters
+        ----------
+        mesh_topology: MeshTopology
+            The topology of the mesh on which the GPC-systems are computed.
+        arrays: dict
+            The arrays of the buffer (see above).
+        overflow: dict
+            Maps source points onto `(vertex_ids, coordinates, face_ids)` of GPC-systems that do not fit into a row.
+        location: tuple
+            Describes where the arrays are stored, such that other processes can attach to them. Either
+            `("shared_memory", name, spec)` or `("memmap", path)`.
+        """
+        self.mesh_topology = mesh_topology
+        for name in BUFFER_ARRAYS:
+            setattr(self, name, arrays[name])
+        self.overflow = {} if overflow is None else overflow
+        self.location = location
+
+    @classmethod
+    def allocate(cls, mesh_topology, max_vertices, max_faces, dtype=np.float64, path=None):
+        """Allocates an empty buffer for one GPC-system per vertex
+
+        Parameters
+        ----------
+        mesh_topology: MeshTopology
+            The topology of the mesh on which the GPC-systems are computed.
+        max_vertices: int
+            The maximal amount of vertices with coordinates per GPC-system.
+        max_faces: int
+            The maximal amount of faces per GPC-system.
+        dtype: type
+            The floating point type of the coordinates.
+        path: str
+            If given, the arrays are stored as memory-mapped `.npy`-files within this directory. Otherwise, they are
+            placed into shared memory, which is released together with the buffer.
+
+        Returns
+        -------
+        GPCSystemBuffer:
+            The empty buffer.
+        """
+        n_systems = mesh_topology.n_vertices
+        shapes = {
+            "vertex_ids": ((n_systems, max_vertices), np.int32, -1),
+            "coordinates": ((n_systems, max_vertices, 2), dtype, 0),
+            "face_ids": ((n_systems, max_faces), np.int32, -1),
+            "n_local_vertices": ((n_systems,), np.int32, 0),
+            "n_faces": ((n_systems,), np.int32, 0)
+        }
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+            # Overflowing GPC-systems of a previous computation do not belong to the new buffer
+            if os.path.exists(os.path.join(path, "overflow.npy")):
+                os.remove(os.path.join(path, "overflow.npy"))
+            arrays = {}
+            for name, (shape, array_dtype, fill_value) in shapes.items():
+                arrays[name] = np.lib.format.open_memmap(
+                    os.path.join(path, f"{name}.npy"), mode="w+", dtype=array_dtype, shape=shape
+                )
+                arrays[name][...] = fill_value
+            return cls(mesh_topology, arrays, location=("memmap", path))
+
+        block, spec, arrays = allocate_arrays(
+            {name: (shape, array_dtype) for name, (shape, array_dtype, _) in shapes.items()}
+        )
+        for name, (_, _, fill_value) in shapes.items():
+            arrays[name][...] = fill_value
+        buffer = cls(mesh_topology, arrays, location=("shared_memory", block.name, spec))
+        weakref.finalize(buffer, _release_shared_memory, block, True)
+        return buffer
+
+    @classmethod
+    def attach(cls, mesh_topology, location, writeable=False):
+        """Attaches to a buffer from another process
+
+        Parameters
+        ----------
+        mesh_topology: MeshTopology
+            The topology of the mesh on which the GPC-systems are computed.
+        location: tuple
+            The location of the buffer (see `GPCSystemBuffer.location`).
+        writeable: bool
+            Whether results may be written into the buffer.
+
+        Returns
+        -------
+        GPCSystemBuffer:
+            The attached buffer.
+        """
+        if location[0] == "memmap":
+            return cls.load(location[1], mesh_topology, mode="r+" if writeable else "r")
+        block, arrays = attach_arrays(location[1], location[2], writeable=writeable)
+        buffer = cls(mesh_topology, arrays, location=location)
+        weakref.finalize(buffer, _release_shared_memory, block, False)
+        return buffer
+
+    @classmethod
+    def load(cls, path, mesh_topology, mode="r"):
+        """Loads a buffer that has been stored as memory-mapped `.npy`-files
+
+        Parameters
+        ----------
+        path: str
+            The directory that contains the `.npy`-files.
+        mesh_topology: MeshTopology
+            The topology of the mesh on which the GPC-systems have been computed.
+        mode: str
+            The mode in which the files are memory-mapped.
+
+        Returns
+        -------
+        GPCSystemBuffer:
+            The loaded buffer.
+        """
+        arrays = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mode) for name in BUFFER_ARRAYS}
+        overflow_path = os.path.join(path, "overflow.npy")
+        overflow = np.load(overflow_path, allow_pickle=True)[0] if os.path.exists(overflow_path) else None
+        return cls(mesh_topology, arrays, overflow=overflow, location=("memmap", path))
+
+    @property
+    def shape(self):
+        return self.n_local_vertices.shape
+
+    def __len__(self):
+        return self.n_local_vertices.shape[0]
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return self.get_gpc_system(int(key) % len(self))
+        # Slices, integer sequences and boolean masks index like an object array of GPC-systems
+        indices = np.arange(len(self))[key]
+        gpc_systems = np.empty(indices.shape, dtype=object)
+        for position, idx in np.ndenumerate(indices):
+            gpc_systems[position] = self.get_gpc_system(int(idx))
+        return gpc_systems
+
+    def write(self, source_point, vertex_ids, radial_coordinates, angular_coordinates, face_ids):
+        """Writes the compact result of one GPC-system into its row
+
+        Parameters
+        ----------
+        source_point: int
+            The source point of the GPC-system, i.e. its row.
+        vertex_ids: np.ndarray
+            The vertices which have coordinates in the GPC-system.
+        radial_coordinates: np.ndarray
+            The radial coordinates of `vertex_ids`.
+        angular_coordinates: np.ndarray
+            The angular coordinates of `vertex_ids`.
+        face_ids: np.ndarray
+            The mesh faces captured by the GPC-system in face-cache order.
+
+        Returns
+        -------
+        bool:
+            Whether the GPC-system fitted into its row. If not, the caller has to keep it in `overflow`.
+        """
+        n_local_vertices, n_faces = len(vertex_ids), len(face_ids)
+        if n_local_vertices > self.vertex_ids.shape[1] or n_faces > self.face_ids.shape[1]:
+            self.n_local_vertices[source_point] = -1
+            return False
+        self.vertex_ids[source_point, :n_local_vertices] = vertex_ids
+        self.coordinates[source_point, :n_local_vertices, 0] = radial_coordinates
+        self.coordinates[source_point, :n_local_vertices, 1] = angular_coordinates
+        self.face_ids[source_point, :n_faces] = face_ids
+        self.n_local_vertices[source_point] = n_local_vertices
+        self.n_faces[source_point] = n_faces
+        return True
+
+    def flush(self):
+        """Writes changes of memory-mapped arrays to disk"""
+        for name in BUFFER_ARRAYS:
+            array = getattr(self, name)
+            if isinstance(array, np.memmap):
+                array.flush()
+
+    def add_overflow(self, overflow):
+        """Keeps GPC-systems which did not fit into their rows
+
+        Memory-mapped buffers additionally store them in `overflow.npy` next to the other arrays.
+
+        Parameters
+        ----------
+        overflow: dict
+            Maps source points onto `(vertex_ids, coordinates, face_ids)`.
+        """
+        if not overflow:
+            return
+        self.overflow.update(overflow)
+        if self.location is not None and self.location[0] == "memmap":
+            container = np.empty((1,), dtype=object)
+            container[0] = self.overflow
+            # Replace the file atomically, such that an interruption never leaves a truncated file behind
+            overflow_path = os.path.join(self.location[1], "overflow.npy")
+            with open(f"{overflow_path}.partial", "wb") as overflow_file:
+                np.save(overflow_file, container, allow_pickle=True)
+            os.replace(f"{overflow_path}.partial", overflow_path)
+
+    def get_local_gpc_system(self, source_point):
+        """Returns the vertices with coordinates and their radial and angular coordinates
+
+        Parameters
+        ----------
+        source_point: int
+            The source point of the GPC-system.
+
+        Returns
+        -------
+        (np.ndarray, np.ndarray):
+            The vertex indices of shape (n_local_vertices,) and their coordinates of shape (n_local_vertices, 2).
+        """
+        if source_point in self.overflow:
+            vertex_ids, coordinates, _ = self.overflow[source_point]
+            return vertex_ids, coordinates
+        n_local_vertices = self.n_local_vertices[source_point]
+        return (
+            self.vertex_ids[source_point, :n_local_vertices].astype(np.int64),
+            np.asarray(self.coordinates[source_point, :n_local_vertices])
+        )
+
+    def get_face_ids(self, source_point):
+        """Returns the mesh faces captured by a GPC-system in face-cache order
+
+        Parameters
+        ----------
+        source_point: int
+            The source point of the GPC-system.
+
+        Returns
+        -------
+        np.ndarray:
+            The face indices.
+        """
+        if source_point in self.overflow:
+            return self.overflow[source_point][2]
+        return self.face_ids[source_point, :self.n_faces[source_point]].astype(np.int64)
+
+    def get_gpc_system(self, source_point):
+        """Creates the `GPCSystem`-object of a source point
+
+        Parameters
+        ----------
+        source_point: int
+            The source point of the GPC-system.
+
+        Returns
+        -------
+        GPCSystem:
+            The GPC-system.
+        """
+        vertex_ids, coordinates = self.get_local_gpc_system(source_point)
+        faces = np.sort(self.mesh_topology.faces[self.get_face_ids(source_point)], axis=-1)
+        # The edge-cache contains the edges of all captured faces
+        face_edges = faces[:, [[0, 1], [1, 2], [0, 2]]].reshape((-1, 2))
+        _, first_occurrences = np.unique(
+            face_edges[:, 0] * self.mesh_topology.n_vertices + face_edges[:, 1], return_index=True
+        )
+        return GPCSystem.from_arrays(
+            source_point,
+            self.mesh_topology,
+            vertex_ids,
+            coordinates[:, 0],
+            coordinates[:, 1],
+            face_edges[np.sort(first_occurrences)],
+            faces,
+            dtype=coordinates.dtype
+        )
@@ -0,0 +1,604 @@
+from geoconv.utils.misc import get_neighbors, get_faces_of_edge
+
+import numpy as np
+import math
+
+
+class EdgeCache:
+    def __init__(self, n_vertices, capacity=64):
+        """An insertion-ordered cache of the edges captured by a GPC-system.
+
+        Edges are stored sorted in a growable int32-array. Membership is checked in O(1) with integer edge keys
+        `v0 * n_vertices + v1`. The incidence of each vertex is stored as a list of offsets into the edge array.
+
+        The cache can be queried like the former dictionary-based edge-cache:
+            - `cache[-1]` returns all edges as an array of shape (n_edges, 2)
+            - `cache[vertex]` returns all edges of `vertex` as an array of shape (n_vertex_edges, 2)
+
+        Parameters
+        ----------
+        n_vertices: int
+            The amount of vertices in the underlying mesh.
+        capacity: int
+            The initial amount of edges for which memory is allocated.
+        """
+        self.n_vertices = n_vertices
+        self._edges = np.zeros((capacity, 2), dtype=np.int32)
+        self._n_edges = 0
+        self._edge_ids = {}
+        self._incidence = {}
+
+    @classmethod
+    def from_array(cls, n_vertices, edges):
+        """Creates an edge-cache from an array of sorted edges given in insertion order
+
+        Parameters
+        ----------
+        n_vertices: int
+            The amount of vertices in the underlying mesh.
+        edges: np.ndarray
+            An array of shape (n_edges, 2) containing sorted and unique edges.
+
+        Returns
+        -------
+        EdgeCache:
+            The edge-cache which contains the given edges.
+        """
+        edges = np.asarray(edges).reshape((-1, 2))
+        edge_cache = cls(n_vertices, capacity=max(edges.shape[0], 1))
+        edge_cache._edges[:edges.shape[0]] = edges
+        edge_cache._n_edges = edges.shape[0]
+        edge_cache._edge_ids = dict(
+            zip((edges[:, 0].astype(np.int64) * n_vertices + edges[:, 1]).tolist(), range(edges.shape[0]))
+        )
+        for edge_id, (a, b) in enumerate(edges.tolist()):
+            edge_cache._incidence.setdefault(a, []).append(edge_id)
+            edge_cache._incidence.setdefault(b, []).append(edge_id)
+        return edge_cache
+
+    def __len__(self):
+        return self._n_edges
+
+    def __contains__(self, key):
+        if isinstance(key, (tuple, list, np.ndarray)):
+            a, b = int(key[0]), int(key[1])
+            if a > b:
+                a, b = b, a
+            return a * self.n_vertices + b in self._edge_ids
+        return key == -1 or key in self._incidence
+
+    def __getitem__(self, key):
+        if key == -1:
+            return self._edges[:self._n_edges]
+        return self._edges[self._incidence[key]]
+
+    def keys(self):
+        return [-1] + list(self._incidence.keys())
+
+    def get_edge_ids(self, vertex):
+        """Returns the offsets of all edges of a vertex within the edge array
+
+        Parameters
+        ----------
+        vertex: int
+            The vertex for which the edge offsets shall be returned
+
+        Returns
+        -------
+        list:
+            The offsets of the edges of `vertex`.
+        """
+        return self._incidence.get(int(vertex), [])
+
+    def add_vertex(self, vertex):
+        """Registers a vertex in the incidence table
+
+        Parameters
+        ----------
+        vertex: int
+            The vertex to register
+        """
+        self._incidence.setdefault(int(vertex), [])
+
+    def add(self, edge):
+        """Adds an edge to the cache if it has not been seen before
+
+        Parameters
+        ----------
+        edge: list
+            The edge to add
+
+        Returns
+        -------
+        (int, bool):
+            The offset of the edge within the edge array and whether the edge has been newly added.
+        """
+        a, b = int(edge[0]), int(edge[1])
+        if a > b:
+            a, b = b, a
+        key = a * self.n_vertices + b
+        edge_id = self._edge_ids.get(key)
+        if edge_id is not None:
+            return edge_id, False
+
+        if self._n_edges == self._edges.shape[0]:
+            self._edges = np.concatenate([self._edges, np.zeros_like(self._edges)])
+        edge_id = self._n_edges
+        self._edges[edge_id] = a, b
+        self._n_edges += 1
+        self._edge_ids[key] = edge_id
+        self._incidence.setdefault(a, []).append(edge_id)
+        self._incidence.setdefault(b, []).append(edge_id)
+        return edge_id, True
+
+
+class FaceCache:
+    def __init__(self, n_vertices, capacity=64):
+        """An insertion-ordered cache of the faces captured by a GPC-system.
+
+        Faces are stored sorted in a growable int32-array. Membership is checked in O(1) with integer face keys
+        `(v0 * n_vertices + v1) * n_vertices + v2`. The faces of each sorted edge are stored as a list of offsets into
+        the face array.
+
+        The cache can be queried like the former dictionary-based face-cache:
+            - `cache[(-1, -1)]` returns all faces as an array of shape (n_faces, 3)
+            - `cache[(v0, v1)]` returns all faces of the sorted edge `(v0, v1)` as an array of shape (n_edge_faces, 3)
+
+        Parameters
+        ----------
+        n_vertices: int
+            The amount of vertices in the underlying mesh.
+        capacity: int
+            The initial amount of faces for which memory is allocated.
+        """
+        self.n_vertices = n_vertices
+        self._faces = np.zeros((capacity, 3), dtype=np.int32)
+        self._n_faces = 0
+        self._face_ids = {}
+        self._edge_faces = {}
+
+    @classmethod
+    def from_array(cls, n_vertices, faces):
+        """Creates a face-cache from an array of sorted faces given in insertion order
+
+        Parameters
+        ----------
+        n_vertices: int
+            The amount of vertices in the underlying mesh.
+        faces: np.ndarray
+            An array of shape (n_faces, 3) containing sorted and unique faces.
+
+        Returns
+        -------
+        FaceCache:
+            The face-cache which contains the given faces.
+        """
+        faces = np.asarray(faces).reshape((-1, 3))
+        face_cache = cls(n_vertices, capacity=max(faces.shape[0], 1))
+        face_cache._faces[:faces.shape[0]] = faces
+        face_cache._n_faces = faces.shape[0]
+        for face_id, (a, b, c) in enumerate(faces.tolist()):
+            face_cache._face_ids[(a * n_vertices + b) * n_vertices + c] = face_id
+            for v0, v1 in ((a, b), (b, c), (a, c)):
+                face_cache._edge_faces.setdefault(v0 * n_vertices + v1, []).append(face_id)
+        return face_cache
+
+    def __len__(self):
+        return self._n_faces
+
+    def __contains__(self, key):
+        if len(key) == 3:
+            a, b, c = sorted((int(key[0]), int(key[1]), int(key[2])))
+            return (a * self.n_vertices + b) * self.n_vertices + c in self._face_ids
+        if key[0] == -1 and key[1] == -1:
+            return True
+        return int(key[0]) * self.n_vertices + int(key[1]) in self._edge_faces
+
+    def __getitem__(self, key):
+        if key[0] == -1 and key[1] == -1:
+            return self._faces[:self._n_faces]
+        return self._faces[self._edge_faces[int(key[0]) * self.n_vertices + int(key[1])]]
+
+    def keys(self):
+        return [(-1, -1)] + [(key // self.n_vertices, key % self.n_vertices) for key in self._edge_faces.keys()]
+
+    def add(self, face):
+        """Adds a face to the cache if it has not been seen before
+
+        Parameters
+        ----------
+        face: list
+            The face to add
+
+        Returns
+        -------
+        (tuple, bool):
+            The sorted face and whether the face has been newly added.
+        """
+        a, b, c = sorted((int(face[0]), int(face[1]), int(face[2])))
+        key = (a * self.n_vertices + b) * self.n_vertices + c
+        if key in self._face_ids:
+            return (a, b, c), False
+
+        if self._n_faces == self._faces.shape[0]:
+            self._faces = np.concatenate([self._faces, np.zeros_like(self._faces)])
+        face_id = self._n_faces
+        self._faces[face_id] = a, b, c
+        self._n_faces += 1
+        self._face_ids[key] = face_id
+        for v0, v1 in ((a, b), (b, c), (a, c)):
+            self._edge_faces.setdefault(v0 * self.n_vertices + v1, []).append(face_id)
+        return (a, b, c), True
+
+
+class EdgeGrid:
+    def __init__(self, cell_size):
+        """A uniform grid that buckets the edges of a GPC-system by their bounding boxes in the GPC-system's plane.
+
+        Each edge is registered in all cells which overlap its bounding box. Hence, two edges can only intersect if
+        they share a cell. This allows to check a new line segment for intersections only against nearby edges.
+        The grid stores the current end points of each registered edge. Edges with non-finite coordinates cannot
+        intersect anything and are not registered.
+
+        Parameters
+        ----------
+        cell_size: float
+            The side length of the quadratic grid cells. Should be in the order of the mesh's edge lengths.
+        """
+        self.cell_size = cell_size
+        self._cells = {}
+        self._edge_cells = {}
+        self._segments = {}
+
+    def _cell_range(self, fst_vertex, snd_vertex, padding=0.):
+        x_min, x_max = min(fst_vertex[0], snd_vertex[0]) - padding, max(fst_vertex[0], snd_vertex[0]) + padding
+        y_min, y_max = min(fst_vertex[1], snd_vertex[1]) - padding, max(fst_vertex[1], snd_vertex[1]) + padding
+        return (
+            range(math.floor(x_min / self.cell_size), math.floor(x_max / self.cell_size) + 1),
+            range(math.floor(y_min / self.cell_size), math.floor(y_max / self.cell_size) + 1)
+        )
+
+    def insert(self, edge_id, fst_vertex, snd_vertex):
+        """Registers an edge in all cells that overlap its bounding box
+
+        Parameters
+        ----------
+        edge_id: int
+            The offset of the edge within the edge-cache
+        fst_vertex: list
+            The cartesian coordinates of the first vertex of the edge
+        snd_vertex: list
+            The cartesian coordinates of the second vertex of the edge
+        """
+        if not all(math.isfinite(c) for c in (fst_vertex[0], fst_vertex[1], snd_vertex[0], snd_vertex[1])):
+            return
+        x_range, y_range = self._cell_range(fst_vertex, snd_vertex)
+        cells = [(cx, cy) for cx in x_range for cy in y_range]
+        for cell in cells:
+            self._cells.setdefault(cell, set()).add(edge_id)
+        self._edge_cells[edge_id] = cells
+        self._segments[edge_id] = (
+            float(fst_vertex[0]), float(fst_vertex[1]), float(snd_vertex[0]), float(snd_vertex[1])
+        )
+
+    def move(self, edge_id, fst_vertex, snd_vertex):
+        """Re-registers an edge after the coordinates of one of its vertices have changed
+
+        Parameters
+        ----------
+        edge_id: int
+            The offset of the edge within the edge-cache
+        fst_vertex: list
+            The new cartesian coordinates of the first vertex of the edge
+        snd_vertex: list
+            The new cartesian coordinates of the second vertex of the edge
+        """
+        for cell in self._edge_cells.pop(edge_id, []):
+            self._cells[cell].discard(edge_id)
+        self._segments.pop(edge_id, None)
+        self.insert(edge_id, fst_vertex, snd_vertex)
+
+    def query(self, fst_vertex, snd_vertex):
+        """Returns the end points of all edges that share a cell with the bounding box of the given line segment
+
+        Parameters
+        ----------
+        fst_vertex: list
+            The cartesian coordinates of the first vertex of the line segment
+        snd_vertex: list
+            The cartesian coordinates of the second vertex of the line segment
+
+        Returns
+        -------
+        list:
+            A list of tuples `(x1, y1, x2, y2)` containing the end points of the nearby edges.
+        """
+        x_range, y_range = self._cell_range(fst_vertex, snd_vertex, padding=self.cell_size * 1e-6)
+        candidates = set()
+        for cx in x_range:
+            for cy in y_range:
+                cell = self._cells.get((cx, cy))
+                if cell:
+                    candidates.update(cell)
+        return [self._segments[edge_id] for edge_id in candidates]
+
+
+class VertexStorage:
+    def __init__(self, dtype=np.float64, capacity=64):
+        """Vertex-local storage for the coordinates of a GPC-system.
+
+        A GPC-system only assigns coordinates to a few vertices of the mesh. Therefore, coordinates are stored
+        in a compact array of shape (n_local_vertices, 4) containing radial-, angular-, x- and y-coordinates. A hash
+        maps mesh vertex indices onto rows (local indices) of that array.
+
+        Parameters
+        ----------
+        dtype: type
+            The floating point type of the stored coordinates.
+        capacity: int
+            The initial amount of vertices for which memory is allocated.
+        """
+        self._local_ids = {}
+        self._vertex_ids = np.zeros((capacity,), dtype=np.int64)
+        self._values = np.zeros((capacity, 4), dtype=dtype)
+        self._n_local = 0
+
+    def __len__(self):
+        return self._n_local
+
+    @property
+    def dtype(self):
+        return self._values.dtype
+
+    @property
+    def vertex_ids(self):
+        """The mesh vertex indices of all stored vertices in local order"""
+        return self._vertex_ids[:self._n_local]
+
+    @property
+    def values(self):
+        """The stored coordinates of shape (n_local_vertices, 4) in local order"""
+        return self._values[:self._n_local]
+
+    def get_local_id(self, vertex):
+        """Returns the local index of a mesh vertex
+
+        Parameters
+        ----------
+        vertex: int
+            The mesh vertex index
+
+        Returns
+        -------
+        int:
+            The local index of the vertex or -1 if the vertex has no coordinates.
+        """
+        return self._local_ids.get(int(vertex), -1)
+
+    def add_vertex(self, vertex, fill_values):
+        """Returns the local index of a mesh vertex and allocates a new row if the vertex has not been seen before
+
+        Parameters
+        ----------
+        vertex: int
+            The mesh vertex index
+        fill_values: tuple
+            The initial values of a newly allocated row
+
+        Returns
+        -------
+        int:
+            The local index of the vertex.
+        """
+        vertex = int(vertex)
+        local_id = self._local_ids.get(vertex)
+        if local_id is not None:
+            return local_id
+
+        if self._n_local == self._values.shape[0]:
+            self._values = np.concatenate([self._values, np.zeros_like(self._values)])
+            self._vertex_ids = np.concatenate([self._vertex_ids, np.zeros_like(self._vertex_ids)])
+        local_id = self._n_local
+        self._values[local_id] = fill_values
+        self._vertex_ids[local_id] = vertex
+        self._local_ids[vertex] = local_id
+        self._n_local += 1
+        return local_id
+
+    def set_values(self, vertex_ids, values):
+        """Replaces the storage's content with the given vertices and their coordinates
+
+        Parameters
+        ----------
+        vertex_ids: np.ndarray
+            The unique mesh vertex indices
+        values: np.ndarray
+            The coordinates of shape (n_vertices, 4)
+        """
+        self._vertex_ids = np.array(vertex_ids, dtype=np.int64).reshape((-1,))
+        self._values = np.array(values, dtype=self.dtype).reshape((-1, 4))
+        self._n_local = self._vertex_ids.shape[0]
+        self._local_ids = dict(zip(self._vertex_ids.tolist(), range(self._n_local)))
+
+    def astype(self, dtype):
+        """Casts the stored coordinates and releases unused memory
+
+        Parameters
+        ----------
+        dtype: type
+            The new floating point type of the stored coordinates.
+        """
+        self._values = self.values.astype(dtype)
+        self._vertex_ids = self.vertex_ids.copy()
+
+
+class CoordinateView:
+    def __init__(self, storage, column, n_vertices, fill_value):
+        """A dense view onto one coordinate of a `VertexStorage`.
+
+        The view can be indexed like an array of length `n_vertices`. Vertices without coordinates yield
+        `fill_value`. A dense array is only materialized on request, e.g. via `np.asarray(view)`.
+
+        Parameters
+        ----------
+        storage: VertexStorage
+            The underlying vertex-local storage
+        column: int
+            The column of the coordinate within the storage
+        n_vertices: int
+            The amount of vertices in the underlying mesh
+        fill_value: float
+            The value of vertices which have no coordinates
+        """
+        self.storage = storage
+        self.column = column
+        self.n_vertices = n_vertices
+        self.fill_value = np.float64(fill_value)
+
+    def __len__(self):
+        return self.n_vertices
+
+    def __iter__(self):
+        return iter(self.dense())
+
+    def __array__(self, dtype=None, copy=None):
+        dense = self.dense()
+        return dense if dtype is None else dense.astype(dtype)
+
+    @property
+    def shape(self):
+        return self.n_vertices,
+
+    @property
+    def dtype(self):
+        return self.storage.dtype
+
+    @property
+    def local_values(self):
+        """The coordinates of all vertices which have coordinates (in local order)"""
+        return self.storage.values[:, self.column]
+
+    def __getitem__(self, key):
+        storage = self.storage
+        if type(key) is int or isinstance(key, np.integer):
+            local_id = storage._local_ids.get(key)
+            if local_id is not None:
+                return storage._values[local_id, self.column]
+            if not -self.n_vertices <= key < self.n_vertices:
+                raise IndexError(f"Index {key} is out of bounds for {self.n_vertices} vertices.")
+            if key < 0:
+                return self[int(key) + self.n_vertices]
+            return self.fill_value
+
+        key = np.asarray(key)
+        if key.dtype.kind not in "iu":
+            return self.dense()[key]
+        local_ids = np.array([storage._local_ids.get(k, -1) for k in key.reshape((-1,)).tolist()], dtype=np.int64)
+        values = np.where(local_ids >= 0, storage._values[local_ids, self.column], self.fill_value)
+        return values.reshape(key.shape)
+
+    def __setitem__(self, key, value):
+        if isinstance(key, (int, np.integer)):
+            local_id = self.storage.add_vertex(self._normalize_index(key), (np.inf, -1.0, np.inf, np.inf))
+            self.storage._values[local_id, self.column] = value
+            return
+        keys = [self._normalize_index(k) for k in np.asarray(key).reshape((-1,)).tolist()]
+        values = np.broadcast_to(np.asarray(value), (len(keys),))
+        for vertex, vertex_value in zip(keys, values.tolist()):
+            local_id = self.storage.add_vertex(vertex, (np.inf, -1.0, np.inf, np.inf))
+            self.storage._values[local_id, self.column] = vertex_value
+
+    def _normalize_index(self, vertex):
+        """Maps a possibly negative vertex index onto its vertex like indexing a dense array would
+
+        Parameters
+        ----------
+        vertex: int
+            The vertex index.
+
+        Returns
+        -------
+        int:
+            The non-negative vertex index.
+        """
+        if not -self.n_vertices <= vertex < self.n_vertices:
+            raise IndexError(f"Index {vertex} is out of bounds for {self.n_vertices} vertices.")
+        return int(vertex) + self.n_vertices if vertex < 0 else int(vertex)
+
+    def copy(self):
+        return self.dense()
+
+    def dense(self):
+        """Materializes the coordinate for all mesh vertices
+
+        Returns
+        -------
+        np.ndarray:
+            A dense array of length `n_vertices`.
+        """
+        dense = np.full((self.n_vertices,), self.fill_value, dtype=self.dtype)
+        dense[self.storage.vertex_ids] = self.local_values
+        return dense
+
+
+class MeshCache:
+    def __init__(self, object_mesh):
+        """Memoizes the mesh-level lookups which are needed to compute GPC-systems.
+
+        In contrast to the edge- and face-cache of a GPC-system, these lookups do not depend on the source point.
+        Thus, one mesh-cache can be shared by all GPC-systems of a mesh (see `GPCSystem.soft_clear`). It remembers:
+            - vertex -> neighbors
+            - sorted edge -> sorted faces
+
+        The edges of a face are not memoized, as they are directly given by the sorted vertex indices of the face. The
+        native engine does not use the mesh-cache, but reads the tables of `MeshTopology` instead.
+
+        Parameters
+        ----------
+        object_mesh: trimesh.Trimesh | MeshTopology
+            The underlying mesh.
+        """
+        self.object_mesh = object_mesh
+        self._neighbors = {}
+        self._edge_faces = {}
+
+    def get_neighbors(self, vertex):
+        """Returns the one-hop neighbors of a vertex
+
+        Parameters
+        ----------
+        vertex: int
+            The vertex for which the neighbors shall be returned
+
+        Returns
+        -------
+        list:
+            The neighboring vertex-indices in the order of `get_neighbors`.
+        """
+        neighbors = self._neighbors.get(vertex)
+        if neighbors is None:
+            neighbors = self._neighbors[vertex] = [int(v) for v in get_neighbors(vertex, self.object_mesh)]
+        return neighbors
+
+    def get_faces_of_edge(self, vertex_a, vertex_b):
+        """Returns the faces of a sorted edge
+
+        Parameters
+        ----------
+        vertex_a: int
+            The smaller vertex index of the edge
+        vertex_b: int
+            The larger vertex index of the edge
+
+        Returns
+        -------
+        tuple:
+            The faces of the edge with sorted vertex indices.
+        """
+        key = (int(vertex_a), int(vertex_b))
+        faces = self._edge_faces.get(key)
+        if faces is None:
+            faces = self._edge_faces[key] = tuple(
+                tuple(sorted(face)) for face in get_faces_of_edge(np.array(key), self.object_mesh)[1].tolist()
+            )
+        return faces
@@ -1,48 +1,823 @@
+from geoconv.preprocessing.barycentric_coordinates import (
+    create_template_matrix, interpolate_template, interpolate_local_gpc_system
+)
+from geoconv.preprocessing.checkpoint import Checkpoint
 from geoconv.preprocessing.gpc_system import GPCSystem
+from geoconv.preprocessing.gpc_system_cache import MeshCache
+from geoconv.preprocessing.gpc_system_buffer import GPCSystemBuffer, BUFFER_ARRAYS
 from geoconv.preprocessing.gpc_system_utils import compute_distance_and_angle
-from geoconv.utils.misc import get_neighbors
+from geoconv.preprocessing.mesh_topology import MeshTopology
 
+from contextlib import contextmanager
+from functools import partial
 from multiprocessing import Pool
 from tqdm import tqdm
 
+import c_extension
 import numpy as np
 import warnings
 import heapq
+import time
+import os
+
+
+ENGINES = ["native", "python"]
+BACKENDS = ["shared_memory", "threads", "processes"]
+
+# State of a worker process of the 'shared_memory'-backend (see `_initialize_worker`)
+_WORKER_STATE = {}
+
+
+def _initialize_worker(shared_memory_name, spec, buffer_location, eps, use_c, engine, dtype, submesh):
+    """Attaches a worker process to the mesh topology in shared memory and to the result buffer
+
+    Parameters
+    ----------
+    shared_memory_name: str
+        The name of the shared memory block that contains the mesh topology.
+    spec: dict
+        The specification of the shared memory block (see `MeshTopology.to_shared_memory`).
+    buffer_location: tuple
+        The location of the result buffer (see `GPCSystemBuffer.location`). If not given, the worker returns its
+        results instead of writing them into a buffer.
+    eps: float
+        See `GPCSystemGroup`.
+    use_c: bool
+        See `GPCSystemGroup`.
+    engine: str
+        See `GPCSystemGroup`.
+    dtype: type
+        See `GPCSystemGroup`.
+    submesh: bool
+        See `GPCSystemGroup`.
+    """
+    mesh_topology = MeshTopology.from_shared_memory(shared_memory_name, spec)
+    _WORKER_STATE["gpc_system_group"] = GPCSystemGroup(
+        mesh_topology, eps=eps, use_c=use_c, engine=engine, dtype=dtype, submesh=submesh
+    )
+    if buffer_location is not None:
+        _WORKER_STATE["buffer"] = GPCSystemBuffer.attach(mesh_topology, buffer_location, writeable=True)
+
+
+def _compute_source_points(chunk):
+    """Computes the GPC-systems of a chunk of source points within a worker process
+
+    The GPC-system group of a worker persists across chunks. Thus, its mesh-cache is re-used for all chunks that are
+    handed to the worker.
+
+    Parameters
+    ----------
+    chunk: (np.ndarray, float)
+        The source points of the chunk and the maximal radius for each GPC-system.
+
+    Returns
+    -------
+    (np.ndarray, dict):
+        The source points and the GPC-systems which did not fit into the result buffer (see
+        `GPCSystemGroup.write_source_points`).
+    """
+    source_points, u_max = chunk
+    return source_points, _WORKER_STATE["gpc_system_group"].write_source_points(
+        _WORKER_STATE["buffer"], source_points, u_max
+    )
+
+
+def _interpolate_template(chunk):
+    """Interpolates a template within a chunk of GPC-systems within a worker process
+
+    Parameters
+    ----------
+    chunk: (np.ndarray, np.ndarray, np.ndarray)
+        The indices of the GPC-systems, the template in cartesian coordinates and the GPC-systems themselves. If the
+        latter is `None`, the GPC-systems are read from the buffer of the worker.
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray):
+        The indices of the GPC-systems and their barycentric coordinates (see `GPCSystemGroup.interpolate_gpc_systems`).
+    """
+    gpc_system_indices, template_matrix, gpc_systems = chunk
+    if gpc_systems is None:
+        gpc_systems, positions = _WORKER_STATE["buffer"], gpc_system_indices
+    else:
+        positions = np.arange(len(gpc_system_indices))
+    return gpc_system_indices, _WORKER_STATE["gpc_system_group"].interpolate_gpc_systems(
+        gpc_systems, positions, template_matrix
+    )
+
+
+def _compute_barycentric_blocks(chunk):
+    """Computes the barycentric coordinates of a chunk of source points within a worker process
+
+    Parameters
+    ----------
+    chunk: (np.ndarray, float, np.ndarray)
+        The source points of the chunk, the maximal radius for each GPC-system and the template in cartesian
+        coordinates (see `create_template_matrix`).
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray):
+        The source points and their barycentric coordinates (see `GPCSystemGroup.compute_barycentric_blocks`).
+    """
+    source_points, u_max, template_matrix = chunk
+    return source_points, _WORKER_STATE["gpc_system_group"].compute_barycentric_blocks(
+        source_points, u_max, template_matrix
+    )
 
 
 class GPCSystemGroup:
-    def __init__(self, object_mesh, eps=0.000001, use_c=True, processes=1):
+    def __init__(self,
+                 object_mesh,
+                 eps=0.000001,
+                 use_c=True,
+                 processes=1,
+                 engine="native",
+                 chunk_size=None,
+                 dtype=np.float64,
+                 backend="shared_memory",
+                 locality=True,
+                 submesh=False):
+        """A group of GPC-systems, one for each vertex of an object mesh.
+
+        Parameters
+        ----------
+        object_mesh: trimesh.Trimesh | MeshTopology
+            A loaded object mesh or its precomputed topology.
+        eps: float
+            The relative improvement which a new radial coordinate must achieve to be accepted.
+        use_c: bool
+            A flag whether to use the c-extension for the per-triangle computations of the Python engine.
+        processes: int
+            The amount of processes (or threads for the 'threads'-backend) used to compute GPC-systems.
+        engine: str
+            Either 'native', which runs the entire algorithm within the c-extension, or 'python', which is the
+            reference implementation. Both engines compute the same GPC-systems.
+        chunk_size: int
+            The amount of consecutive source points which are handed to a worker at once. If not given, the chunk size
+            is derived from the measured cost of a few sample GPC-systems.
+        dtype: type
+            The floating point type in which the coordinates of the computed GPC-systems are stored. Coordinates are
+            always computed in double precision. Storing them as `np.float32` halves the memory of a GPC-system group.
+        backend: str
+            How to distribute the work onto `processes` processes. 'shared_memory' places the mesh topology once into
+            shared memory, which every worker attaches to on start-up. 'threads' runs the native engine with
+            `processes` threads within this process, which all read the same mesh topology and compute GPC-systems
+            without holding the GIL. It requires the 'native' engine and falls back to one thread if the c-extension
+            has been built without OpenMP. 'processes' pickles the GPC-system group for every task.
+        locality: bool
+            Only for the 'shared_memory'-backend: Whether to hand out source points in a bandwidth-reducing order
+            (see `MeshTopology.get_locality_order`) instead of by index. Neighboring source points then end up in
+            the same chunk, such that the mesh lookups cached by a worker (see `MeshCache`) are re-used.
+        submesh: bool
+            Whether to compute every GPC-system on a small submesh around its source point instead of on the entire
+            mesh (see `compute_submesh_payload`). The GPC-systems are the same, however, the memory touched per
+            GPC-system no longer depends on the size of the mesh.
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine '{engine}'. Choose one of: {ENGINES}")
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}'. Choose one of: {BACKENDS}")
+        if backend == "threads" and (engine != "native" or submesh):
+            raise ValueError("The 'threads'-backend requires the 'native' engine without submeshes.")
         self.object_mesh = object_mesh
+        if isinstance(object_mesh, MeshTopology):
+            self.mesh_topology = object_mesh
+        else:
+            self.mesh_topology = MeshTopology(object_mesh)
         self.eps = eps
         self.use_c = use_c
         self.processes = processes
+        self.engine = engine
+        self.chunk_size = chunk_size
+        self.dtype = dtype
+        self.backend = backend
+        self.locality = locality
+        self.submesh = submesh
+        # Mesh lookups of the Python engine, shared by all GPC-systems computed by this group
+        self.mesh_cache = MeshCache(self.mesh_topology)
         self.object_mesh_gpc_systems = None
 
-    def compute(self, u_max=.04):
+    def __getstate__(self):
+        # Do not send the mesh-cache to other processes. It is rebuilt there on demand.
+        state = self.__dict__.copy()
+        state["mesh_cache"] = MeshCache(self.mesh_topology)
+        return state
+
+    def compute(self, u_max=.04, path=None, checkpoint_interval=30.):
         """Computes geodesic polar coordinates for all vertices within an object mesh.
 
+        With the 'shared_memory'- and 'threads'-backends, `object_mesh_gpc_systems` becomes a `GPCSystemBuffer`, into
+        which compact results are written directly. It can be indexed like an array of GPC-systems.
+
         Parameters
         ----------
         u_max: float
             The maximal radius for each GPC-system.
+        path: str
+            Only for the 'shared_memory'- and 'threads'-backends: If given, the results are stored as memory-mapped
+            `.npy`-files within this directory (see `GPCSystemBuffer.load`). Otherwise, they are kept in shared memory.
+        checkpoint_interval: float
+            Only if `path` is given: The finished source points are recorded in 'checkpoint.json' within `path` at
+            most every `checkpoint_interval` seconds (see `Checkpoint`). If the computation is interrupted, calling
+            `compute` again with the same arguments only computes the missing GPC-systems.
         """
         n_vertices = self.object_mesh.vertices.shape[0]
         vertex_indices = np.arange(n_vertices)
-        with Pool(self.processes) as p:
-            gpc_systems = p.starmap(
-                self.compute_gpc_system,
-                tqdm(
-                    [(vi, u_max) for vi in vertex_indices],
-                    total=n_vertices,
-                    postfix="Computing GPC-systems"
+        if self.backend in ["shared_memory", "threads"]:
+            self.object_mesh_gpc_systems = self._compute_shared_memory(u_max, path, checkpoint_interval)
+            return
+        if self.engine == "native":
+            chunk_size = self.chunk_size if self.chunk_size else 64
+            chunks = [(vertex_indices[idx:idx + chunk_size], u_max) for idx in range(0, n_vertices, chunk_size)]
+            with Pool(self.processes) as p:
+                gpc_systems = p.starmap(
+                    self.compute_gpc_systems,
+                    tqdm(chunks, total=len(chunks), postfix="Computing GPC-systems")
+                )
+            gpc_systems = [gpc_system for chunk in gpc_systems for gpc_system in chunk]
+        else:
+            with Pool(self.processes) as p:
+                gpc_systems = p.starmap(
+                    self.compute_gpc_system,
+                    tqdm(
+                        [(vi, u_max) for vi in vertex_indices],
+                        total=n_vertices,
+                        postfix="Computing GPC-systems"
+                    )
                 )
-            )
         self.object_mesh_gpc_systems = np.array(gpc_systems).flatten()
 
+    def _compute_shared_memory(self, u_max, path=None, checkpoint_interval=30.):
+        """Computes all GPC-systems with workers or threads that share one copy of the mesh topology
+
+        Parameters
+        ----------
+        u_max: float
+            The maximal radius for each GPC-system.
+        path: str
+            If given, the results are stored as memory-mapped `.npy`-files within this directory.
+        checkpoint_interval: float
+            The minimal amount of seconds between two checkpoints (see `compute`).
+
+        Returns
+        -------
+        GPCSystemBuffer:
+            The GPC-systems of all vertices.
+        """
+        chunks, max_local_vertices, max_faces = self._get_chunks(u_max, measure_sizes=True)
+
+        checkpoint = None
+        if path is not None:
+            checkpoint = Checkpoint(
+                os.path.join(path, "checkpoint.json"),
+                self.mesh_topology.n_vertices,
+                {"u_max": u_max, "eps": self.eps, "engine": self.engine, "dtype": np.dtype(self.dtype).str},
+                interval=checkpoint_interval
+            )
+        buffer_files = [os.path.join(path, f"{name}.npy") for name in BUFFER_ARRAYS] if path is not None else []
+        if checkpoint is not None and all(os.path.exists(name) for name in buffer_files) and checkpoint.load():
+            # Resume: Only compute the source points which have not been finished yet
+            buffer = GPCSystemBuffer.load(path, self.mesh_topology, mode="r+")
+            chunks = [source_points[~checkpoint.finished[source_points]] for source_points in chunks]
+            chunks = [source_points for source_points in chunks if len(source_points) > 0]
+        else:
+            if checkpoint is not None:
+                # Write an empty checkpoint before the results, such that results are never on disk without one
+                os.makedirs(path, exist_ok=True)
+                checkpoint.save()
+            # Leave some head room, as only a few samples have been measured
+            buffer = GPCSystemBuffer.allocate(
+                self.mesh_topology,
+                max_vertices=int(max_local_vertices * 1.5) + 16,
+                max_faces=int(max_faces * 1.5) + 32,
+                dtype=self.dtype,
+                path=path
+            )
+
+        for source_points, overflow in self._map_chunks(
+            partial(self.write_source_points, buffer),
+            _compute_source_points,
+            [(source_points, u_max) for source_points in chunks],
+            buffer_location=buffer.location,
+            postfix="Computing GPC-systems"
+        ):
+            buffer.add_overflow(overflow)
+            if checkpoint is not None:
+                checkpoint.mark(source_points)
+                if checkpoint.is_due():
+                    buffer.flush()
+                    checkpoint.save()
+        if checkpoint is not None:
+            buffer.flush()
+            checkpoint.save()
+        return buffer
+
+    def compute_barycentric_coordinates(self,
+                                        u_max,
+                                        n_radial=2,
+                                        n_angular=4,
+                                        radius=0.05,
+                                        path=None,
+                                        checkpoint_interval=30.):
+        """Computes the barycentric coordinates of all vertices without storing their GPC-systems.
+
+        In contrast to calling `compute` and `compute_barycentric_coordinates` one after another, every worker computes
+        the GPC-system of a vertex, immediately interpolates the template within it and only returns the barycentric
+        coordinates. GPC-systems are discarded right away, such that at most one GPC-system per worker is held in
+        memory. The results equal the ones of `compute_barycentric_coordinates`.
+
+        Parameters
+        ----------
+        u_max: float
+            The maximal radius for each GPC-system.
+        n_radial: int
+            The amount of radial coordinates of the template.
+        n_angular: int
+            The amount of angular coordinates of the template.
+        radius: float
+            The radius of the template.
+        path: str
+            If given, the barycentric coordinates are written into a memory-mapped `.npy`-file at this path.
+        checkpoint_interval: float
+            Only if `path` is given: The finished source points are recorded in '<path>.checkpoint.json' at most
+            every `checkpoint_interval` seconds (see `Checkpoint`). If the computation is interrupted, calling this
+            method again with the same arguments only computes the missing barycentric coordinates.
+
+        Returns
+        -------
+        np.ndarray:
+            The barycentric coordinates of shape (n_vertices, n_radial, n_angular, 3, 2) in the format of
+            `compute_barycentric_coordinates`.
+        """
+        template_matrix = create_template_matrix(n_radial=n_radial, n_angular=n_angular, radius=radius, in_cart=True)
+        shape = (self.mesh_topology.n_vertices, n_radial, n_angular, 3, 2)
+        chunks, _, _ = self._get_chunks(u_max)
+
+        checkpoint = None
+        if path is not None:
+            checkpoint = Checkpoint(
+                f"{path}.checkpoint.json",
+                self.mesh_topology.n_vertices,
+                {
+                    "u_max": u_max,
+                    "eps": self.eps,
+                    "engine": self.engine,
+                    "n_radial": n_radial,
+                    "n_angular": n_angular,
+                    "radius": radius
+                },
+                interval=checkpoint_interval
+            )
+        if checkpoint is not None and os.path.exists(path) and checkpoint.load():
+            # Resume: Only compute the source points which have not been finished yet
+            barycentric_coordinates = np.load(path, mmap_mode="r+")
+            chunks = [source_points[~checkpoint.finished[source_points]] for source_points in chunks]
+            chunks = [source_points for source_points in chunks if len(source_points) > 0]
+        elif path is not None:
+            # Write an empty checkpoint before the results, such that results are never on disk without one
+            checkpoint.save()
+            barycentric_coordinates = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=shape)
+        else:
+            barycentric_coordinates = np.zeros(shape)
+
+        for source_points, blocks in self._map_chunks(
+            self.compute_barycentric_blocks,
+            _compute_barycentric_blocks,
+            [(source_points, u_max, template_matrix) for source_points in chunks],
+            postfix="Computing barycentric coordinates"
+        ):
+            barycentric_coordinates[source_points] = blocks
+            if checkpoint is not None:
+                checkpoint.mark(source_points)
+                if checkpoint.is_due():
+                    barycentric_coordinates.flush()
+                    checkpoint.save()
+        if checkpoint is not None:
+            barycentric_coordinates.flush()
+            checkpoint.save()
+        return barycentric_coordinates
+
+    def compute_barycentric_blocks(self, source_points, u_max, template_matrix):
+        """Computes GPC-systems for a chunk of source points and interpolates a template within each of them
+
+        Parameters
+        ----------
+        source_points: np.ndarray
+            The source points of the chunk.
+        u_max: float
+            The maximal radius for each GPC-system.
+        template_matrix: np.ndarray
+            The template in cartesian coordinates (see `create_template_matrix`).
+
+        Returns
+        -------
+        np.ndarray:
+            The barycentric coordinates of shape (n_source_points, n_radial, n_angular, 3, 2).
+        """
+        blocks = np.zeros((len(source_points),) + template_matrix.shape[:2] + (3, 2))
+        for idx, (vertex_ids, radial, angular, _, faces) in enumerate(self.compute_payloads(source_points, u_max)):
+            blocks[idx] = interpolate_local_gpc_system(template_matrix, vertex_ids, radial, angular, faces)
+        return blocks
+
+    def interpolate_template(self, template_matrix, processes=None):
+        """Interpolates a template within all computed GPC-systems (see `compute`)
+
+        The GPC-systems are split into chunks. With more than one process, the chunks are interpolated by workers
+        (except for the 'threads'-backend, which interpolates within this process). If the GPC-systems are stored in a
+        `GPCSystemBuffer`, workers read them directly from its shared memory or memory-mapped files. Otherwise, the
+        GPC-systems of a chunk are sent to the worker.
+
+        Parameters
+        ----------
+        template_matrix: np.ndarray
+            The template in cartesian coordinates (see `create_template_matrix`).
+        processes: int
+            The amount of worker processes. Defaults to `processes` of the GPC-system group.
+
+        Returns
+        -------
+        generator:
+            Yields tuples `(gpc_system_indices, blocks)`, in which `blocks` contains the barycentric coordinates of
+            shape (n_gpc_system_indices, n_radial, n_angular, 3, 2). Chunks are yielded in the order of completion.
+        """
+        gpc_systems = self.object_mesh_gpc_systems
+        n_gpc_systems = gpc_systems.shape[0]
+        chunk_size = self.chunk_size if self.chunk_size else 256
+        chunks = [np.arange(idx, min(idx + chunk_size, n_gpc_systems)) for idx in range(0, n_gpc_systems, chunk_size)]
+        processes = self.processes if processes is None else processes
+        if processes == 1 or self.backend == "threads":
+            for gpc_system_indices in chunks:
+                yield gpc_system_indices, self.interpolate_gpc_systems(gpc_systems, gpc_system_indices, template_matrix)
+            return
+
+        is_buffer = isinstance(gpc_systems, GPCSystemBuffer)
+        if is_buffer and gpc_systems.overflow:
+            # Workers attach to the buffer without its overflow. Thus, GPC-systems that did not fit into their rows are
+            # interpolated within this process.
+            overflow = np.array(sorted(gpc_systems.overflow), dtype=np.int64)
+            chunks = [gpc_system_indices[~np.isin(gpc_system_indices, overflow)] for gpc_system_indices in chunks]
+            chunks = [gpc_system_indices for gpc_system_indices in chunks if len(gpc_system_indices) > 0]
+            yield overflow, self.interpolate_gpc_systems(gpc_systems, overflow, template_matrix)
+        tasks = (
+            (gpc_system_indices, template_matrix, None if is_buffer else gpc_systems[gpc_system_indices])
+            for gpc_system_indices in chunks
+        )
+        with self._worker_pool(gpc_systems.location if is_buffer else None, processes=processes) as p:
+            yield from p.imap_unordered(_interpolate_template, tasks)
+
+    def interpolate_gpc_systems(self, gpc_systems, gpc_system_indices, template_matrix):
+        """Interpolates a template within multiple GPC-systems
+
+        Parameters
+        ----------
+        gpc_systems: GPCSystemBuffer | np.ndarray
+            The GPC-systems.
+        gpc_system_indices: np.ndarray
+            The indices of the GPC-systems within `gpc_systems` in which the template shall be interpolated.
+        template_matrix: np.ndarray
+            The template in cartesian coordinates (see `create_template_matrix`).
+
+        Returns
+        -------
+        np.ndarray:
+            The barycentric coordinates of shape (n_gpc_system_indices, n_radial, n_angular, 3, 2).
+        """
+        blocks = np.zeros((len(gpc_system_indices),) + template_matrix.shape[:2] + (3, 2))
+        for idx, gpc_system_idx in enumerate(gpc_system_indices):
+            if isinstance(gpc_systems, GPCSystemBuffer):
+                # Read compact rows without creating a `GPCSystem`
+                vertex_ids, coordinates = gpc_systems.get_local_gpc_system(gpc_system_idx)
+                faces = np.sort(self.mesh_topology.faces[gpc_systems.get_face_ids(gpc_system_idx)], axis=-1)
+                blocks[idx] = interpolate_local_gpc_system(
+                    template_matrix, vertex_ids, coordinates[:, 0], coordinates[:, 1], faces
+                )
+            else:
+                gpc_system = gpc_systems[gpc_system_idx]
+                blocks[idx] = interpolate_template(
+                    template_matrix, gpc_system.get_gpc_triangles(in_cart=True), gpc_system.faces[(-1, -1)]
+                )
+        return blocks
+
+    def _get_chunks(self, u_max, measure_sizes=False):
+        """Splits all source points into chunks which are handed to workers
+
+        Sample GPC-systems are only measured (see `measure_costs`) if the chunk size has not been given or if the
+        sizes of GPC-systems are requested.
+
+        Parameters
+        ----------
+        u_max: float
+            The maximal radius for each GPC-system.
+        measure_sizes: bool
+            Whether the largest amount of vertices and faces within the sample GPC-systems is needed.
+
+        Returns
+        -------
+        (list, int, int):
+            The chunks of source points and the largest amount of vertices and faces within the GPC-systems that
+            have been measured. The latter two are `None` if no GPC-systems have been measured.
+        """
+        n_vertices = self.mesh_topology.n_vertices
+        if self.chunk_size and not measure_sizes:
+            seconds_per_vertex, max_local_vertices, max_faces = None, None, None
+        else:
+            seconds_per_vertex, max_local_vertices, max_faces = self.measure_costs(u_max)
+        if self.chunk_size:
+            chunk_size = self.chunk_size
+        elif self.backend == "threads":
+            # All threads compute one chunk together. Chunks of roughly a quarter of a second, at least four chunks.
+            max_chunk_size = max(int(np.ceil(n_vertices / 4)), 1)
+            chunk_size = int(np.clip(.25 * self.processes / seconds_per_vertex, 1, max_chunk_size))
+        else:
+            # Tasks of roughly a quarter of a second. Every process receives at least four tasks if possible.
+            max_chunk_size = max(int(np.ceil(n_vertices / (4 * self.processes))), 1)
+            chunk_size = int(np.clip(.25 / seconds_per_vertex, 1, max_chunk_size))
+        if self.locality:
+            source_points = self.mesh_topology.get_locality_order()
+        else:
+            source_points = np.arange(n_vertices)
+        chunks = [source_points[idx:idx + chunk_size] for idx in range(0, n_vertices, chunk_size)]
+        return chunks, max_local_vertices, max_faces
+
+    def _map_chunks(self, function, worker_function, chunks, buffer_location=None, postfix=""):
+        """Applies a function onto chunks of source points, either in this process or within workers
+
+        Parameters
+        ----------
+        function: callable
+            The function which is called with the arguments of a chunk in this process (if `processes` is 1 or the
+            'threads'-backend is used, which parallelizes within the function).
+        worker_function: callable
+            The function which is called with a chunk within a worker process. It has to return a tuple containing
+            the source points of the chunk and the result.
+        chunks: list
+            Tuples of arguments. The first argument has to contain the source points of the chunk.
+        buffer_location: tuple
+            The location of the buffer to which workers attach (see `GPCSystemBuffer.location`).
+        postfix: str
+            The postfix of the progress bar.
+
+        Returns
+        -------
+        generator:
+            Yields tuples `(source_points, result)` in the order of completion.
+        """
+        if self.processes == 1 or self.backend == "threads":
+            for chunk in tqdm(chunks, postfix=postfix):
+                yield chunk[0], function(*chunk)
+        else:
+            with self._worker_pool(buffer_location) as p:
+                yield from tqdm(p.imap_unordered(worker_function, chunks), total=len(chunks), postfix=postfix)
+
+    @contextmanager
+    def _worker_pool(self, buffer_location=None, processes=None):
+        """Starts workers which share the mesh topology (see `_initialize_worker`)
+
+        Parameters
+        ----------
+        buffer_location: tuple
+            The location of the buffer to which workers attach (see `GPCSystemBuffer.location`).
+        processes: int
+            The amount of workers. Defaults to `processes` of the GPC-system group.
+        """
+        block, spec = self.mesh_topology.to_shared_memory()
+        try:
+            with Pool(
+                self.processes if processes is None else processes,
+                initializer=_initialize_worker,
+                initargs=(
+                    block.name, spec, buffer_location, self.eps, self.use_c, self.engine, self.dtype, self.submesh
+                )
+            ) as p:
+                yield p
+        finally:
+            block.close()
+            block.unlink()
+
+    def measure_costs(self, u_max, n_samples=8):
+        """Measures the cost of a few GPC-systems which are evenly spread over the mesh
+
+        Parameters
+        ----------
+        u_max: float
+            The maximal radius for each GPC-system.
+        n_samples: int
+            The amount of GPC-systems to compute.
+
+        Returns
+        -------
+        (float, int, int):
+            The seconds needed per GPC-system and the largest amount of vertices and faces within the samples.
+        """
+        n_vertices = self.mesh_topology.n_vertices
+        samples = np.linspace(0, n_vertices - 1, num=min(n_samples, n_vertices), dtype=np.int64)
+        start = time.perf_counter()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            payloads = self.compute_payloads(samples, u_max)
+        seconds_per_vertex = max((time.perf_counter() - start) / samples.shape[0], 1e-9)
+        return (
+            seconds_per_vertex,
+            max(len(vertex_ids) for vertex_ids, _, _, _, _ in payloads),
+            max(len(faces) for _, _, _, _, faces in payloads)
+        )
+
+    def write_source_points(self, buffer, source_points, u_max):
+        """Computes the GPC-systems of a chunk of source points and writes them into a buffer
+
+        Parameters
+        ----------
+        buffer: GPCSystemBuffer
+            The buffer into which the results are written.
+        source_points: np.ndarray
+            The source points of the chunk.
+        u_max: float
+            The maximal radius for each GPC-system.
+
+        Returns
+        -------
+        dict:
+            Maps source points onto `(vertex_ids, coordinates, face_ids)` of GPC-systems which did not fit into the
+            buffer.
+        """
+        if self.engine == "native" and not self.submesh:
+            return self._write_native_source_points(buffer, source_points, u_max)
+        overflow = {}
+        for source_point, (vertex_ids, radial, angular, _, faces) in zip(
+            source_points, self.compute_payloads(source_points, u_max)
+        ):
+            face_ids = self.mesh_topology.get_face_ids(faces)
+            if not buffer.write(source_point, vertex_ids, radial, angular, face_ids):
+                overflow[int(source_point)] = (
+                    vertex_ids, np.stack([radial, angular], axis=-1).astype(self.dtype), face_ids
+                )
+        return overflow
+
+    def compute_payloads(self, source_points, u_max):
+        """Computes local GPC for multiple source points with the configured engine and returns them as arrays
+
+        Parameters
+        ----------
+        source_points: np.ndarray
+            The indices of the source points around which windows (GPC-systems) shall be established
+        u_max: float
+            The maximal distance (e.g. radius of the patch) which a vertex may have to a source point
+
+        Returns
+        -------
+        list:
+            One tuple `(vertex_ids, radial_coordinates, angular_coordinates, edges, faces)` per source point, which
+            contains the vertices that have coordinates, their coordinates and the sorted edges and faces of the
+            GPC-system in cache order.
+        """
+        if self.submesh:
+            return [self.compute_submesh_payload(source_point, u_max) for source_point in source_points]
+        if self.engine == "python":
+            payloads, gpc_system = [], None
+            for source_point in source_points:
+                # Re-use the GPC-system object (and thereby its mesh-cache) of the previous source point
+                gpc_system = self.compute_gpc_system(source_point, u_max, gpc_system=gpc_system)
+                vertex_ids, coordinates = gpc_system.get_local_gpc_system()
+                payloads.append(
+                    (vertex_ids, coordinates[:, 0], coordinates[:, 1], gpc_system.edges[-1], gpc_system.faces[(-1, -1)])
+                )
+            return payloads
+        return self._compute_native_payloads(source_points, u_max)
+
+    def compute_submesh_payload(self, source_point, u_max):
+        """Computes local GPC for one source point on a submesh around it
+
+        The GPC-algorithm only visits the neighbors and the faces of vertices that receive coordinates. Thus, the
+        GPC-system is computed on the faces adjacent to the geodesic ball (see `MeshTopology.get_geodesic_ball`)
+        around the source point. Since a radial coordinate can be shorter than the shortest edge-path, the ball
+        initially covers twice `u_max`. If a vertex outside the ball nonetheless receives coordinates, its
+        neighborhood in the submesh might be incomplete and the computation is repeated with a doubled radius.
+        Otherwise, the submesh preserves the order of neighbors and faces, such that the result equals the one
+        computed on the entire mesh.
+
+        Parameters
+        ----------
+        source_point: int
+            The index of the source point around which a window (GPC-system) shall be established
+        u_max: float
+            The maximal distance (e.g. radius of the patch) which a vertex may have to a source point
+
+        Returns
+        -------
+        tuple:
+            The tuple `(vertex_ids, radial_coordinates, angular_coordinates, edges, faces)` of the GPC-system
+            (see `compute_payloads`) in vertex indices of the entire mesh.
+        """
+        radius = 2 * u_max
+        while True:
+            ball = self.mesh_topology.get_geodesic_ball(source_point, radius)
+            submesh, vertex_map = self.mesh_topology.get_submesh(ball)
+            local_group = GPCSystemGroup(
+                submesh, eps=self.eps, use_c=self.use_c, engine=self.engine, dtype=self.dtype, locality=False
+            )
+            vertex_ids, radial, angular, edges, faces = local_group.compute_payloads(
+                [np.searchsorted(vertex_map, source_point)], u_max
+            )[0]
+            vertex_ids = vertex_map[vertex_ids]
+            # The ball has been large enough, if it contains all vertices with coordinates or the entire mesh
+            if ball.shape[0] == self.mesh_topology.n_vertices or np.isin(vertex_ids, ball).all():
+                return vertex_ids, radial, angular, vertex_map[edges], vertex_map[faces]
+            radius *= 2
+
+    def _write_native_source_points(self, buffer, source_points, u_max):
+        """Computes GPC-systems with the native engine, which writes them directly into a buffer
+
+        The c-extension writes the vertices, coordinates and mesh face indices of every GPC-system into its row, such
+        that only GPC-systems which do not fit into their rows are converted into Python objects (see
+        `write_source_points`).
+        """
+        topology = self.mesh_topology
+        overflow, max_init_dists = c_extension.write_gpc_systems(
+            np.asarray(source_points, dtype=np.int64),
+            u_max,
+            self.eps,
+            topology.vertices,
+            topology.vertex_normals,
+            topology.faces,
+            topology.adjacency_offsets,
+            topology.adjacency_indices,
+            topology.adjacency_edge_ids,
+            topology.edge_faces_offsets,
+            topology.edge_faces,
+            buffer.vertex_ids,
+            buffer.coordinates,
+            buffer.face_ids,
+            buffer.n_local_vertices,
+            buffer.n_faces,
+            self.processes if self.backend == "threads" else 1
+        )
+        self._check_init_dists(max_init_dists, u_max)
+        return {
+            int(source_point): (vertex_ids, np.stack([radial, angular], axis=-1).astype(self.dtype), face_ids)
+            for source_point, vertex_ids, radial, angular, face_ids in overflow
+        }
+
+    def _check_init_dists(self, max_init_dists, u_max):
+        """Warns about GPC-systems whose initialization distances are larger than given max-radius"""
+        for max_init_dist in max_init_dists:
+            if max_init_dist > u_max:
+                warnings.warn(
+                    f"You chose a 'u_max' to be smaller then {max_init_dist}, which has been seen as an"
+                    f" initialization length for a GPC-system. Current GPC-system will only contain initialization"
+                    f" vertices.",
+                    RuntimeWarning
+                )
+
+    def _compute_native_payloads(self, source_points, u_max):
+        """Computes local GPC for multiple source points with the native engine (see `compute_payloads`)"""
+        topology = self.mesh_topology
+        results = c_extension.compute_gpc_systems(
+            np.asarray(source_points, dtype=np.int64),
+            u_max,
+            self.eps,
+            topology.vertices,
+            topology.vertex_normals,
+            topology.faces,
+            topology.adjacency_offsets,
+            topology.adjacency_indices,
+            topology.adjacency_edge_ids,
+            topology.edge_faces_offsets,
+            topology.edge_faces,
+            self.processes if self.backend == "threads" else 1
+        )
+        self._check_init_dists([max_init_dist for *_, max_init_dist in results], u_max)
+        return [payload[:5] for payload in results]
+
+    def compute_gpc_systems(self, source_points, u_max):
+        """Computes local GPC for multiple source points with the native engine.
+
+        The native engine implements the same algorithm as `compute_gpc_system`, however, the min-heap, the edge- and
+        face-caches and the intersection tests run within the c-extension on the arrays of the mesh topology.
+
+        Parameters
+        ----------
+        source_points: np.ndarray
+            The indices of the source points around which windows (GPC-systems) shall be established
+        u_max: float
+            The maximal distance (e.g. radius of the patch) which a vertex may have to a source point
+
+        Returns
+        -------
+        list:
+            A list of GPC-systems.
+        """
+        payloads = self._compute_native_payloads(source_points, u_max)
+        return [
+            GPCSystem.from_arrays(source_point, self.mesh_topology, *payload, dtype=self.dtype)
+            for source_point, payload in zip(source_points, payloads)
+        ]
+
     def compute_gpc_system(self, source_point, u_max, gpc_system=None, plot_path=""):
         """Computes local GPC for one given source point.
 
-        This method implements the algorithm of:
+        This method is the reference implementation of the native engine (see `compute_gpc_systems`) and implements
+        the algorithm of:
         > [Geodesic polar coordinates on polygonal meshes]
           (https://onlinelibrary.wiley.com/doi/full/10.1111/j.1467-8659.2012.03187.x)
         > Melvær, Eivind Lyche, and Martin Reimers.
@@ -54,8 +829,8 @@ class GPCSystemGroup:
         u_max: float
             The maximal distance (e.g. radius of the patch) which a vertex may have to `source_point`
         gpc_system: GPCSystem
-            A GPC-system that has been computed previously on the same mesh. Its caches can be re-used
-            which saves computation time.
+            A GPC-system that has been computed previously on the same mesh. It is re-initialized for `source_point`
+            (see `GPCSystem.soft_clear`) and its mesh-cache is re-used, which saves computation time.
         plot_path: bool
             If given, the update steps will be plotted and stored at the given path.
 
@@ -68,11 +843,12 @@ class GPCSystemGroup:
         # Initialize GPC-system
         ########################
         if gpc_system is None:
-            gpc_system = GPCSystem(source_point, self.object_mesh, use_c=True)
+            gpc_system = GPCSystem(source_point, self.mesh_topology, use_c=True, mesh_cache=self.mesh_cache)
         else:
             gpc_system.soft_clear(source_point)
         # Check whether initialization distances are larger than given max-radius
-        check_array = np.array([x for x in gpc_system.radial_coordinates if not np.isinf(x)])
+        check_array = gpc_system.radial_coordinates.local_values
+        check_array = check_array[~np.isinf(check_array)]
         if check_array.max() > u_max:
             warnings.warn(
                 f"You chose a 'u_max' to be smaller then {check_array.max()}, which has been seen as an initialization"
@@ -84,7 +860,7 @@ class GPCSystemGroup:
         # Initialize min-heap over radial distances
         ############################################
         candidates = []
-        for neighbor in get_neighbors(source_point, self.object_mesh):
+        for neighbor in gpc_system.mesh_cache.get_neighbors(source_point):
             candidates.append((gpc_system.radial_coordinates[neighbor], neighbor))
         heapq.heapify(candidates)
 
@@ -95,7 +871,7 @@ class GPCSystemGroup:
         while candidates:
             # Get vertex from min-heap that is closest to GPC-system origin
             j_dist, j = heapq.heappop(candidates)
-            j_neighbors = get_neighbors(j, self.object_mesh)
+            j_neighbors = gpc_system.mesh_cache.get_neighbors(j)
             j_neighbors = [j for j in j_neighbors if j != source_point]
             for i in j_neighbors:
                 # Compute the (updated) geodesic distance `new_u_i` and angular coordinate of the i-th neighbor from the
@@ -105,7 +881,7 @@ class GPCSystemGroup:
                     j,
                     gpc_system,
                     self.use_c,
-                    rotation_axis=self.object_mesh.vertex_normals[source_point]
+                    rotation_axis=self.mesh_topology.vertex_normals[source_point]
                 )
                 # In difference to the original pseudocode, we add 'new_u_i < u_max' to this IF-query
                 # to ensure that the radial coordinates do not exceed 'u_max'.
@@ -119,4 +895,4 @@ class GPCSystemGroup:
                     else:
                         if gpc_system.update(i, new_u_i, new_theta_i, j, k_vertices):
                             heapq.heappush(candidates, (new_u_i, i))
-        return gpc_system
+        return gpc_system.astype(self.dtype)
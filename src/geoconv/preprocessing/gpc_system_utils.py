@@ -1,4 +1,4 @@
-from geoconv.utils.misc import get_faces_of_edge, compute_vector_angle
+from geoconv.utils.misc import compute_vector_angle
 
 from scipy.linalg import blas
 
@@ -41,8 +41,8 @@ def compute_u_ijk_and_angle(vertex_i, vertex_j, vertex_k, u, theta, object_mesh,
     """
 
     # Convert indices to vectors
-    u_j, u_k = u[[vertex_j, vertex_k]]
-    theta_i_init, theta_j, theta_k = theta[[vertex_i, vertex_j, vertex_k]]
+    u_j, u_k = u[vertex_j], u[vertex_k]
+    theta_j, theta_k = theta[vertex_j], theta[vertex_k]
     vertex_i, vertex_j, vertex_k = object_mesh.vertices[[vertex_i, vertex_j, vertex_k]]
 
     if use_c:
@@ -146,6 +146,51 @@ def compute_u_ijk_and_angle(vertex_i, vertex_j, vertex_k, u, theta, object_mesh,
     return u_ijk, theta_i
 
 
+def compute_u_ijk_and_angle_batch(triangles, u, theta, object_mesh, use_c):
+    """Euclidean update procedure and angle computation for multiple triangles at once
+
+    The c-extension processes all triangles within one call without holding the GIL. Both variants return the same
+    values as `compute_u_ijk_and_angle`.
+
+    Parameters
+    ----------
+    triangles: np.ndarray
+        An array of shape (n_triangles, 3) which contains the vertex indices `(i, j, k)` of each triangle, where `i` is
+        the vertex for which we want to update the distance and angle
+    u: np.ndarray
+        An array of shape (n_triangles, 2) which contains the currently known radial coordinates of `j` and `k`
+    theta: np.ndarray
+        An array of shape (n_triangles, 2) which contains the currently known angular coordinates of `j` and `k`
+    object_mesh: trimesh.Trimesh
+        A loaded object mesh
+    use_c: bool
+        A flag whether to use the c-extension
+
+    Returns
+    -------
+    np.ndarray
+        An array of shape (n_triangles, 2) which contains the Euclidean update u_ijk and the new angle for each triangle
+    """
+    triangles = np.asarray(triangles, dtype=np.int64).reshape((-1, 3))
+    u = np.asarray(u, dtype=np.float64).reshape((-1, 2))
+    theta = np.asarray(theta, dtype=np.float64).reshape((-1, 2))
+    if use_c:
+        return c_extension.compute_dist_and_dir_batch(object_mesh.vertices, triangles, u, theta)
+    results = np.empty((triangles.shape[0], 2))
+    for idx, (vertex_i, vertex_j, vertex_k) in enumerate(triangles.tolist()):
+        results[idx] = compute_u_ijk_and_angle(
+            vertex_i,
+            vertex_j,
+            vertex_k,
+            {vertex_j: u[idx, 0], vertex_k: u[idx, 1]},
+            {vertex_j: theta[idx, 0], vertex_k: theta[idx, 1]},
+            object_mesh,
+            use_c=False,
+            rotation_axis=None
+        )
+    return results
+
+
 def compute_distance_and_angle(vertex_i, vertex_j, gpc_system, use_c, rotation_axis):
     """Euclidean update procedure for geodesic distance approximation
 
@@ -175,38 +220,33 @@ def compute_distance_and_angle(vertex_i, vertex_j, gpc_system, use_c, rotation_a
         function also returns the missing vertices which could have been used to update the coordinates of `vertex_i`.
     """
     # We consider both faces of `sorted_edge` for computing the coordinates to `vertex_i`
-    sorted_edge = np.sort([vertex_i, vertex_j])
-    if (sorted_edge[0], sorted_edge[1]) in gpc_system.faces.keys():
+    sorted_edge = sorted((int(vertex_i), int(vertex_j)))
+    if (sorted_edge[0], sorted_edge[1]) in gpc_system.faces:
         # Use cache to get faces of `sorted_edge`
         considered_faces = gpc_system.faces[(sorted_edge[0], sorted_edge[1])]
     else:
-        _, considered_faces = get_faces_of_edge(sorted_edge, gpc_system.object_mesh)
+        # Use mesh-cache, which is shared among GPC-systems, to get faces of `sorted_edge`
+        considered_faces = gpc_system.mesh_cache.get_faces_of_edge(*sorted_edge)
 
     # Compute GPC for `vertex_i` considering both faces of `[vertex_i, vertex_j]`
-    updates = []
+    triangles, u, theta = [], [], []
     k_vertices = []
     for face in considered_faces:
         vertex_k = [v for v in face if v not in [vertex_i, vertex_j]][0]
         k_vertices.append(vertex_k)
         # We need to know the distance to `vertex_k`
         if gpc_system.radial_coordinates[vertex_k] < np.inf and gpc_system.angular_coordinates[vertex_k] >= 0.:
-            u_ijk, phi_i = compute_u_ijk_and_angle(
-                vertex_i,
-                vertex_j,
-                vertex_k,
-                gpc_system.radial_coordinates,
-                gpc_system.angular_coordinates,
-                gpc_system.object_mesh,
-                use_c,
-                rotation_axis
-            )
-            updates.append((u_ijk, phi_i, vertex_k))
+            triangles.append((vertex_i, vertex_j, vertex_k))
+            u.append((gpc_system.radial_coordinates[vertex_j], gpc_system.radial_coordinates[vertex_k]))
+            theta.append((gpc_system.angular_coordinates[vertex_j], gpc_system.angular_coordinates[vertex_k]))
 
     # If no GPC have been found for `vertex_i`, return default GPC
-    if not updates:
+    if not triangles:
         return np.inf, -1.0, None
 
+    results = compute_u_ijk_and_angle_batch(triangles, u, theta, gpc_system.object_mesh, use_c).tolist()
+    updates = [(u_ijk, phi_i, triangle[2]) for (u_ijk, phi_i), triangle in zip(results, triangles)]
+
     # If two GPC have been found for `vertex_i`, return the smallest distance to `vertex_i`
-    else:
-        u_ijk, phi_i, vertex_k = min(updates)
-        return u_ijk, phi_i, k_vertices
+    u_ijk, phi_i, vertex_k = min(updates)
+    return u_ijk, phi_i, k_vertices
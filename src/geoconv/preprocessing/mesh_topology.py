@@ -0,0 +1,329 @@
+from geoconv.utils.shared_arrays import share_arrays, attach_arrays
+
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+
+import numpy as np
+import heapq
+
+
+SHARED_TABLES = [
+    "vertices",
+    "faces",
+    "vertex_normals",
+    "edges",
+    "adjacency_offsets",
+    "adjacency_indices",
+    "adjacency_edge_ids",
+    "edge_faces_offsets",
+    "edge_faces",
+    "face_edges"
+]
+
+
+class MeshTopology:
+    def __init__(self, object_mesh):
+        """Precompute the connectivity of a triangle mesh once, such that topology queries are answered in O(1).
+
+        The following tables are stored as plain numpy arrays (not as trimesh's tracked arrays):
+            - Vertex adjacency in CSR-format: The neighbors of vertex `v` are given by
+              `adjacency_indices[adjacency_offsets[v]:adjacency_offsets[v + 1]]`. The indices of the corresponding
+              edges are stored at the same positions in `adjacency_edge_ids`.
+            - Edge to faces in CSR-format: The faces of edge `e` are given by
+              `edge_faces[edge_faces_offsets[e]:edge_faces_offsets[e + 1]]`.
+            - Face to edges: `face_edges[f]` contains the indices of the three edges of face `f`.
+            - A hash that maps sorted edges `(v0, v1)` onto their edge index.
+
+        The order of neighbors and faces equals the one of `trimesh.Trimesh.vertex_adjacency_graph` and
+        `trimesh.Trimesh.edges_sorted`, respectively. Thus, GPC-systems computed with a mesh topology equal
+        the ones computed with the underlying trimesh object.
+
+        Parameters
+        ----------
+        object_mesh: trimesh.Trimesh
+            A loaded object mesh.
+        """
+        self.vertices = np.array(object_mesh.vertices, dtype=np.float64)
+        self.faces = np.array(object_mesh.faces, dtype=np.int64)
+        self.vertex_normals = np.array(object_mesh.vertex_normals, dtype=np.float64)
+        self.edges = np.array(object_mesh.edges_unique, dtype=np.int64)
+        self._build_tables(np.array(object_mesh.edges_unique_inverse, dtype=np.int64))
+
+    def _build_tables(self, edges_unique_inverse):
+        """Builds all tables which are derived from the vertices, faces and edges
+
+        Parameters
+        ----------
+        edges_unique_inverse: np.ndarray
+            The edge index of each of the three edges `(f0, f1)`, `(f1, f2)` and `(f2, f0)` of every face.
+        """
+        n_vertices = self.vertices.shape[0]
+        n_edges = self.edges.shape[0]
+
+        ##########################################################################################
+        # Vertex adjacency (CSR): Neighbors are ordered by their first occurrence in edge list
+        ##########################################################################################
+        edge_ids = np.concatenate([np.arange(n_edges), np.arange(n_edges)])
+        rows = np.concatenate([self.edges[:, 0], self.edges[:, 1]])
+        columns = np.concatenate([self.edges[:, 1], self.edges[:, 0]])
+        order = np.lexsort((edge_ids, rows))
+        self.adjacency_indices = columns[order]
+        self.adjacency_edge_ids = edge_ids[order]
+        self.adjacency_offsets = np.zeros((n_vertices + 1,), dtype=np.int64)
+        self.adjacency_offsets[1:] = np.cumsum(np.bincount(rows, minlength=n_vertices))
+
+        ####################################################################
+        # Edge to faces (CSR): Faces are ordered by increasing face index
+        ####################################################################
+        order = np.argsort(edges_unique_inverse, kind="stable")
+        self.edge_faces = np.repeat(np.arange(self.faces.shape[0]), 3)[order]
+        self.edge_faces_offsets = np.zeros((n_edges + 1,), dtype=np.int64)
+        self.edge_faces_offsets[1:] = np.cumsum(np.bincount(edges_unique_inverse, minlength=n_edges))
+
+        #################
+        # Face to edges
+        #################
+        self.face_edges = edges_unique_inverse.reshape((-1, 3))
+
+        #####################################
+        # Hash: sorted edge -> edge index
+        #####################################
+        self._build_edge_ids()
+
+    def _build_edge_ids(self):
+        n_vertices = self.vertices.shape[0]
+        self.edge_ids = dict(
+            zip((self.edges[:, 0] * n_vertices + self.edges[:, 1]).tolist(), range(self.edges.shape[0]))
+        )
+
+    def to_shared_memory(self):
+        """Copies all tables of the topology into one block of shared memory
+
+        The caller owns the returned shared memory block and has to `close` and `unlink` it once all processes,
+        which attached to it via `MeshTopology.from_shared_memory`, are done.
+
+        Returns
+        -------
+        (multiprocessing.shared_memory.SharedMemory, dict):
+            The shared memory block and a specification that describes where each table is located within the block.
+        """
+        return share_arrays({name: getattr(self, name) for name in SHARED_TABLES})
+
+    @classmethod
+    def from_shared_memory(cls, name, spec):
+        """Attaches to a topology which has been placed into shared memory by `MeshTopology.to_shared_memory`
+
+        The tables are not copied but read from the shared memory block. Only the edge hash is rebuilt.
+
+        Parameters
+        ----------
+        name: str
+            The name of the shared memory block.
+        spec: dict
+            The specification returned by `MeshTopology.to_shared_memory`.
+
+        Returns
+        -------
+        MeshTopology:
+            The attached mesh topology.
+        """
+        topology = cls.__new__(cls)
+        topology._shared_memory, tables = attach_arrays(name, spec)
+        for table_name, table in tables.items():
+            setattr(topology, table_name, table)
+        topology._build_edge_ids()
+        return topology
+
+    @property
+    def n_vertices(self):
+        return self.vertices.shape[0]
+
+    def get_neighbors(self, vertex):
+        """Returns the one-hop neighbors of a vertex
+
+        Parameters
+        ----------
+        vertex: int
+            The index of the vertex for which the neighbor indices shall be returned
+
+        Returns
+        -------
+        list:
+            A list of neighboring vertex-indices.
+        """
+        return self.adjacency_indices[self.adjacency_offsets[vertex]:self.adjacency_offsets[vertex + 1]].tolist()
+
+    def get_locality_order(self):
+        """Returns an order of all vertices in which neighboring vertices are close to each other
+
+        The order is given by the reverse Cuthill-McKee algorithm on the vertex adjacency, which reduces the bandwidth
+        of the adjacency matrix. Consecutive vertices in this order therefore share large parts of their
+        neighborhoods, regardless of how the vertices of the mesh are indexed.
+
+        Returns
+        -------
+        np.ndarray:
+            A permutation of all vertex indices.
+        """
+        adjacency = csr_matrix(
+            (np.ones_like(self.adjacency_indices, dtype=np.int8), self.adjacency_indices, self.adjacency_offsets),
+            shape=(self.n_vertices, self.n_vertices)
+        )
+        return reverse_cuthill_mckee(adjacency, symmetric_mode=True).astype(np.int64)
+
+    def get_geodesic_ball(self, source_point, radius):
+        """Returns all vertices whose shortest edge-path to a source point is not longer than a radius
+
+        The vertices are collected by a Dijkstra search over the edge lengths, which stops as soon as the radius is
+        exceeded. Hence, the costs only depend on the size of the ball and not on the size of the mesh.
+
+        Parameters
+        ----------
+        source_point: int
+            The index of the vertex in the center of the ball.
+        radius: float
+            The maximal length of the edge-paths.
+
+        Returns
+        -------
+        np.ndarray:
+            The sorted indices of the vertices within the ball.
+        """
+        if getattr(self, "_adjacency_lengths", None) is None:
+            edge_lengths = np.linalg.norm(self.vertices[self.edges[:, 0]] - self.vertices[self.edges[:, 1]], axis=-1)
+            self._adjacency_lengths = edge_lengths[self.adjacency_edge_ids]
+
+        source_point = int(source_point)
+        distances = {source_point: 0.}
+        candidates = [(0., source_point)]
+        while candidates:
+            distance, vertex = heapq.heappop(candidates)
+            if distance > distances[vertex]:
+                continue
+            start, stop = self.adjacency_offsets[vertex], self.adjacency_offsets[vertex + 1]
+            for neighbor, length in zip(
+                self.adjacency_indices[start:stop].tolist(), self._adjacency_lengths[start:stop].tolist()
+            ):
+                neighbor_distance = distance + length
+                if neighbor_distance <= radius and neighbor_distance < distances.get(neighbor, np.inf):
+                    distances[neighbor] = neighbor_distance
+                    heapq.heappush(candidates, (neighbor_distance, neighbor))
+        return np.sort(np.fromiter(distances.keys(), dtype=np.int64, count=len(distances)))
+
+    def get_submesh(self, vertex_ids):
+        """Returns the topology of all faces that are adjacent to at least one of the given vertices
+
+        The submesh keeps the vertex positions and the vertex normals of this mesh. Vertices, edges and faces are
+        reindexed in ascending order of their indices in this mesh. Therefore, the order of neighbors and faces within
+        the submesh equals their order in this mesh. Vertices of the submesh which are not within `vertex_ids` lie on
+        the boundary of the submesh and are missing neighbors.
+
+        Parameters
+        ----------
+        vertex_ids: np.ndarray
+            The vertices whose adjacent faces shall be contained in the submesh.
+
+        Returns
+        -------
+        (MeshTopology, np.ndarray):
+            The topology of the submesh and the indices of its vertices within this mesh.
+        """
+        if getattr(self, "_vertex_faces", None) is None:
+            self._vertex_faces = np.argsort(self.faces.reshape(-1), kind="stable") // 3
+            self._vertex_faces_offsets = np.zeros((self.n_vertices + 1,), dtype=np.int64)
+            self._vertex_faces_offsets[1:] = np.cumsum(np.bincount(self.faces.reshape(-1), minlength=self.n_vertices))
+
+        # Gather the faces of all given vertices from the vertex to faces table
+        vertex_ids = np.asarray(vertex_ids, dtype=np.int64)
+        starts = self._vertex_faces_offsets[vertex_ids]
+        lengths = self._vertex_faces_offsets[vertex_ids + 1] - starts
+        positions = np.repeat(starts - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+        face_ids = np.unique(self._vertex_faces[positions])
+
+        vertex_map = np.unique(self.faces[face_ids])
+        edge_ids = np.unique(self.face_edges[face_ids])
+        submesh = MeshTopology.__new__(MeshTopology)
+        submesh.vertices = self.vertices[vertex_map]
+        submesh.faces = np.searchsorted(vertex_map, self.faces[face_ids])
+        submesh.vertex_normals = self.vertex_normals[vertex_map]
+        submesh.edges = np.searchsorted(vertex_map, self.edges[edge_ids])
+        submesh._build_tables(np.searchsorted(edge_ids, self.face_edges[face_ids].reshape(-1)))
+        return submesh, vertex_map
+
+    def get_edge_id(self, vertex_a, vertex_b):
+        """Returns the index of the edge between two vertices
+
+        Parameters
+        ----------
+        vertex_a: int
+            The index of the first vertex of the edge
+        vertex_b: int
+            The index of the second vertex of the edge
+
+        Returns
+        -------
+        int:
+            The index of the edge or -1 if both vertices are not connected.
+        """
+        if vertex_a > vertex_b:
+            vertex_a, vertex_b = vertex_b, vertex_a
+        return self.edge_ids.get(int(vertex_a) * self.n_vertices + int(vertex_b), -1)
+
+    def get_face_ids_of_edge(self, edge_id):
+        """Returns the indices of the faces adjacent to an edge
+
+        Parameters
+        ----------
+        edge_id: int
+            The index of the edge
+
+        Returns
+        -------
+        np.ndarray:
+            The face indices of the edge.
+        """
+        return self.edge_faces[self.edge_faces_offsets[edge_id]:self.edge_faces_offsets[edge_id + 1]]
+
+    def get_face_ids(self, faces):
+        """Returns the indices of faces given by their vertex indices
+
+        Parameters
+        ----------
+        faces: np.ndarray
+            An array of shape (n_faces, 3) containing vertex indices of faces of the mesh. The order of the vertices
+            within a face does not matter.
+
+        Returns
+        -------
+        np.ndarray:
+            The face indices of shape (n_faces,).
+        """
+        if getattr(self, "_sorted_face_keys", None) is None:
+            keys = self._face_keys(self.faces)
+            self._sorted_face_order = np.argsort(keys, kind="stable")
+            self._sorted_face_keys = keys[self._sorted_face_order]
+        positions = np.searchsorted(self._sorted_face_keys, self._face_keys(np.asarray(faces).reshape((-1, 3))))
+        return self._sorted_face_order[np.minimum(positions, self._sorted_face_keys.shape[0] - 1)]
+
+    def _face_keys(self, faces):
+        faces = np.sort(faces.astype(np.int64), axis=-1)
+        return (faces[:, 0] * self.n_vertices + faces[:, 1]) * self.n_vertices + faces[:, 2]
+
+    def get_faces_of_edge(self, edge):
+        """Determine both faces of a given edge
+
+        Parameters
+        ----------
+        edge: np.ndarray
+            The edge for which the faces shall be returned.
+
+        Returns
+        -------
+        (np.ndarray, np.ndarray):
+            The sorted edge and the faces (vertex indices) of the edge.
+        """
+        edge = np.sort(edge)
+        edge_id = self.get_edge_id(edge[0], edge[1])
+        if edge_id == -1:
+            return edge, np.zeros((0, 3), dtype=self.faces.dtype)
+        return edge, self.faces[self.get_face_ids_of_edge(edge_id)]
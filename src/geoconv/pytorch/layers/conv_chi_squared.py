@@ -1,4 +1,4 @@
-from geoconv.pytorch.layers.conv_geodesic import angle_distance
+from geoconv.pytorch.layers.conv_geodesic import angle_distance, kernel_grid
 from geoconv.pytorch.layers.conv_intrinsic import ConvIntrinsic
 
 import numpy as np
@@ -44,6 +44,8 @@ def chi_squared_pdf(mean_rho, mean_theta, rho, theta, dof):
     dof: int
         Degrees of freedom for chi-squared distribution
 
+    All coordinates may also be given as broadcastable arrays.
+
     Returns
     -------
     float:
@@ -55,19 +57,20 @@ def chi_squared_pdf(mean_rho, mean_theta, rho, theta, dof):
     max_angle = np.maximum(mean_theta, theta)
     min_angle = np.minimum(mean_theta, theta)
     delta_angle = angle_distance(max_angle, min_angle)
-    if delta_angle == 0 and dof == 1:
-        return 1.
-    delta_angle_p = delta_angle ** (dof / 2 - 1)
 
     # Compute delta rho
     delta_rho = np.abs(rho - mean_rho)
-    if delta_rho == 0 and dof == 1:
-        return 1.
-    delta_rho_p = delta_rho ** (dof / 2 - 1)
 
     gamma = (1 / (2 ** (dof / 2) * gamma_func(dof))) ** 2
 
-    return gamma * delta_rho_p * delta_angle_p * np.exp(-(delta_rho + delta_angle) / 2)
+    # For one degree of freedom, the density has a pole at zero, which is replaced by one below
+    with np.errstate(divide="ignore", invalid="ignore"):
+        delta_angle_p = delta_angle ** (dof / 2 - 1)
+        delta_rho_p = delta_rho ** (dof / 2 - 1)
+        weights = gamma * delta_rho_p * delta_angle_p * np.exp(-(delta_rho + delta_angle) / 2)
+    if dof == 1:
+        weights = np.where((delta_angle == 0) | (delta_rho == 0), 1., weights)
+    return weights
 
 
 class ConvChiSquared(ConvIntrinsic):
@@ -76,19 +79,12 @@ class ConvChiSquared(ConvIntrinsic):
         self.dof = dof
         super().__init__(*args, **kwargs)
 
+    def get_prior_parameters(self):
+        return (self.dof,)
+
     def define_kernel_values(self, template_matrix):
+        template_matrix = template_matrix.copy()
         template_matrix[:, :, 0] = template_matrix[:, :, 0] / template_matrix[:, :, 0].max()
-        interpolation_coefficients = np.zeros(template_matrix.shape[:-1] + template_matrix.shape[:-1])
-        for mean_rho_idx in range(template_matrix.shape[0]):
-            for mean_theta_idx in range(template_matrix.shape[1]):
-                mean_rho, mean_theta = template_matrix[mean_rho_idx, mean_theta_idx]
-                for rho_idx in range(template_matrix.shape[0]):
-                    for theta_idx in range(template_matrix.shape[1]):
-                        rho, theta = template_matrix[rho_idx, theta_idx]
-                        interpolation_coefficients[mean_rho_idx, mean_theta_idx, rho_idx, theta_idx] = chi_squared_pdf(
-                            mean_rho, mean_theta, rho, theta, self.dof
-                        )
-                interpolation_coefficients[mean_rho_idx, mean_theta_idx] = sp.special.softmax(
-                    interpolation_coefficients[mean_rho_idx, mean_theta_idx]
-                )
-        return interpolation_coefficients
+        mean_rho, mean_theta, rho, theta = kernel_grid(template_matrix)
+        interpolation_coefficients = chi_squared_pdf(mean_rho, mean_theta, rho, theta, self.dof)
+        return sp.special.softmax(interpolation_coefficients, axis=(2, 3))
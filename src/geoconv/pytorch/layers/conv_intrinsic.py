@@ -1,4 +1,5 @@
 from geoconv.preprocessing.barycentric_coordinates import create_template_matrix
+from geoconv.utils.kernel_cache import get_kernel_values
 
 from abc import ABC, abstractmethod
 from torch import nn
@@ -50,6 +51,10 @@ class ConvIntrinsic(ABC, nn.Module):
         The initializer for the weights.
     include_prior: bool
         Whether to weight the interpolations according to a pre-defined kernel.
+    sparse_interpolation: bool
+        Whether to interpolate the signal at the template vertices with a sparse matrix of size
+        (vertices * radial * angular, vertices), which contains three barycentric weights per row. This avoids
+        gathering the signal of all triangle vertices into a three times larger intermediate tensor.
     """
 
     def __init__(self,
@@ -59,7 +64,8 @@ class ConvIntrinsic(ABC, nn.Module):
                  include_prior=True,
                  activation="relu",
                  rotation_delta=1,
-                 initializer="xavier_uniform"):
+                 initializer="xavier_uniform",
+                 sparse_interpolation=False):
         super().__init__()
         self.activation_fn = activation
         self.rotation_delta = rotation_delta
@@ -67,6 +73,7 @@ class ConvIntrinsic(ABC, nn.Module):
         self.template_radius = template_radius
         self.initializer = initializer
         self.include_prior = include_prior
+        self.sparse_interpolation = sparse_interpolation
 
         # Attributes that depend on the data and are set automatically in build
         self._activation = ACTIVATIONS[self.activation_fn]
@@ -88,9 +95,13 @@ class ConvIntrinsic(ABC, nn.Module):
         Parameters
         ----------
         input_shape: (tensorflow.TensorShape, tensorflow.TensorShape)
-            The shape of the signal and the shape of the barycentric coordinates.
+            The shape of the signal and the shape of the barycentric coordinates. In case of split barycentric
+            coordinates, the latter is a pair containing the shapes of the vertex indices and the weights.
         """
         signal_shape, barycentric_shape = input_shape
+        if len(barycentric_shape) == 2:
+            # Split barycentric coordinates: (vertex indices, barycentric weights)
+            barycentric_shape = barycentric_shape[0]
 
         # Configure template
         self._template_size = (barycentric_shape[1], barycentric_shape[2])
@@ -123,7 +134,9 @@ class ConvIntrinsic(ABC, nn.Module):
         inputs: (tensorflow.Tensor, tensorflow.Tensor)
             The first tensor represents the signal defined on the manifold. It has size
             (n_vertices, feature_dim). The second tensor represents the barycentric coordinates. It has
-            size (n_vertices, n_radial, n_angular, 3, 2).
+            size (n_vertices, n_radial, n_angular, 3, 2). Alternatively, the barycentric coordinates can be given as
+            a pair of an int32 tensor of vertex indices and a float tensor of weights, both of size
+            (n_vertices, n_radial, n_angular, 3) (see `split_barycentric_coordinates`).
         orientations: tensorflow.Tensor
             Contains an integer that tells how to rotate the data.
 
@@ -153,23 +166,39 @@ class ConvIntrinsic(ABC, nn.Module):
             # No specific orientations given. Hence, compute for all orientations.
             orientations = torch.arange(start=0, end=self._all_rotations, step=self.rotation_delta)
 
-        def fold_neighbor(orientation):
-            # Weight              : (templates, radial, angular, input_dim)
-            # Mesh interpolations : (vertices, radial, angular, input_dim)
-            # Result              : (vertices, templates)
-            return torch.einsum(
-                "traf,kraf->kt",
-                self._template_neighbor_weights,
-                torch.roll(interpolations, shifts=orientation.item(), dims=2).float()
-            )
-
-        # Result: (vertices, n_rotations, templates)
-        conv_neighbor = torch.permute(
-            torch.stack(list(map(fold_neighbor, orientations))), dims=[1, 0, 2]
-        )
+        # Rotate the weights instead of the interpolations: Rolling the interpolations by `o` equals rolling the weights
+        # by `-o`. Weight bank: (radial * angular * input_dim, n_rotations * templates)
+        weight_bank = self._rotated_weight_bank(orientations)
+        # Interpolations : (vertices, radial * angular * input_dim)
+        # Result         : (vertices, n_rotations, templates)
+        conv_neighbor = torch.matmul(
+            interpolations.reshape(interpolations.shape[0], -1).float(), weight_bank
+        ).reshape(interpolations.shape[0], -1, self.amt_templates)
         # conv_neighbor: (vertices, n_rotations, templates)
         return self._activation(conv_center + conv_neighbor + self._bias)
 
+    def _rotated_weight_bank(self, orientations):
+        """Stacks rotated copies of the template neighbor weights into one matrix
+
+        Parameters
+        ----------
+        orientations: torch.Tensor
+            The orientations (angular shifts) for which the template shall be rotated.
+
+        Returns
+        -------
+        torch.Tensor:
+            A matrix of size (radial * angular * input_dim, n_rotations * templates), whose columns contain the template
+            neighbor weights rolled by `-orientation` along the angular axis.
+        """
+        n_angular = self._template_size[1]
+        angular_indices = torch.arange(n_angular, device=self._template_neighbor_weights.device)
+        # Rotated angular indices: (n_rotations, angular)
+        angular_indices = (orientations.to(angular_indices.device).reshape(-1, 1) + angular_indices) % n_angular
+        # (templates, radial, n_rotations, angular, input_dim) -> (radial, angular, input_dim, n_rotations, templates)
+        weight_bank = torch.permute(self._template_neighbor_weights[:, :, angular_indices], dims=[1, 3, 4, 2, 0])
+        return weight_bank.reshape(-1, angular_indices.shape[0] * self.amt_templates)
+
     def _patch_operator(self, mesh_signal, barycentric_coordinates):
         """Interpolates and weights mesh signal
 
@@ -204,24 +233,93 @@ class ConvIntrinsic(ABC, nn.Module):
         ----------
         mesh_signal: tensorflow.Tensor
             The signal values at the template vertices
-        barycentric_coordinates: tensorflow.Tensor
-            The barycentric coordinates for the template vertices
+        barycentric_coordinates: tensorflow.Tensor | (tensorflow.Tensor, tensorflow.Tensor)
+            The barycentric coordinates for the template vertices, either in a single tensor or split into vertex
+            indices and weights
 
         Returns
         -------
         tensorflow.Tensor:
             Interpolation values for the template vertices
         """
-        mesh_signal = mesh_signal[barycentric_coordinates[:, :, :, :, 0].int()]
+        if isinstance(barycentric_coordinates, (tuple, list)):
+            # Split barycentric coordinates: Vertex indices are already stored as integers
+            vertex_indices, barycentric_weights = barycentric_coordinates
+            barycentric_weights = barycentric_weights.to(mesh_signal.dtype)
+        else:
+            vertex_indices = barycentric_coordinates[:, :, :, :, 0].int()
+            barycentric_weights = barycentric_coordinates[:, :, :, :, 1]
+        if self.sparse_interpolation:
+            return self._sparse_signal_retrieval(mesh_signal, vertex_indices, barycentric_weights)
+        mesh_signal = mesh_signal[vertex_indices]
+        # (vertices, n_radial, n_angular, input_dim)
+        return torch.sum(barycentric_weights.unsqueeze(-1) * mesh_signal, dim=-2)
+
+    def _sparse_signal_retrieval(self, mesh_signal, vertex_indices, barycentric_weights):
+        """Interpolates signals at template vertices with a sparse interpolation matrix
+
+        Parameters
+        ----------
+        mesh_signal: torch.Tensor
+            The signal values at the template vertices
+        vertex_indices: torch.Tensor
+            The indices of the triangle vertices of size (vertices, n_radial, n_angular, 3)
+        barycentric_weights: torch.Tensor
+            The barycentric weights of size (vertices, n_radial, n_angular, 3)
+
+        Returns
+        -------
+        torch.Tensor:
+            Interpolation values for the template vertices
+        """
+        columns = vertex_indices.reshape(-1).long()
+        rows = torch.arange(columns.shape[0], device=columns.device) // 3
+        # Interpolation matrix: (vertices * n_radial * n_angular, vertices)
+        interpolation_matrix = torch.sparse_coo_tensor(
+            torch.stack([rows, columns]),
+            barycentric_weights.reshape(-1).to(mesh_signal.dtype),
+            size=(columns.shape[0] // 3, mesh_signal.shape[0]),
+            check_invariants=False
+        )
         # (vertices, n_radial, n_angular, input_dim)
-        return torch.sum(barycentric_coordinates[:, :, :, :, 1].unsqueeze(-1) * mesh_signal, dim=-2)
+        return torch.sparse.mm(interpolation_matrix, mesh_signal).reshape(
+            -1, self._template_size[0], self._template_size[1], mesh_signal.shape[-1]
+        )
 
     def _configure_kernel(self):
         """Defines all necessary interpolation coefficient matrices for the patch operator."""
-        # self._kernel = torch.tensor(self.define_kernel_values(self._template_vertices.numpy()).astype(np.float32))
-        v = torch.tensor(self.define_kernel_values(self._template_vertices.numpy()).astype(np.float32))
+        v = torch.tensor(self._get_kernel_values().astype(np.float32))
         self._kernel = nn.Parameter(v, requires_grad=False)
 
+    def _get_kernel_values(self):
+        """Returns the kernel values of this layer, which are shared by all layers with the same prior and template.
+
+        Returns
+        -------
+        np.ndarray:
+            The read-only kernel values (see `define_kernel_values`).
+        """
+        return get_kernel_values(
+            type(self),
+            self.get_prior_parameters(),
+            self._template_size,
+            self.template_radius,
+            lambda: self.define_kernel_values(self._template_vertices.numpy())
+        )
+
+    def get_prior_parameters(self):
+        """Returns the parameters of the prior, which determine the kernel values in addition to the template.
+
+        Subclasses whose `define_kernel_values` depends on further attributes have to return them here, as kernel
+        values are cached by prior, prior parameters, template size and template radius.
+
+        Returns
+        -------
+        tuple:
+            The parameters of the prior.
+        """
+        return ()
+
     @abstractmethod
     def define_kernel_values(self, template_matrix):
         """Defines the kernel values for each template vertex.
@@ -19,8 +19,5 @@ class ConvDirac(ConvIntrinsic):
         interpolation coefficients of the Dirac prior do not need to be used as they do not alter the signal at the
         template vertices.
         """
-        interpolation_coefficients = np.zeros(template_matrix.shape[:-1] + template_matrix.shape[:-1])
-        for mean_rho_idx in range(template_matrix.shape[0]):
-            for mean_theta_idx in range(template_matrix.shape[1]):
-                interpolation_coefficients[mean_rho_idx, mean_theta_idx, mean_rho_idx, mean_theta_idx] = 1.
-        return interpolation_coefficients
+        n_template_vertices = template_matrix.shape[0] * template_matrix.shape[1]
+        return np.eye(n_template_vertices).reshape(template_matrix.shape[:-1] + template_matrix.shape[:-1])
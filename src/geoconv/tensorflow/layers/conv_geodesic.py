@@ -4,6 +4,25 @@ import numpy as np
 import scipy as sp
 
 
+def kernel_grid(template_matrix):
+    """Pairs every template vertex (mean) with every template vertex (interpolation point)
+
+    Parameters
+    ----------
+    template_matrix: np.ndarray
+        An array of size [n_radial, n_angular, 2], which contains the polar coordinates of the template vertices.
+
+    Returns
+    -------
+    (np.ndarray, np.ndarray, np.ndarray, np.ndarray):
+        The mean radial- and angular coordinates of size [n_radial, n_angular, 1, 1] and the radial- and angular
+        coordinates of the interpolation points of size [1, 1, n_radial, n_angular].
+    """
+    mean_rho, mean_theta = template_matrix[:, :, None, None, 0], template_matrix[:, :, None, None, 1]
+    rho, theta = template_matrix[None, None, :, :, 0], template_matrix[None, None, :, :, 1]
+    return mean_rho, mean_theta, rho, theta
+
+
 def angle_distance(theta_max, theta_min):
     return np.minimum(theta_max - theta_min, theta_min + 2. * np.pi - theta_max)
 
@@ -26,6 +45,8 @@ def normal_pdf(mean_rho, mean_theta, var_rho, var_theta, rho, theta):
     theta: float
         Angular coordinate of the interpolation point that shall be weighted
 
+    All coordinates may also be given as broadcastable arrays.
+
     Returns
     -------
     float:
@@ -35,9 +56,7 @@ def normal_pdf(mean_rho, mean_theta, var_rho, var_theta, rho, theta):
     max_angle = np.maximum(mean_theta, theta)
     min_angle = np.minimum(mean_theta, theta)
     delta_angle = angle_distance(max_angle, min_angle)
-    vec = np.array([rho - mean_rho, delta_angle])
-    mat = np.array([[1 / var_rho, 0], [0, 1 / var_theta]])
-    exp = np.exp(-(1 / 2) * vec.T @ mat @ vec)
+    exp = np.exp(-(1 / 2) * ((rho - mean_rho) ** 2 / var_rho + delta_angle ** 2 / var_theta))
     return norm_coefficient * exp
 
 
@@ -50,19 +69,8 @@ class ConvGeodesic(ConvIntrinsic):
     """
 
     def define_kernel_values(self, template_matrix):
-        interpolation_coefficients = np.zeros(template_matrix.shape[:-1] + template_matrix.shape[:-1])
         var_rho = template_matrix[:, :, 0].var()
         var_theta = template_matrix[:, :, 1].var()
-        for mean_rho_idx in range(template_matrix.shape[0]):
-            for mean_theta_idx in range(template_matrix.shape[1]):
-                mean_rho, mean_theta = template_matrix[mean_rho_idx, mean_theta_idx]
-                for rho_idx in range(template_matrix.shape[0]):
-                    for theta_idx in range(template_matrix.shape[1]):
-                        rho, theta = template_matrix[rho_idx, theta_idx]
-                        interpolation_coefficients[mean_rho_idx, mean_theta_idx, rho_idx, theta_idx] = normal_pdf(
-                            mean_rho, mean_theta, var_rho, var_theta, rho, theta
-                        )
-                interpolation_coefficients[mean_rho_idx, mean_theta_idx] = sp.special.softmax(
-                    interpolation_coefficients[mean_rho_idx, mean_theta_idx]
-                )
-        return interpolation_coefficients
+        mean_rho, mean_theta, rho, theta = kernel_grid(template_matrix)
+        interpolation_coefficients = normal_pdf(mean_rho, mean_theta, var_rho, var_theta, rho, theta)
+        return sp.special.softmax(interpolation_coefficients, axis=(2, 3))
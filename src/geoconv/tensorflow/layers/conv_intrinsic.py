@@ -1,4 +1,5 @@
 from geoconv.preprocessing.barycentric_coordinates import create_template_matrix
+from geoconv.utils.kernel_cache import get_kernel_values
 
 from abc import ABC, abstractmethod
 
@@ -33,6 +34,10 @@ class ConvIntrinsic(ABC, keras.layers.Layer):
         An initializer for the template and bias.
     include_prior: bool
         Whether to weight the interpolations according to a pre-defined kernel.
+    sparse_interpolation: bool
+        Whether to interpolate the signal at the template vertices with a sparse matrix of size
+        (vertices * radial * angular, vertices), which contains three barycentric weights per row. This avoids
+        gathering the signal of all triangle vertices into a three times larger intermediate tensor.
     """
 
     def __init__(self,
@@ -44,7 +49,8 @@ class ConvIntrinsic(ABC, keras.layers.Layer):
                  name=None,
                  template_regularizer=None,
                  bias_regularizer=None,
-                 initializer="glorot_uniform"):
+                 initializer="glorot_uniform",
+                 sparse_interpolation=False):
         if name:
             super().__init__(name=name)
         else:
@@ -59,6 +65,7 @@ class ConvIntrinsic(ABC, keras.layers.Layer):
         self.bias_regularizer = bias_regularizer
         self.initializer = initializer
         self.include_prior = include_prior
+        self.sparse_interpolation = sparse_interpolation
 
         # Attributes that depend on the data and are set automatically in build
         self._activation = keras.layers.Activation(self.activation_fn)
@@ -83,7 +90,8 @@ class ConvIntrinsic(ABC, keras.layers.Layer):
                 "name": self.given_name,
                 "template_regularizer": self.template_regularizer,
                 "bias_regularizer": self.bias_regularizer,
-                "initializer": self.initializer
+                "initializer": self.initializer,
+                "sparse_interpolation": self.sparse_interpolation
             }
         )
         return config
@@ -94,9 +102,13 @@ class ConvIntrinsic(ABC, keras.layers.Layer):
         Parameters
         ----------
         input_shape: (tensorflow.TensorShape, tensorflow.TensorShape)
-            The shape of the signal and the shape of the barycentric coordinates.
+            The shape of the signal and the shape of the barycentric coordinates. In case of split barycentric
+            coordinates, the latter is a pair containing the shapes of the vertex indices and the weights.
         """
         signal_shape, barycentric_shape = input_shape
+        if len(barycentric_shape) == 2:
+            # Split barycentric coordinates: (vertex indices, barycentric weights)
+            barycentric_shape = barycentric_shape[0]
 
         # Configure template
         self._template_size = (barycentric_shape[1], barycentric_shape[2])
@@ -141,7 +153,9 @@ class ConvIntrinsic(ABC, keras.layers.Layer):
         inputs: (tensorflow.Tensor, tensorflow.Tensor)
             The first tensor represents the signal defined on the manifold. It has size
             (n_vertices, feature_dim). The second tensor represents the barycentric coordinates. It has
-            size (n_vertices, n_radial, n_angular, 3, 2).
+            size (n_vertices, n_radial, n_angular, 3, 2). Alternatively, the barycentric coordinates can be given as
+            a pair of an int32 tensor of vertex indices and a float tensor of weights, both of size
+            (n_vertices, n_radial, n_angular, 3) (see `split_barycentric_coordinates`).
         orientations: tensorflow.Tensor
             Contains an integer that tells how to rotate the data.
 
@@ -171,22 +185,44 @@ class ConvIntrinsic(ABC, keras.layers.Layer):
             # No specific orientations given. Hence, compute for all orientations.
             orientations = tf.range(start=0, limit=self._all_rotations, delta=self.rotation_delta)
 
-        def fold_neighbor(o):
-            # Weight              : (templates, radial, angular, input_dim)
-            # Mesh interpolations : (vertices, radial, angular, input_dim)
-            # Result              : (vertices, templates)
-            return tf.einsum(
-                "traf,kraf->kt",
-                self._template_neighbor_weights,
-                tf.roll(interpolations, shift=o, axis=2)
-            )
-
-        # conv_neighbor: (vertices, n_rotations, templates)
-        conv_neighbor = tf.transpose(
-            tf.map_fn(fold_neighbor, orientations, fn_output_signature=tf.float32), perm=[1, 0, 2]
+        # Rotate the weights instead of the interpolations: Rolling the interpolations by `o` equals rolling the weights
+        # by `-o`. Weight bank: (radial * angular * input_dim, n_rotations * templates)
+        weight_bank = self._rotated_weight_bank(orientations)
+        # Interpolations : (vertices, radial * angular * input_dim)
+        # Result         : (vertices, n_rotations, templates)
+        n_vertices = tf.shape(interpolations)[0]
+        conv_neighbor = tf.reshape(
+            tf.linalg.matmul(tf.reshape(interpolations, (n_vertices, -1)), weight_bank),
+            (n_vertices, -1, self.amt_templates)
         )
         return self._activation(conv_center + conv_neighbor + self._bias)
 
+    @tf.function
+    def _rotated_weight_bank(self, orientations):
+        """Stacks rotated copies of the template neighbor weights into one matrix
+
+        Parameters
+        ----------
+        orientations: tensorflow.Tensor
+            The orientations (angular shifts) for which the template shall be rotated.
+
+        Returns
+        -------
+        tensorflow.Tensor:
+            A matrix of size (radial * angular * input_dim, n_rotations * templates), whose columns contain the template
+            neighbor weights rolled by `-orientation` along the angular axis.
+        """
+        n_angular = self._template_size[1]
+        # Rotated angular indices: (n_rotations, angular)
+        angular_indices = tf.math.floormod(
+            tf.reshape(tf.cast(orientations, tf.int32), (-1, 1)) + tf.range(n_angular), n_angular
+        )
+        # (templates, radial, n_rotations, angular, input_dim) -> (radial, angular, input_dim, n_rotations, templates)
+        weight_bank = tf.transpose(
+            tf.gather(self._template_neighbor_weights, angular_indices, axis=2), perm=[1, 3, 4, 2, 0]
+        )
+        return tf.reshape(weight_bank, (-1, tf.shape(angular_indices)[0] * self.amt_templates))
+
     @tf.function
     def _patch_operator(self, mesh_signal, barycentric_coordinates):
         """Interpolates and weights mesh signal
@@ -221,32 +257,97 @@ class ConvIntrinsic(ABC, keras.layers.Layer):
         ----------
         mesh_signal: tensorflow.Tensor
             The signal values at the template vertices
-        barycentric_coordinates: tensorflow.Tensor
-            The barycentric coordinates for the template vertices
+        barycentric_coordinates: tensorflow.Tensor | (tensorflow.Tensor, tensorflow.Tensor)
+            The barycentric coordinates for the template vertices, either in a single tensor or split into vertex
+            indices and weights
 
         Returns
         -------
         tensorflow.Tensor:
             Interpolation values for the template vertices
         """
-        vertex_indices = tf.reshape(
-            tf.cast(barycentric_coordinates[:, :, :, :, 0], tf.int32), (-1, 1)
-        )
+        if isinstance(barycentric_coordinates, (tuple, list)):
+            # Split barycentric coordinates: Vertex indices are already stored as integers
+            vertex_indices, barycentric_weights = barycentric_coordinates
+            barycentric_weights = tf.cast(barycentric_weights, mesh_signal.dtype)
+        else:
+            vertex_indices = tf.cast(barycentric_coordinates[:, :, :, :, 0], tf.int32)
+            barycentric_weights = barycentric_coordinates[:, :, :, :, 1]
+        if self.sparse_interpolation:
+            return self._sparse_signal_retrieval(mesh_signal, vertex_indices, barycentric_weights)
         mesh_signal = tf.reshape(
-            tf.gather_nd(mesh_signal, vertex_indices),
+            tf.gather_nd(mesh_signal, tf.reshape(vertex_indices, (-1, 1))),
             (-1, self._template_size[0], self._template_size[1], 3, self._feature_dim)
         )
         # (vertices, n_radial, n_angular, input_dim)
-        return tf.math.reduce_sum(
-            tf.expand_dims(barycentric_coordinates[:, :, :, :, 1], axis=-1) * mesh_signal, axis=-2
+        return tf.math.reduce_sum(tf.expand_dims(barycentric_weights, axis=-1) * mesh_signal, axis=-2)
+
+    @tf.function
+    def _sparse_signal_retrieval(self, mesh_signal, vertex_indices, barycentric_weights):
+        """Interpolates signals at template vertices with a sparse interpolation matrix
+
+        Parameters
+        ----------
+        mesh_signal: tensorflow.Tensor
+            The signal values at the template vertices
+        vertex_indices: tensorflow.Tensor
+            The indices of the triangle vertices of size (vertices, n_radial, n_angular, 3)
+        barycentric_weights: tensorflow.Tensor
+            The barycentric weights of size (vertices, n_radial, n_angular, 3)
+
+        Returns
+        -------
+        tensorflow.Tensor:
+            Interpolation values for the template vertices
+        """
+        columns = tf.reshape(tf.cast(vertex_indices, tf.int64), (-1,))
+        n_entries = tf.shape(columns, out_type=tf.int64)[0]
+        rows = tf.range(n_entries) // 3
+        # Interpolation matrix: (vertices * n_radial * n_angular, vertices)
+        interpolation_matrix = tf.sparse.SparseTensor(
+            indices=tf.stack([rows, columns], axis=-1),
+            values=tf.cast(tf.reshape(barycentric_weights, (-1,)), mesh_signal.dtype),
+            dense_shape=tf.stack([n_entries // 3, tf.shape(mesh_signal, out_type=tf.int64)[0]])
+        )
+        # (vertices, n_radial, n_angular, input_dim)
+        return tf.reshape(
+            tf.sparse.sparse_dense_matmul(interpolation_matrix, mesh_signal),
+            (-1, self._template_size[0], self._template_size[1], self._feature_dim)
         )
 
     def _configure_kernel(self):
         """Defines all necessary interpolation coefficient matrices for the patch operator."""
-        self._kernel = tf.cast(
-            self.define_kernel_values(self._template_vertices.numpy()), tf.float32
+        self._kernel = tf.cast(self._get_kernel_values(), tf.float32)
+
+    def _get_kernel_values(self):
+        """Returns the kernel values of this layer, which are shared by all layers with the same prior and template.
+
+        Returns
+        -------
+        np.ndarray:
+            The read-only kernel values (see `define_kernel_values`).
+        """
+        return get_kernel_values(
+            type(self),
+            self.get_prior_parameters(),
+            self._template_size,
+            self.template_radius,
+            lambda: self.define_kernel_values(self._template_vertices.numpy())
         )
 
+    def get_prior_parameters(self):
+        """Returns the parameters of the prior, which determine the kernel values in addition to the template.
+
+        Subclasses whose `define_kernel_values` depends on further attributes have to return them here, as kernel
+        values are cached by prior, prior parameters, template size and template radius.
+
+        Returns
+        -------
+        tuple:
+            The parameters of the prior.
+        """
+        return ()
+
     @abstractmethod
     def define_kernel_values(self, template_matrix):
         """Defines the kernel values for each template vertex.
@@ -1,5 +1,5 @@
 from geoconv.tensorflow.layers.conv_intrinsic import ConvIntrinsic
-from geoconv.tensorflow.layers.conv_geodesic import angle_distance
+from geoconv.tensorflow.layers.conv_geodesic import angle_distance, kernel_grid
 
 import math
 import numpy as np
@@ -71,19 +71,12 @@ class ConvStudentT(ConvIntrinsic):
         self.dof = dof
         super().__init__(*args, **kwargs)
 
+    def get_prior_parameters(self):
+        return (self.dof,)
+
     def define_kernel_values(self, template_matrix):
+        template_matrix = template_matrix.copy()
         template_matrix[:, :, 0] = template_matrix[:, :, 0] / template_matrix[:, :, 0].max()
-        interpolation_coefficients = np.zeros(template_matrix.shape[:-1] + template_matrix.shape[:-1])
-        for mean_rho_idx in range(template_matrix.shape[0]):
-            for mean_theta_idx in range(template_matrix.shape[1]):
-                mean_rho, mean_theta = template_matrix[mean_rho_idx, mean_theta_idx]
-                for rho_idx in range(template_matrix.shape[0]):
-                    for theta_idx in range(template_matrix.shape[1]):
-                        rho, theta = template_matrix[rho_idx, theta_idx]
-                        interpolation_coefficients[mean_rho_idx, mean_theta_idx, rho_idx, theta_idx] = student_t_pdf(
-                            mean_rho, mean_theta, rho, theta, self.dof
-                        )
-                interpolation_coefficients[mean_rho_idx, mean_theta_idx] = sp.special.softmax(
-                    interpolation_coefficients[mean_rho_idx, mean_theta_idx]
-                )
-        return interpolation_coefficients
+        mean_rho, mean_theta, rho, theta = kernel_grid(template_matrix)
+        interpolation_coefficients = student_t_pdf(mean_rho, mean_theta, rho, theta, self.dof)
+        return sp.special.softmax(interpolation_coefficients, axis=(2, 3))
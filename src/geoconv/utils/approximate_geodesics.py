@@ -0,0 +1,142 @@
+from scipy.sparse import coo_matrix, csr_matrix, diags
+from scipy.sparse.csgraph import dijkstra
+from scipy.sparse.linalg import splu
+
+import numpy as np
+
+
+class GraphDistances:
+    def __init__(self, mesh):
+        """Approximates geodesic distances by shortest paths along the edges of a mesh.
+
+        The edge graph is built once. Distances are computed with Dijkstra's algorithm and overestimate geodesic
+        distances, as paths cannot cross faces.
+
+        Parameters
+        ----------
+        mesh: trimesh.Trimesh
+            The triangle mesh on which distances are computed.
+        """
+        n_vertices = mesh.vertices.shape[0]
+        edges = np.asarray(mesh.edges_unique)
+        lengths = np.linalg.norm(mesh.vertices[edges[:, 0]] - mesh.vertices[edges[:, 1]], axis=-1)
+        self.graph = csr_matrix((lengths, (edges[:, 0], edges[:, 1])), shape=(n_vertices, n_vertices))
+
+    def distances(self, sources):
+        """Computes the distances from the given source vertices to all vertices
+
+        Parameters
+        ----------
+        sources: np.ndarray
+            The indices of the source vertices.
+
+        Returns
+        -------
+        np.ndarray:
+            The distances of shape (n_sources, n_vertices).
+        """
+        return dijkstra(self.graph, directed=False, indices=sources)
+
+
+class HeatMethodDistances:
+    def __init__(self, mesh, time_factor=1., max_decay=30.):
+        """Approximates geodesic distances with the heat method.
+
+        The heat method has been introduced in:
+        > [Geodesics in Heat](https://doi.org/10.1145/2516971.2516977)
+        > Keenan Crane, Clarisse Weischedel and Max Wardetzky
+
+        Both linear systems, i.e. the heat flow and the Poisson equation, are factorized once. Afterwards, the distances
+        from a source vertex are given by two back-substitutions.
+
+        After one implicit time step `t`, heat roughly decays like `exp(-d / sqrt(t))` with the distance `d` to the
+        source. If it decays too far, the heat gradients far away from the source are dominated by rounding errors and
+        distances become meaningless. Thus, the time step is increased such that the heat decays by at most
+        `exp(-max_decay)` over the diagonal of the bounding box of the mesh. On finely resolved meshes, this exceeds the
+        usual time step of one squared mean edge length.
+
+        Parameters
+        ----------
+        mesh: trimesh.Trimesh
+            The triangle mesh on which distances are computed.
+        time_factor: float
+            The time step of the heat flow is at least `time_factor` times the squared mean edge length.
+        max_decay: float
+            The time step of the heat flow is at least the squared diagonal of the bounding box divided by
+            `max_decay ** 2`.
+        """
+        self.vertices = np.asarray(mesh.vertices, dtype=np.float64)
+        self.faces = np.asarray(mesh.faces)
+        n_vertices = self.vertices.shape[0]
+
+        # Edge vectors opposite to each corner of a face: e[:, i] points from corner i + 1 to corner i + 2
+        corners = self.vertices[self.faces]
+        self.edge_vectors = np.roll(corners, -2, axis=1) - np.roll(corners, -1, axis=1)
+        face_normals = np.cross(self.edge_vectors[:, 0], self.edge_vectors[:, 1])
+        double_areas = np.linalg.norm(face_normals, axis=-1)
+        self.unit_normals = face_normals / double_areas[:, None]
+        self.double_areas = double_areas
+
+        # Cotangent of the angle at each corner of a face
+        edges_a, edges_b = -np.roll(self.edge_vectors, -1, axis=1), np.roll(self.edge_vectors, 1, axis=1)
+        self.cotangents = np.einsum("fci,fci->fc", edges_a, edges_b) / double_areas[:, None]
+
+        # Positive semi-definite cotangent Laplacian: The weight of an edge is half the cotangent of the opposing angle
+        rows = np.roll(self.faces, -1, axis=1).flatten()
+        cols = np.roll(self.faces, -2, axis=1).flatten()
+        weights = self.cotangents.flatten() / 2
+        adjacency = coo_matrix(
+            (np.concatenate([weights, weights]), (np.concatenate([rows, cols]), np.concatenate([cols, rows]))),
+            shape=(n_vertices, n_vertices)
+        ).tocsc()
+        laplacian = diags(np.asarray(adjacency.sum(axis=1)).flatten()) - adjacency
+
+        # Lumped mass matrix: A third of the area of each adjacent face
+        vertex_areas = np.bincount(
+            self.faces.flatten(), weights=np.repeat(double_areas / 6, 3), minlength=n_vertices
+        )
+        bounding_box_diagonal = np.linalg.norm(self.vertices.max(axis=0) - self.vertices.min(axis=0))
+        time_step = max(
+            time_factor * np.linalg.norm(self.edge_vectors, axis=-1).mean() ** 2,
+            (bounding_box_diagonal / max_decay) ** 2
+        )
+        self.heat_flow = splu((diags(vertex_areas) + time_step * laplacian).tocsc())
+        # Slightly regularize the singular Laplacian, as distances are shifted to zero at the source anyway
+        self.poisson = splu((laplacian + 1e-8 * diags(vertex_areas)).tocsc())
+
+    def distances(self, sources):
+        """Computes the distances from the given source vertices to all vertices
+
+        Parameters
+        ----------
+        sources: np.ndarray
+            The indices of the source vertices.
+
+        Returns
+        -------
+        np.ndarray:
+            The distances of shape (n_sources, n_vertices).
+        """
+        sources = np.asarray(sources)
+        n_vertices = self.vertices.shape[0]
+        impulses = np.zeros((n_vertices, sources.shape[0]))
+        impulses[sources, np.arange(sources.shape[0])] = 1.
+        heat = self.heat_flow.solve(impulses)
+
+        # Normalized negative gradient of the heat within each face: (n_faces, n_sources, 3)
+        rotated_edges = np.cross(self.unit_normals[:, None], self.edge_vectors)
+        gradients = np.einsum("fcs,fci->fsi", heat[self.faces], rotated_edges) / self.double_areas[:, None, None]
+        directions = -gradients / np.maximum(np.linalg.norm(gradients, axis=-1, keepdims=True), 1e-16)
+
+        # Integrated divergence at each corner: Edges from the corner to the next two corners weighted by the
+        # cotangents of their opposing angles
+        next_edges, previous_edges = np.roll(self.edge_vectors, 1, axis=1), -np.roll(self.edge_vectors, -1, axis=1)
+        divergence = (
+            np.roll(self.cotangents, -2, axis=1)[:, :, None] * np.einsum("fci,fsi->fcs", next_edges, directions)
+            + np.roll(self.cotangents, -1, axis=1)[:, :, None] * np.einsum("fci,fsi->fcs", previous_edges, directions)
+        ) / 2
+        divergence_sum = np.zeros((n_vertices, sources.shape[0]))
+        np.add.at(divergence_sum, self.faces.flatten(), divergence.reshape(-1, sources.shape[0]))
+
+        potentials = self.poisson.solve(-divergence_sum)
+        return (potentials - potentials[sources, np.arange(sources.shape[0])]).T
@@ -0,0 +1,43 @@
+import numpy as np
+
+
+# Process-wide cache of kernel values (see `get_kernel_values`)
+_KERNEL_CACHE = {}
+
+
+def get_kernel_values(prior, parameters, template_size, template_radius, define_kernel_values):
+    """Returns the kernel values of a prior and computes them only once per process
+
+    Layers with the same prior, prior parameters, template size and template radius share the same kernel values.
+    The returned array is read-only, as it is shared by all of these layers.
+
+    Parameters
+    ----------
+    prior: type
+        The class of the intrinsic surface convolution, which defines the prior.
+    parameters: tuple
+        The parameters of the prior (see `ConvIntrinsic.get_prior_parameters`).
+    template_size: (int, int)
+        The amount of radial- and angular coordinates of the template.
+    template_radius: float
+        The radius of the template.
+    define_kernel_values: callable
+        A function without arguments that computes the kernel values if they are not cached yet.
+
+    Returns
+    -------
+    np.ndarray:
+        An array of size [n_radial, n_angular, n_radial, n_angular], which contains the interpolation weights for
+        the patch operator.
+    """
+    key = (prior, tuple(parameters), tuple(int(x) for x in template_size), float(template_radius))
+    if key not in _KERNEL_CACHE:
+        kernel_values = np.array(define_kernel_values())
+        kernel_values.setflags(write=False)
+        _KERNEL_CACHE[key] = kernel_values
+    return _KERNEL_CACHE[key]
+
+
+def clear_kernel_cache():
+    """Removes all cached kernel values"""
+    _KERNEL_CACHE.clear()
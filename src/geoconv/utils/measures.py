@@ -1,12 +1,274 @@
+from geoconv.utils.approximate_geodesics import GraphDistances, HeatMethodDistances
 from geoconv.utils.misc import get_included_faces, normalize_mesh
 
+from contextlib import nullcontext
 from matplotlib import pyplot as plt
 from multiprocessing import Pool
 from tqdm import tqdm
 
 import pygeodesic.geodesic as geodesic
+import hashlib
 import trimesh
 import numpy as np
+import os
+
+
+DISTANCE_ENGINES = ["exact", "graph", "heat"]
+
+# State of a worker process of `princeton_benchmark` (see `_initialize_benchmark_worker`)
+_BENCHMARK_WORKER_STATE = {}
+
+
+def _initialize_benchmark_worker(vertices, faces):
+    """Builds the geodesic algorithm for the reference mesh once per worker process
+
+    Parameters
+    ----------
+    vertices: np.ndarray
+        The vertices of the reference mesh.
+    faces: np.ndarray
+        The faces of the reference mesh.
+    """
+    _BENCHMARK_WORKER_STATE["geoalg"] = geodesic.PyGeodesicAlgorithmExact(vertices, faces)
+
+
+def _geodesic_errors_of_source(source_and_predictions):
+    """Computes the geodesic errors of all predictions for one ground truth vertex within a worker process
+
+    Parameters
+    ----------
+    source_and_predictions: (int, np.ndarray)
+        The index of the ground truth vertex and the indices of all vertices predicted for it.
+
+    Returns
+    -------
+    np.ndarray:
+        The geodesic distances between the ground truth vertex and each predicted vertex.
+    """
+    source, predictions = source_and_predictions
+    targets, inverse = np.unique(predictions, return_inverse=True)
+    distances, _ = _BENCHMARK_WORKER_STATE["geoalg"].geodesicDistances(
+        np.array([source], dtype=np.int32), targets.astype(np.int32)
+    )
+    return np.asarray(distances)[inverse]
+
+
+def _geodesic_distances_of_source(source):
+    """Computes the geodesic distances from one vertex to all vertices of the reference mesh within a worker process
+
+    Parameters
+    ----------
+    source: int
+        The index of the source vertex.
+
+    Returns
+    -------
+    np.ndarray:
+        The geodesic distances from the source vertex to all vertices.
+    """
+    distances, _ = _BENCHMARK_WORKER_STATE["geoalg"].geodesicDistances(np.array([source], dtype=np.int32), None)
+    return np.asarray(distances)
+
+
+def mesh_hash(mesh):
+    """Computes a hash of the vertices and faces of a mesh
+
+    Parameters
+    ----------
+    mesh: trimesh.Trimesh
+        The mesh to hash.
+
+    Returns
+    -------
+    str:
+        A hexadecimal digest which identifies the mesh.
+    """
+    digest = hashlib.sha256()
+    digest.update(np.ascontiguousarray(mesh.vertices, dtype=np.float64).tobytes())
+    digest.update(np.ascontiguousarray(mesh.faces, dtype=np.int64).tobytes())
+    return digest.hexdigest()[:32]
+
+
+def build_distance_matrix(reference_mesh, directory, dtype=np.float32, processes=1):
+    """Computes all geodesic distances within a reference mesh and stores them in a memory-mapped file
+
+    The file is named after the hash of the reference mesh (see `mesh_hash`). If it already exists, it is loaded
+    instead of being recomputed. Rows are written as soon as they are computed, such that the distance matrix never has
+    to be held in memory.
+
+    Parameters
+    ----------
+    reference_mesh: trimesh.Trimesh
+        The reference mesh.
+    directory: str
+        The directory in which to store the distance matrix.
+    dtype: type
+        The type in which distances are stored, e.g. `np.float32` or `np.float16`.
+    processes: int
+        The amount of concurrent processes.
+
+    Returns
+    -------
+    np.memmap:
+        The read-only geodesic distance matrix of shape (n_vertices, n_vertices).
+    """
+    path = os.path.join(directory, f"geodesic_distances_{mesh_hash(reference_mesh)}.npy")
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        n_vertices = reference_mesh.vertices.shape[0]
+        vertices, faces = np.asarray(reference_mesh.vertices), np.asarray(reference_mesh.faces)
+        # Write into a temporary file first, such that interrupted computations do not leave a broken matrix behind
+        distance_matrix = np.lib.format.open_memmap(
+            f"{path}.partial", mode="w+", dtype=dtype, shape=(n_vertices, n_vertices)
+        )
+        with Pool(processes, initializer=_initialize_benchmark_worker, initargs=(vertices, faces)) as p:
+            for source, distances in enumerate(tqdm(
+                p.imap(_geodesic_distances_of_source, range(n_vertices), chunksize=16),
+                total=n_vertices,
+                postfix="Computing reference geodesic distances"
+            )):
+                distance_matrix[source] = distances
+        distance_matrix.flush()
+        del distance_matrix
+        os.replace(f"{path}.partial", path)
+    return np.load(path, mmap_mode="r")
+
+
+def compute_geodesic_errors(pool, ground_truth, prediction, postfix=None):
+    """Computes the geodesic errors between ground truth and predicted vertices on the reference mesh
+
+    Pairs are grouped by their ground truth vertex, such that all predictions for a ground truth vertex are answered by
+    a single geodesic distance computation. Thus, the costs scale with the amount of distinct ground truth vertices.
+
+    Parameters
+    ----------
+    pool: multiprocessing.Pool
+        A pool whose workers have been initialized with the reference mesh (see `_initialize_benchmark_worker`).
+    ground_truth: np.ndarray
+        The indices of the ground truth vertices.
+    prediction: np.ndarray
+        The indices of the predicted vertices.
+    postfix: str
+        The postfix of the progress bar.
+
+    Returns
+    -------
+    np.ndarray:
+        The geodesic error of every pair of ground truth and predicted vertex.
+    """
+    ground_truth, prediction = np.asarray(ground_truth, dtype=np.int64), np.asarray(prediction, dtype=np.int64)
+    order = np.argsort(ground_truth, kind="stable")
+    sources, starts = np.unique(ground_truth[order], return_index=True)
+    tasks = list(zip(sources, np.split(prediction[order], starts[1:])))
+    geodesic_errors = np.zeros(ground_truth.shape[0])
+    if len(tasks) > 0:
+        geodesic_errors[order] = np.concatenate(
+            list(tqdm(pool.imap(_geodesic_errors_of_source, tasks, chunksize=16), total=len(tasks), postfix=postfix))
+        )
+    return geodesic_errors
+
+
+class PrincetonBenchmarkAccumulator:
+    def __init__(self, max_error=1., n_bins=10_000):
+        """Accumulates geodesic errors of many test meshes into the curve of the Princeton benchmark.
+
+        Geodesic errors are counted in a fixed-resolution histogram over `[0, max_error]`, such that the required
+        memory does not depend on the amount of added errors. Errors of exactly zero are counted separately. Errors
+        larger than `max_error` are counted at the largest error seen.
+
+        Parameters
+        ----------
+        max_error: float
+            The largest geodesic error that is resolved by the histogram. For normalized meshes, geodesic errors are
+            at most one.
+        n_bins: int
+            The amount of histogram bins within `(0, max_error]`.
+        """
+        self.edges = np.linspace(0., max_error, num=n_bins + 1)
+        # Index 0 counts errors of zero, index i in [1, n_bins] counts errors in (edges[i - 1], edges[i]] and the last
+        # index counts errors larger than `max_error`
+        self.counts = np.zeros(n_bins + 2, dtype=np.int64)
+        self.largest_error = 0.
+
+    def add(self, geodesic_errors):
+        """Adds the geodesic errors of a test mesh
+
+        Parameters
+        ----------
+        geodesic_errors: np.ndarray
+            The geodesic errors between ground truth and predicted vertices.
+        """
+        geodesic_errors = np.asarray(geodesic_errors, dtype=np.float64).flatten()
+        if geodesic_errors.shape[0] == 0:
+            return
+        self.counts += np.bincount(
+            np.searchsorted(self.edges, geodesic_errors, side="left"), minlength=self.counts.shape[0]
+        )
+        self.largest_error = max(self.largest_error, geodesic_errors.max())
+
+    def curve(self):
+        """Returns the cumulative curve of the Princeton benchmark
+
+        Returns
+        -------
+        np.ndarray:
+            An array of shape (n, 2), which contains the fraction of geodesic errors that are at most the geodesic
+            error in the second column. Only one row is given per geodesic error.
+        """
+        x_values = np.append(self.edges, self.largest_error)
+        fractions = np.cumsum(self.counts) / max(self.counts.sum(), 1)
+        non_empty = self.counts > 0
+        return np.stack([fractions[non_empty], x_values[non_empty]], axis=-1)
+
+    @staticmethod
+    def reduce_curve(values):
+        """Keeps only the highest fraction per geodesic error of a curve which is sorted by geodesic errors
+
+        Curves that have been stored by earlier versions of `princeton_benchmark` contain one row per geodesic error.
+
+        Parameters
+        ----------
+        values: np.ndarray
+            An array of shape (n, 2), which contains fractions and geodesic errors sorted by the latter.
+
+        Returns
+        -------
+        np.ndarray:
+            The rows of `values` that contain the last occurrence of each geodesic error.
+        """
+        is_last = np.append(values[1:, 1] != values[:-1, 1], True)
+        return values[is_last]
+
+
+def compute_approximate_geodesic_errors(distance_engine, ground_truth, prediction, chunk_size=256):
+    """Computes the geodesic errors between ground truth and predicted vertices with an approximate distance engine
+
+    The distances from `chunk_size` distinct ground truth vertices are computed at once.
+
+    Parameters
+    ----------
+    distance_engine: GraphDistances | HeatMethodDistances
+        The engine which approximates geodesic distances on the reference mesh.
+    ground_truth: np.ndarray
+        The indices of the ground truth vertices.
+    prediction: np.ndarray
+        The indices of the predicted vertices.
+    chunk_size: int
+        The amount of ground truth vertices whose distances are held in memory at once.
+
+    Returns
+    -------
+    np.ndarray:
+        The approximate geodesic error of every pair of ground truth and predicted vertex.
+    """
+    ground_truth, prediction = np.asarray(ground_truth, dtype=np.int64), np.asarray(prediction, dtype=np.int64)
+    sources, inverse = np.unique(ground_truth, return_inverse=True)
+    geodesic_errors = np.zeros(ground_truth.shape[0])
+    for start in range(0, sources.shape[0], chunk_size):
+        distances = distance_engine.distances(sources[start:start + chunk_size])
+        in_chunk = (inverse >= start) & (inverse < start + chunk_size)
+        geodesic_errors[in_chunk] = distances[inverse[in_chunk] - start, prediction[in_chunk]]
+    return geodesic_errors
 
 
 def princeton_benchmark(imcnn,
@@ -19,7 +281,13 @@ def princeton_benchmark(imcnn,
                         plot=True,
                         processes=1,
                         geodesic_diameter=None,
-                        pytorch_model=False):
+                        pytorch_model=False,
+                        distance_matrix_dir=None,
+                        distance_engine="exact",
+                        max_error=1.,
+                        n_bins=10_000,
+                        heat_time_factor=1.,
+                        heat_max_decay=30.):
     """Plots the accuracy w.r.t. a gradually changing geodesic error
 
     Princeton benchmark has been introduced in:
@@ -50,49 +318,77 @@ def princeton_benchmark(imcnn,
         The geodesic diameter of the reference mesh
     pytorch_model: bool
         Whether a pytorch model is given.
+    distance_matrix_dir: str
+        Only for the 'exact' distance engine: If given, the geodesic distances of the reference mesh are read from a
+        memory-mapped file within this directory, which is computed once if it does not exist yet (see
+        `build_distance_matrix`). Geodesic errors are then looked up instead of computed. A distance matrix that has
+        been built beforehand, e.g. in `np.float16`, is reused as it is.
+    distance_engine: str
+        How geodesic errors are computed. 'exact' uses exact geodesic distances. 'graph' approximates them by
+        shortest paths along mesh edges and 'heat' by the heat method (see `GraphDistances` and
+        `HeatMethodDistances`). Both approximations are prepared once for the reference mesh and are much faster.
+    max_error: float
+        The largest geodesic error that is resolved in the curve (see `PrincetonBenchmarkAccumulator`).
+    n_bins: int
+        The amount of geodesic error values that are resolved in the curve (see `PrincetonBenchmarkAccumulator`).
+    heat_time_factor: float
+        Only for the 'heat' distance engine: The `time_factor` of `HeatMethodDistances`.
+    heat_max_decay: float
+        Only for the 'heat' distance engine: The `max_decay` of `HeatMethodDistances`.
+
+    Returns
+    -------
+    np.ndarray:
+        The curve of the Princeton benchmark over all test meshes (see `PrincetonBenchmarkAccumulator.curve`).
     """
+    if distance_engine not in DISTANCE_ENGINES:
+        raise ValueError(f"Unknown distance engine '{distance_engine}'. Choose one of: {DISTANCE_ENGINES}")
 
     reference_mesh = trimesh.load_mesh(ref_mesh_path)
     if normalize:
         reference_mesh, _ = normalize_mesh(reference_mesh, geodesic_diameter=geodesic_diameter)
 
-    mesh_number = 0
-    for ((signal, barycentric), ground_truth) in test_dataset:
-        if pytorch_model:
-            prediction = np.array(imcnn([signal, barycentric]).cpu()).argmax(axis=1)
-            ground_truth = ground_truth.cpu()
-        else:
-            prediction = np.array(imcnn([signal, barycentric])).argmax(axis=1)
-        batched = [(data, reference_mesh) for data in np.stack([ground_truth, prediction], axis=-1)]
-        with Pool(processes) as p:
-            geodesic_errors = p.starmap(
-                geodesic_alg_wrapper,
-                tqdm(batched, total=len(batched), postfix=f"Computing Princeton benchmark for test mesh {mesh_number}")
-            )
-        mesh_number += 1
-
-    ##########################
-    # Sorting geodesic errors
-    ##########################
-    geodesic_errors = np.array(geodesic_errors)
-    geodesic_errors.sort()
-    amt_values = geodesic_errors.shape[0]
-    arr = np.array([((i + 1) / amt_values, x) for (i, x) in zip(range(amt_values), geodesic_errors)])
-    np.save(f"{file_name}.npy", arr)
-
-    ###############################################################
-    # One y-value per x-value: Take highest percentage per x-value
-    ###############################################################
-    unique_x_values = np.unique(arr[:, 1])
-    unique_values = []
-    for unique_x in unique_x_values:
-        unique_values.append(arr[np.where(arr[:, 1] == unique_x)[0][-1]])
-    unique_values = np.array(unique_values)
+    distance_matrix, approximate_distances = None, None
+    if distance_engine == "graph":
+        approximate_distances = GraphDistances(reference_mesh)
+    elif distance_engine == "heat":
+        approximate_distances = HeatMethodDistances(
+            reference_mesh, time_factor=heat_time_factor, max_decay=heat_max_decay
+        )
+    elif distance_matrix_dir is not None:
+        distance_matrix = build_distance_matrix(reference_mesh, distance_matrix_dir, processes=processes)
+
+    # Exact geodesic errors which cannot be looked up are computed by workers
+    vertices, faces = np.asarray(reference_mesh.vertices), np.asarray(reference_mesh.faces)
+    use_pool = approximate_distances is None and distance_matrix is None
+    accumulator = PrincetonBenchmarkAccumulator(max_error=max_error, n_bins=n_bins)
+    with Pool(
+        processes, initializer=_initialize_benchmark_worker, initargs=(vertices, faces)
+    ) if use_pool else nullcontext() as p:
+        for mesh_number, ((signal, barycentric), ground_truth) in enumerate(test_dataset):
+            if pytorch_model:
+                prediction = np.array(imcnn([signal, barycentric]).cpu()).argmax(axis=1)
+                ground_truth = ground_truth.cpu()
+            else:
+                prediction = np.array(imcnn([signal, barycentric])).argmax(axis=1)
+            if approximate_distances is not None:
+                geodesic_errors = compute_approximate_geodesic_errors(approximate_distances, ground_truth, prediction)
+            elif distance_matrix is not None:
+                ground_truth = np.asarray(ground_truth, dtype=np.int64)
+                geodesic_errors = distance_matrix[ground_truth, prediction].astype(np.float64)
+            else:
+                geodesic_errors = compute_geodesic_errors(
+                    p, ground_truth, prediction, postfix=f"Computing Princeton benchmark for test mesh {mesh_number}"
+                )
+            accumulator.add(geodesic_errors)
+
+    curve = accumulator.curve()
+    np.save(f"{file_name}.npy", curve)
 
     ###########
     # Plotting
     ###########
-    plt.plot(unique_values[:, 1], unique_values[:, 0], label=curve_label)
+    plt.plot(curve[:, 1], curve[:, 0], label=curve_label)
     plt.title(plot_title)
     plt.xlabel("geodesic error")
     plt.ylabel("% correct correspondences")
@@ -101,6 +397,7 @@ def princeton_benchmark(imcnn,
         plt.legend()
         plt.savefig(f"{file_name}.svg")
         plt.show()
+    return curve
 
 
 def geodesic_alg_wrapper(ground_truth_and_prediction, reference_mesh):
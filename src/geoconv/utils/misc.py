@@ -1,5 +1,7 @@
 from geoconv.preprocessing.barycentric_coordinates import polar_to_cart
+from geoconv.preprocessing.mesh_topology import MeshTopology
 
+from multiprocessing import Pool
 from tqdm import tqdm
 from scipy.linalg import blas
 
@@ -8,6 +10,12 @@ import numpy as np
 import trimesh
 
 
+DIAMETER_METHODS = ["exact", "approximate"]
+
+# State of a worker process of `compute_exact_geodesic_diameter` (see `_initialize_geodesic_worker`)
+_GEODESIC_WORKER_STATE = {}
+
+
 def compute_vector_angle(vector_a, vector_b, rotation_axis):
     """Compute the angle between two vectors
 
@@ -50,9 +58,12 @@ def get_faces_of_edge(edge, object_mesh):
     ----------
     edge: np.ndarray
         The edge for which the faces shall be returned.
-    object_mesh: trimesh.Trimesh
-        The underlying mesh.
+    object_mesh: trimesh.Trimesh | MeshTopology
+        The underlying mesh. If a mesh topology is given, the faces are looked up in O(1).
     """
+    if isinstance(object_mesh, MeshTopology):
+        return object_mesh.get_faces_of_edge(edge)
+
     edge = np.sort(edge)
     # 1.) Get the edge index of `sorted_edge` "in both ways", i.e. two indices for `sorted_edge`
     edge_indices = object_mesh.edges_sorted == edge
@@ -71,19 +82,21 @@ def get_neighbors(vertex, object_mesh):
     ----------
     vertex: int
         The index of the vertex for which the neighbor indices shall be computed
-    object_mesh: trimesh.Trimesh
-        An object mesh
+    object_mesh: trimesh.Trimesh | MeshTopology
+        An object mesh. If a mesh topology is given, the neighbors are looked up in O(1).
 
     Returns
     -------
     list:
         A list of neighboring vertex-indices.
     """
+    if isinstance(object_mesh, MeshTopology):
+        return object_mesh.get_neighbors(vertex)
 
     return list(object_mesh.vertex_adjacency_graph[vertex].keys())
 
 
-def normalize_mesh(mesh, geodesic_diameter=None):
+def normalize_mesh(mesh, geodesic_diameter=None, method="exact", processes=1):
     """Center mesh and scale x, y and z dimension with '1/geodesic diameter'.
 
     Parameters
@@ -92,19 +105,31 @@ def normalize_mesh(mesh, geodesic_diameter=None):
         The triangle mesh, that shall be normalized
     geodesic_diameter: float
         The geodesic diameter. If not provided, this function will compute the geodesic diameter.
+    method: str
+        Only if `geodesic_diameter` is not provided: Either 'exact', which computes the geodesic diameter from all
+        vertices (see `compute_exact_geodesic_diameter`), or 'approximate', which estimates it with a few farthest-point
+        sweeps (see `estimate_geodesic_diameter`).
+    processes: int
+        Only for the 'exact' method: The amount of processes used to compute the geodesic diameter.
 
     Returns
     -------
     (trimesh.Trimesh, float):
         The normalized mesh and the geodesic diameter, with which the mesh was normalized
     """
+    if method not in DIAMETER_METHODS:
+        raise ValueError(f"Unknown method '{method}'. Choose one of: {DIAMETER_METHODS}")
+
     # Center mesh
     for dim in range(3):
         mesh.vertices[:, dim] = mesh.vertices[:, dim] - mesh.vertices[:, dim].mean()
 
     # Determine geodesic diameter
     if geodesic_diameter is None:
-        distance_matrix, geodesic_diameter = compute_geodesic_diameter(mesh)
+        if method == "exact":
+            geodesic_diameter = compute_exact_geodesic_diameter(mesh, processes=processes)
+        else:
+            geodesic_diameter, _ = estimate_geodesic_diameter(mesh)
 
     # Scale mesh
     for dim in range(3):
@@ -139,6 +164,121 @@ def compute_geodesic_diameter(mesh):
     return distance_matrix, distance_matrix[distance_matrix != np.inf].max()
 
 
+def _initialize_geodesic_worker(vertices, faces):
+    """Builds the geodesic algorithm of a worker process once
+
+    Parameters
+    ----------
+    vertices: np.ndarray
+        The vertices of the mesh.
+    faces: np.ndarray
+        The faces of the mesh.
+    """
+    _GEODESIC_WORKER_STATE["geoalg"] = geodesic.PyGeodesicAlgorithmExact(vertices, faces)
+
+
+def _max_geodesic_distance(source_points):
+    """Computes the largest finite geodesic distance from a chunk of source points within a worker process
+
+    Parameters
+    ----------
+    source_points: np.ndarray
+        The source points of the chunk.
+
+    Returns
+    -------
+    float:
+        The largest finite geodesic distance between a source point and any vertex of the mesh.
+    """
+    max_distance = 0.
+    for source_point in source_points:
+        distances, _ = _GEODESIC_WORKER_STATE["geoalg"].geodesicDistances([int(source_point)], None)
+        distances = distances[np.isfinite(distances)]
+        if distances.shape[0] > 0:
+            max_distance = max(max_distance, distances.max())
+    return max_distance
+
+
+def compute_exact_geodesic_diameter(mesh, processes=1, chunk_size=64):
+    """Computes the geodesic diameter of a mesh without storing the distance matrix.
+
+    In contrast to `compute_geodesic_diameter`, only a running maximum of the geodesic distances is kept. Thus, the
+    required memory is linear in the amount of vertices. The source points are distributed onto `processes` workers,
+    each of which builds its geodesic algorithm once.
+
+    In case the mesh contains a pair of vertices which are not connected by a path, this
+    function returns the largest geodesic distance that has been seen as the geodesic diameter.
+
+    Parameters
+    ----------
+    mesh: trimesh.Trimesh
+        The triangle mesh, for which the geodesic diameter shall be calculated.
+    processes: int
+        The amount of processes used to compute geodesic distances.
+    chunk_size: int
+        The amount of source points that are handed to a worker at once.
+
+    Returns
+    -------
+    float:
+        The geodesic diameter of the mesh.
+    """
+    n_vertices = mesh.vertices.shape[0]
+    vertices, faces = np.asarray(mesh.vertices), np.asarray(mesh.faces)
+    chunks = [np.arange(idx, min(idx + chunk_size, n_vertices)) for idx in range(0, n_vertices, chunk_size)]
+    postfix = "Calculating geodesic diameter.."
+    if processes == 1:
+        _initialize_geodesic_worker(vertices, faces)
+        try:
+            return max(map(_max_geodesic_distance, tqdm(chunks, postfix=postfix)), default=0.)
+        finally:
+            _GEODESIC_WORKER_STATE.clear()
+    with Pool(processes, initializer=_initialize_geodesic_worker, initargs=(vertices, faces)) as p:
+        return max(
+            tqdm(p.imap_unordered(_max_geodesic_distance, chunks), total=len(chunks), postfix=postfix), default=0.
+        )
+
+
+def estimate_geodesic_diameter(mesh, n_sweeps=4):
+    """Estimates the geodesic diameter of a mesh with iterated farthest-point sweeps.
+
+    Starting at the vertex farthest from the mesh center, every sweep computes the geodesic distances from the
+    current source point and continues at the vertex farthest from it. The largest eccentricity seen so far is a
+    lower bound of the geodesic diameter. Twice the smallest eccentricity seen so far is an upper bound, as every
+    pair of vertices is connected via the corresponding source point. On typical meshes, the lower bound equals the
+    geodesic diameter after two sweeps already.
+
+    The upper bound only holds for meshes in which all vertices are connected by paths. Otherwise, unreachable
+    vertices are ignored as in `compute_geodesic_diameter`.
+
+    Parameters
+    ----------
+    mesh: trimesh.Trimesh
+        The triangle mesh, for which the geodesic diameter shall be estimated.
+    n_sweeps: int
+        The maximal amount of sweeps, i.e. single-source geodesic distance computations.
+
+    Returns
+    -------
+    (float, float):
+        A lower bound, which is used as the estimate of the geodesic diameter, and an upper bound.
+    """
+    vertices = np.asarray(mesh.vertices)
+    geoalg = geodesic.PyGeodesicAlgorithmExact(vertices, mesh.faces)
+    source_point = int(np.linalg.norm(vertices - vertices.mean(axis=0), axis=-1).argmax())
+    lower_bound, upper_bound, visited = 0., np.inf, set()
+    for _ in tqdm(range(n_sweeps), postfix="Estimating geodesic diameter.."):
+        visited.add(source_point)
+        distances, _ = geoalg.geodesicDistances([int(source_point)], None)
+        distances[~np.isfinite(distances)] = -1.
+        eccentricity = distances.max()
+        lower_bound, upper_bound = max(lower_bound, eccentricity), min(upper_bound, 2 * eccentricity)
+        source_point = int(distances.argmax())
+        if source_point in visited:
+            break
+    return lower_bound, upper_bound
+
+
 def gpc_systems_into_cart(gpc_systems):
     """Translates the geodesic polar coordinates of given GPC-systems into cartesian
 
@@ -0,0 +1,82 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+def allocate_arrays(shapes):
+    """Allocates numpy arrays within one block of shared memory
+
+    The caller owns the returned shared memory block and has to `close` and `unlink` it once all processes,
+    which attached to it via `attach_arrays`, are done.
+
+    Parameters
+    ----------
+    shapes: dict
+        A dictionary that maps names onto tuples `(shape, dtype)`.
+
+    Returns
+    -------
+    (multiprocessing.shared_memory.SharedMemory, dict, dict):
+        The shared memory block, a specification that describes where each array is located within the block and a
+        dictionary that maps names onto the (uninitialized) numpy arrays within the block.
+    """
+    shapes = {name: (tuple(shape), np.dtype(dtype)) for name, (shape, dtype) in shapes.items()}
+    n_bytes = {name: int(np.prod(shape)) * dtype.itemsize for name, (shape, dtype) in shapes.items()}
+    block = shared_memory.SharedMemory(create=True, size=max(sum(n + 8 for n in n_bytes.values()), 1))
+    spec, arrays, offset = {}, {}, 0
+    for name, (shape, dtype) in shapes.items():
+        arrays[name] = np.ndarray(shape, dtype=dtype, buffer=block.buf, offset=offset)
+        spec[name] = (offset, shape, dtype.str)
+        # Keep all arrays 8-byte aligned
+        offset += n_bytes[name] + (-n_bytes[name]) % 8
+    return block, spec, arrays
+
+
+def share_arrays(arrays):
+    """Copies numpy arrays into one block of shared memory
+
+    The caller owns the returned shared memory block and has to `close` and `unlink` it once all processes,
+    which attached to it via `attach_arrays`, are done.
+
+    Parameters
+    ----------
+    arrays: dict
+        A dictionary that maps names onto numpy arrays.
+
+    Returns
+    -------
+    (multiprocessing.shared_memory.SharedMemory, dict):
+        The shared memory block and a specification that describes where each array is located within the block.
+    """
+    arrays = {name: np.asarray(array) for name, array in arrays.items()}
+    block, spec, shared = allocate_arrays({name: (array.shape, array.dtype) for name, array in arrays.items()})
+    for name, array in arrays.items():
+        shared[name][...] = array
+    return block, spec
+
+
+def attach_arrays(name, spec, writeable=False):
+    """Attaches to arrays which have been placed into shared memory by `share_arrays`
+
+    Parameters
+    ----------
+    name: str
+        The name of the shared memory block.
+    spec: dict
+        The specification returned by `share_arrays`.
+    writeable: bool
+        Whether the returned arrays may be written to.
+
+    Returns
+    -------
+    (multiprocessing.shared_memory.SharedMemory, dict):
+        The attached shared memory block, which has to be kept alive as long as the arrays are used, and a dictionary
+        that maps names onto numpy arrays within the block.
+    """
+    block = shared_memory.SharedMemory(name=name)
+    arrays = {}
+    for array_name, (offset, shape, dtype) in spec.items():
+        array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf, offset=offset)
+        array.flags.writeable = writeable
+        arrays[array_name] = array
+    return block, arrays
@@ -1,4 +1,5 @@
 from geoconv.preprocessing.barycentric_coordinates import polar_to_cart
+from geoconv.utils.measures import PrincetonBenchmarkAccumulator
 
 from matplotlib import pyplot as plt
 from matplotlib.collections import PolyCollection
@@ -65,11 +66,7 @@ def draw_multiple_princeton_benchmarks(save_name, **kwargs):
         pb_values = np.load(path)
 
         # Filter values
-        unique_x_values = np.unique(pb_values[:, 1])
-        unique_values = []
-        for unique_x in unique_x_values:
-            unique_values.append(pb_values[np.where(pb_values[:, 1] == unique_x)[0][-1]])
-        unique_values = np.array(unique_values)
+        unique_values = PrincetonBenchmarkAccumulator.reduce_curve(pb_values)
 
         # Plot values
         plt.plot(unique_values[:, 1], unique_values[:, 0], linestyle=line_style, label=name, c=color)
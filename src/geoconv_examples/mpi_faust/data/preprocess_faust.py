@@ -1,4 +1,4 @@
-from geoconv.preprocessing.barycentric_coordinates import compute_barycentric_coordinates
+from geoconv.preprocessing.barycentric_coordinates import split_barycentric_coordinates
 from geoconv.preprocessing.gpc_system_group import GPCSystemGroup
 from geoconv.utils.misc import shuffle_mesh_vertices, normalize_mesh, find_largest_one_hop_dist
 
@@ -32,6 +32,58 @@ def get_file_number(file_name):
     raise RuntimeError(f"Filename '{file_name}' has no digit.")
 
 
+def save_atomically(path, array):
+    """Saves an array such that an interruption never leaves a truncated file at `path`
+
+    The array is written into '<path>.partial' first, which then replaces `path`. Thus, an existing file at `path`
+    is always complete, which is what `preprocess_faust` relies on when it skips meshes with existing files.
+
+    Parameters
+    ----------
+    path: str
+        The path of the `.npy`-file.
+    array: np.ndarray
+        The array to save.
+    """
+    with open(f"{path}.partial", "wb") as partial_file:
+        np.save(partial_file, array)
+    os.replace(f"{path}.partial", path)
+
+
+def split_barycentric_coordinates_file(bc_path, index_path, weight_path, weight_dtype, chunk_size=1024):
+    """Splits barycentric coordinates stored in a `.npy`-file chunk-wise into vertex indices and weights
+
+    Only `chunk_size` vertices are held in memory at once (see `split_barycentric_coordinates`). Both results are
+    written into '<path>.partial' first, which then replaces `path`. Thus, existing result files are always complete.
+
+    Parameters
+    ----------
+    bc_path: str
+        The path of the `.npy`-file which contains barycentric coordinates of shape
+        (n_vertices, n_radial, n_angular, 3, 2).
+    index_path: str
+        The path of the `.npy`-file for the int32 vertex indices.
+    weight_path: str
+        The path of the `.npy`-file for the barycentric weights.
+    weight_dtype: type
+        The floating point type of the barycentric weights.
+    chunk_size: int
+        The amount of vertices which are split at once.
+    """
+    barycentric_coordinates = np.load(bc_path, mmap_mode="r")
+    shape = barycentric_coordinates.shape[:-1]
+    vertex_indices = np.lib.format.open_memmap(f"{index_path}.partial", mode="w+", dtype=np.int32, shape=shape)
+    weights = np.lib.format.open_memmap(f"{weight_path}.partial", mode="w+", dtype=weight_dtype, shape=shape)
+    for idx in range(0, shape[0], chunk_size):
+        vertex_indices[idx:idx + chunk_size], weights[idx:idx + chunk_size] = split_barycentric_coordinates(
+            barycentric_coordinates[idx:idx + chunk_size], weight_dtype=weight_dtype
+        )
+    vertex_indices.flush(), weights.flush()
+    del vertex_indices, weights
+    os.replace(f"{index_path}.partial", index_path)
+    os.replace(f"{weight_path}.partial", weight_path)
+
+
 def preprocess_faust(n_radial,
                      n_angular,
                      target_dir,
@@ -40,7 +92,9 @@ def preprocess_faust(n_radial,
                      geodesic_diameters_path="",
                      precomputed_gpc_radius=-1.,
                      processes=1,
-                     add_noise=False):
+                     add_noise=False,
+                     barycentric_weight_dtype=None,
+                     diameter_method="exact"):
     """Preprocesses the FAUST-data set
 
     The FAUST-data set has to be downloaded from: https://faust-leaderboard.is.tuebingen.mpg.de/
@@ -68,9 +122,16 @@ def preprocess_faust(n_radial,
     precomputed_gpc_radius: float
         The GPC-system radius to use for GPC-system computation. If not provided, the script will calculate it.
     processes: int
-        The amount of concurrent processes that compute GPC-systems.
+        The amount of concurrent processes that compute GPC-systems and geodesic diameters.
     add_noise: bool
         Adds Gaussian noise to the mesh data.
+    barycentric_weight_dtype: type
+        If given (e.g. `np.float32` or `np.float16`), barycentric coordinates are stored split into int32 vertex
+        indices ('BCI_*.npy') and weights of this type ('BCW_*.npy') (see `split_barycentric_coordinates`).
+        Otherwise, they are stored in one float64 array ('BC_*.npy').
+    diameter_method: str
+        How to compute geodesic diameters which are not given in `geodesic_diameters_path`. Either 'exact' or
+        'approximate' (see `normalize_mesh`).
 
     Returns
     -------
@@ -112,7 +173,7 @@ def preprocess_faust(n_radial,
         if not (Path(normalized_v_name).is_file() and Path(normalized_f_name).is_file()):
             # Center and normalize mesh to unit geodesic diameter
             if geodesic_diameters[file_idx] == -1.:
-                reg_mesh, geodesic_diameter = normalize_mesh(reg_mesh)
+                reg_mesh, geodesic_diameter = normalize_mesh(reg_mesh, method=diameter_method, processes=processes)
                 geodesic_diameters[file_idx] = geodesic_diameter
             else:
                 reg_mesh, geodesic_diameter = normalize_mesh(reg_mesh, geodesic_diameters[file_idx])
@@ -122,8 +183,8 @@ def preprocess_faust(n_radial,
                 reg_mesh.vertices = reg_mesh.vertices + np.random.normal(size=(6890, 3), loc=0, scale=0.0005)
 
             # Save normalized mesh
-            np.save(normalized_v_name, np.asarray(reg_mesh.vertices))
-            np.save(normalized_f_name, np.asarray(reg_mesh.faces))
+            save_atomically(normalized_v_name, np.asarray(reg_mesh.vertices))
+            save_atomically(normalized_f_name, np.asarray(reg_mesh.faces))
         else:
             vertices = np.load(normalized_v_name)
             faces = np.load(normalized_f_name)
@@ -153,6 +214,12 @@ def preprocess_faust(n_radial,
     for file_idx in range(len(paths_reg_meshes)):
         # Define file names
         bc_name = f"{target_dir}/BC_{paths_reg_meshes[file_idx][:-4]}.npy"
+        bc_index_name = f"{target_dir}/BCI_{paths_reg_meshes[file_idx][:-4]}.npy"
+        bc_weight_name = f"{target_dir}/BCW_{paths_reg_meshes[file_idx][:-4]}.npy"
+        if barycentric_weight_dtype is None:
+            bc_names = [bc_name]
+        else:
+            bc_names = [bc_index_name, bc_weight_name]
         gt_name = f"{target_dir}/GT_{paths_reg_meshes[file_idx][:-4]}.npy"
         signal_name = f"{target_dir}/SIGNAL_{paths_reg_meshes[file_idx][:-4]}.npy"
 
@@ -161,13 +228,20 @@ def preprocess_faust(n_radial,
         faces = np.load(f"{temp_dir}/faces_{file_idx}.npy")
         reg_mesh = trimesh.Trimesh(vertices=vertices, faces=faces)
 
-        # Check whether preprocessed files already exist
-        if not (Path(bc_name).is_file() and Path(gt_name).is_file() and Path(signal_name).is_file()):
+        # Check whether preprocessed files already exist. A remaining checkpoint tells that the computation of the
+        # barycentric coordinates has been interrupted (see `GPCSystemGroup.compute_barycentric_coordinates`).
+        bc_checkpoint_name = f"{bc_name}.checkpoint.json"
+        if not (all(Path(name).is_file() for name in bc_names)
+                and Path(gt_name).is_file()
+                and Path(signal_name).is_file()
+                and not Path(bc_checkpoint_name).is_file()):
             #######################################################
             # Shuffle vertices of query mesh and save ground truth
             #######################################################
-            reg_mesh, _, ground_truth = shuffle_mesh_vertices(reg_mesh)
-            np.save(gt_name, ground_truth)
+            # Re-use the shuffle of an interrupted run, such that its checkpoint can be resumed
+            given_shuffle = np.load(gt_name) if Path(gt_name).is_file() else None
+            reg_mesh, _, ground_truth = shuffle_mesh_vertices(reg_mesh, given_shuffle=given_shuffle)
+            save_atomically(gt_name, ground_truth)
 
             ####################
             # Store mesh signal
@@ -185,25 +259,24 @@ def preprocess_faust(n_radial,
                     use_interpolation=True,
                     use_normalization=True
                 )
-                np.save(signal_name, shot_descrs)
+                save_atomically(signal_name, shot_descrs)
             else:
-                np.save(signal_name, np.asarray(reg_mesh.vertices))
+                save_atomically(signal_name, np.asarray(reg_mesh.vertices))
 
-            ############################
-            # Compute local GPC-systems
-            ############################
+            ##########################################################################
+            # Compute local GPC-systems and Barycentric coordinates in one fused pass
+            ##########################################################################
             gpc_systems = GPCSystemGroup(reg_mesh, processes=processes)
-            gpc_systems.compute(u_max=gpc_radius)
-
-            ##################################
-            # Compute Barycentric coordinates
-            ##################################
-            bary_coords = compute_barycentric_coordinates(
-                gpc_systems, n_radial=n_radial, n_angular=n_angular, radius=kernel_radius
+            gpc_systems.compute_barycentric_coordinates(
+                u_max=gpc_radius, n_radial=n_radial, n_angular=n_angular, radius=kernel_radius, path=bc_name
             )
-            np.save(bc_name, bary_coords)
+            if barycentric_weight_dtype is not None:
+                # Split the streamed barycentric coordinates without loading them entirely into memory
+                split_barycentric_coordinates_file(bc_name, bc_index_name, bc_weight_name, barycentric_weight_dtype)
+                os.remove(bc_name)
+            os.remove(bc_checkpoint_name)
         else:
-            print(f"Found temp-files:\n{bc_name}\n{gt_name}\n{signal_name}\nSkipping to next temp.-mesh..")
+            print(f"Found temp-files:\n{bc_names}\n{gt_name}\n{signal_name}\nSkipping to next temp.-mesh..")
 
     shutil.rmtree(temp_dir)
     shutil.make_archive(target_dir, "zip", target_dir)
@@ -1,3 +1,4 @@
+from geoconv.preprocessing.barycentric_coordinates import split_barycentric_coordinates
 from geoconv_examples.mpi_faust.data.preprocess_faust import get_file_number
 
 from torch.utils.data import IterableDataset
@@ -46,15 +47,21 @@ def faust_generator(path_to_zip,
     -------
     generator:
         A generator yielding the preprocessed data. I.e. the signal defined on the vertices, the barycentric coordinates
-        and the ground truth correspondences.
+        and the ground truth correspondences. The barycentric coordinates are yielded as a pair of int32 vertex indices
+        and barycentric weights (see `split_barycentric_coordinates`), such that models do not have to split them on the
+        device. Barycentric coordinates that have not been split during preprocessing are split when they are read.
     """
     # Initialize and sort file names
     dataset = np.load(path_to_zip, allow_pickle=True)
     file_names = [os.path.basename(fn) for fn in dataset.files]
     SIGNAL = [file_name for file_name in file_names if file_name.startswith("SIGNAL")]
-    BC = [file_name for file_name in file_names if file_name.startswith("BC")]
+    BC = [file_name for file_name in file_names if file_name.startswith("BC_")]
+    BCI = [file_name for file_name in file_names if file_name.startswith("BCI_")]
+    BCW = [file_name for file_name in file_names if file_name.startswith("BCW_")]
     GT = [file_name for file_name in file_names if file_name.startswith("GT")]
     SIGNAL.sort(key=get_file_number), BC.sort(key=get_file_number), GT.sort(key=get_file_number)
+    BCI.sort(key=get_file_number), BCW.sort(key=get_file_number)
+    split_bc = len(BCI) > 0
     if return_coordinates:
         COORD = [file_name for file_name in file_names if file_name.startswith("COORD")]
         COORD.sort(key=get_file_number)
@@ -82,13 +89,14 @@ def faust_generator(path_to_zip,
         signal = torch.tensor(dataset[SIGNAL[idx]], dtype=torch.float32)
 
         # Read bc + add noise
-        bc = torch.tensor(dataset[BC[idx]], dtype=torch.float32)
-        kernel_size = bc.shape[1:3]
-
+        if split_bc:
+            bc_indices, bc_weights = dataset[BCI[idx]], dataset[BCW[idx]]
+        else:
+            bc_indices, bc_weights = split_barycentric_coordinates(dataset[BC[idx]])
         if set_type == 0:
-            noise = np.abs(np.random.normal(size=(bc.shape[0],) + kernel_size + (3, 2), scale=1e-5))
-            noise[:, :, :, :, 0] = 0
-            bc = bc + noise
+            noise = np.abs(np.random.normal(size=bc_weights.shape, scale=1e-5))
+            bc_weights = (bc_weights + noise).astype(bc_weights.dtype)
+        bc = (torch.tensor(bc_indices, dtype=torch.int32), torch.tensor(bc_weights))
 
         # Ground truth: Return the indices of the ones for each row
         gt = torch.tensor(dataset[GT[idx]], dtype=torch.int64).view(-1,)
@@ -97,7 +105,8 @@ def faust_generator(path_to_zip,
             if only_signal:
                 yield signal.to(device)
             else:
-                yield (signal.to(device), bc.to(device)), gt.to(device)
+                bc = tuple(tensor.to(device) for tensor in bc)
+                yield (signal.to(device), bc), gt.to(device)
         else:
             if only_signal:
                 yield signal
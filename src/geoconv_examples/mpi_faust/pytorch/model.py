@@ -51,7 +51,8 @@ class Imcnn(nn.Module):
                  adapt_data,
                  layer_conf=None,
                  variant="dirac",
-                 segmentation_classes=-1):
+                 segmentation_classes=-1,
+                 sparse_interpolation=False):
         super().__init__()
         self.signal_dim = signal_dim
         self.kernel_size = kernel_size
@@ -98,7 +99,8 @@ class Imcnn(nn.Module):
                     amt_templates=self.output_dims[idx],
                     template_radius=self.template_radius,
                     activation="relu",
-                    rotation_delta=self.rotation_deltas[idx]
+                    rotation_delta=self.rotation_deltas[idx],
+                    sparse_interpolation=sparse_interpolation
                 )
             )
             self.bn_layers.append(nn.BatchNorm1d(num_features=self.output_dims[idx]))
@@ -1,3 +1,4 @@
+from geoconv.preprocessing.barycentric_coordinates import split_barycentric_coordinates
 from geoconv_examples.mpi_faust.data.preprocess_faust import get_file_number
 
 import numpy as np
@@ -37,15 +38,20 @@ def faust_generator(path_to_zip, set_type=0, only_signal=False, return_coordinat
     -------
     generator:
         A generator yielding the preprocessed data. I.e. the signal defined on the vertices, the barycentric coordinates
-        and the ground truth correspondences.
+        and the ground truth correspondences. The barycentric coordinates are yielded as a pair of int32 vertex indices
+        and barycentric weights (see `split_barycentric_coordinates`), such that models do not have to split them on the
+        device. Barycentric coordinates that have not been split during preprocessing are split when they are read.
     """
-    kernel_size = None
     dataset = np.load(path_to_zip, allow_pickle=True)
     file_names = [os.path.basename(fn) for fn in dataset.files]
     SIGNAL = [file_name for file_name in file_names if file_name.startswith("SIGNAL")]
-    BC = [file_name for file_name in file_names if file_name.startswith("BC")]
+    BC = [file_name for file_name in file_names if file_name.startswith("BC_")]
+    BCI = [file_name for file_name in file_names if file_name.startswith("BCI_")]
+    BCW = [file_name for file_name in file_names if file_name.startswith("BCW_")]
     GT = [file_name for file_name in file_names if file_name.startswith("GT")]
     SIGNAL.sort(key=get_file_number), BC.sort(key=get_file_number), GT.sort(key=get_file_number)
+    BCI.sort(key=get_file_number), BCW.sort(key=get_file_number)
+    split_bc = len(BCI) > 0
     if return_coordinates:
         COORD = [file_name for file_name in file_names if file_name.startswith("COORD")]
         COORD.sort(key=get_file_number)
@@ -73,14 +79,14 @@ def faust_generator(path_to_zip, set_type=0, only_signal=False, return_coordinat
         signal = tf.cast(dataset[SIGNAL[idx]], tf.float32)
 
         # Read bc + add noise
-        bc = tf.cast(dataset[BC[idx]], tf.float32)
-        if kernel_size is None:
-            kernel_size = bc.shape[1:3]
-
+        if split_bc:
+            bc_indices, bc_weights = dataset[BCI[idx]], dataset[BCW[idx]]
+        else:
+            bc_indices, bc_weights = split_barycentric_coordinates(dataset[BC[idx]])
         if set_type == 0:
-            noise = np.abs(np.random.normal(size=(6890,) + kernel_size + (3, 2), scale=1e-5))
-            noise[:, :, :, :, 0] = 0
-            bc = bc + noise
+            noise = np.abs(np.random.normal(size=bc_weights.shape, scale=1e-5))
+            bc_weights = (bc_weights + noise).astype(bc_weights.dtype)
+        bc = (tf.constant(bc_indices, tf.int32), tf.constant(bc_weights))
 
         # Ground truth: Return the indices of the ones for each row
         # (as required by `keras.losses.SparseCategoricalCrossentropy`)
@@ -134,6 +140,15 @@ def load_preprocessed_faust(path_to_zip,
     tensorflow.data.Dataset:
         A tensorflow data set of the preprocessed MPI-FAUST geoconv_examples
     """
+    # Barycentric coordinates are given as int32 vertex indices and weights (see `faust_generator`)
+    dataset = np.load(path_to_zip, allow_pickle=True)
+    weight_files = [fn for fn in dataset.files if os.path.basename(fn).startswith("BCW_")]
+    weight_dtype = tf.as_dtype(dataset[weight_files[0]].dtype) if weight_files else tf.float32
+    bc_signature = (
+        tf.TensorSpec(shape=(None,) + kernel_size + (3,), dtype=tf.int32),  # Vertex indices
+        tf.TensorSpec(shape=(None,) + kernel_size + (3,), dtype=weight_dtype)  # Barycentric weights
+    )
+
     if only_signal:
         output_signature = tf.TensorSpec(shape=(None, signal_dim,), dtype=tf.float32)
     else:
@@ -141,7 +156,7 @@ def load_preprocessed_faust(path_to_zip,
             output_signature = (
                 (
                     tf.TensorSpec(shape=(None, signal_dim,), dtype=tf.float32),  # Signal
-                    tf.TensorSpec(shape=(None,) + kernel_size + (3, 2), dtype=tf.float32),  # Barycentric Coordinates
+                    bc_signature,  # Barycentric Coordinates
                     tf.TensorSpec(shape=(None, 3,), dtype=tf.float32),  # Coordinates
                 ),
                 tf.TensorSpec(shape=(None,), dtype=tf.float32)
@@ -150,7 +165,7 @@ def load_preprocessed_faust(path_to_zip,
             output_signature = (
                 (
                     tf.TensorSpec(shape=(None, signal_dim,), dtype=tf.float32),  # Signal
-                    tf.TensorSpec(shape=(None,) + kernel_size + (3, 2), dtype=tf.float32)  # Barycentric Coordinates
+                    bc_signature  # Barycentric Coordinates
                 ),
                 tf.TensorSpec(shape=(None,), dtype=tf.float32)
             )
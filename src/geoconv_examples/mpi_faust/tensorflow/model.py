@@ -15,6 +15,7 @@ class Imcnn(keras.Model):
                  layer_conf=None,
                  variant="dirac",
                  segmentation_classes=-1,
+                 sparse_interpolation=False,
                  *args,
                  **kwargs):
         super().__init__(*args, **kwargs)
@@ -59,7 +60,8 @@ class Imcnn(keras.Model):
                     template_radius=self.template_radius,
                     activation="relu",
                     name=f"ISC_layer_{idx}",
-                    rotation_delta=self.rotation_deltas[idx]
+                    rotation_delta=self.rotation_deltas[idx],
+                    sparse_interpolation=sparse_interpolation
                 )
             )
             self.bn_layers.append(keras.layers.BatchNormalization(axis=-1, name=f"BN_layer_{idx}"))
@@ -39,7 +39,11 @@ class HyperModel(keras_tuner.HyperModel):
     def build(self, hp):
         amp = AngularMaxPooling()
         signal_input = keras.layers.Input(shape=self.signal_dim, name="Signal_input")
-        bc_input = keras.layers.Input(shape=(self.kernel_size[0], self.kernel_size[1], 3, 2), name="BC_input")
+        # The data loader yields barycentric coordinates split into vertex indices and weights
+        bc_input = (
+            keras.layers.Input(shape=(self.kernel_size[0], self.kernel_size[1], 3), dtype="int32", name="BCI_input"),
+            keras.layers.Input(shape=(self.kernel_size[0], self.kernel_size[1], 3), name="BCW_input")
+        )
 
         #################
         # Handling Input
@@ -190,6 +194,6 @@ def hypertune(logging_dir,
 
     # Save best model
     best_model = tuner.get_best_models(num_models=1)[0]
-    best_model.build(input_shape=[(signal_dim,), (n_radial, n_angular, 3, 2)])
+    best_model.build(input_shape=[(signal_dim,), ((n_radial, n_angular, 3), (n_radial, n_angular, 3))])
     print(best_model.summary())
     best_model.save(f"{logging_dir}/best_model")
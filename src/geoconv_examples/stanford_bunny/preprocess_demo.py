@@ -6,7 +6,6 @@ from geoconv.preprocessing.barycentric_coordinates import compute_barycentric_co
 import open3d as o3d
 import trimesh
 import os
-import numpy as np
 
 
 def load_bunny(path, target_triangles_amount=6000):
@@ -88,9 +87,12 @@ def preprocess_demo(path_to_stanford_bunny="bun_zipper.ply",
 
     # Compute the barycentric coordinates for the template in the computed GPC-systems.
     bc = compute_barycentric_coordinates(
-        gpc_systems, n_radial=n_radial, n_angular=n_angular, radius=template_radius
+        gpc_systems,
+        n_radial=n_radial,
+        n_angular=n_angular,
+        radius=template_radius,
+        path=f"{os.path.dirname(path_to_stanford_bunny)}/bunny_barycentric_coordinates.npy"
     )
-    np.save(f"{os.path.dirname(path_to_stanford_bunny)}/bunny_barycentric_coordinates.npy", bc)
 
     ####################################################################
     # Visualization of the GPC-systems and the barycentric coordinates
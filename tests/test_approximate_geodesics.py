@@ -0,0 +1,15 @@
+from geoconv.utils.approximate_geodesics import HeatMethodDistances
+
+import numpy as np
+import trimesh
+
+
+def test_heat_method_on_a_finely_resolved_sphere():
+    """Heat method distances on the unit sphere must match great-circle distances also far away from the source"""
+    mesh = trimesh.creation.icosphere(subdivisions=5)
+    vertices = mesh.vertices / np.linalg.norm(mesh.vertices, axis=-1, keepdims=True)
+    sources = np.array([0, vertices.shape[0] // 2])
+    great_circle_distances = np.arccos(np.clip(vertices[sources] @ vertices.T, -1., 1.))
+
+    distances = HeatMethodDistances(mesh).distances(sources)
+    assert np.abs(distances - great_circle_distances).max() < .05
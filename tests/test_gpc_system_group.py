@@ -0,0 +1,55 @@
+from geoconv.preprocessing.barycentric_coordinates import create_template_matrix
+from geoconv.preprocessing.gpc_system_group import GPCSystemGroup
+
+import numpy as np
+import trimesh
+import warnings
+
+
+def interpolate_all(gpc_system_group, template_matrix, processes):
+    """Collects the barycentric coordinates of all GPC-systems yielded by `interpolate_template`"""
+    n_vertices = gpc_system_group.mesh_topology.n_vertices
+    barycentric_coordinates = np.zeros((n_vertices,) + template_matrix.shape[:2] + (3, 2))
+    for gpc_system_indices, blocks in gpc_system_group.interpolate_template(template_matrix, processes=processes):
+        barycentric_coordinates[gpc_system_indices] = blocks
+    return barycentric_coordinates
+
+
+def test_parallel_interpolation_with_overflowing_gpc_systems(monkeypatch):
+    """Workers must not interpolate the leftovers of buffer rows whose GPC-systems did not fit into them"""
+    u_max = .3
+    gpc_system_group = GPCSystemGroup(trimesh.creation.icosphere(subdivisions=3), processes=2, chunk_size=64)
+    # Pretend that the sample GPC-systems are tiny, such that buffer rows are too small for many GPC-systems
+    monkeypatch.setattr(gpc_system_group, "measure_costs", lambda u_max, n_samples=8: (1e-3, 0, 0))
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        gpc_system_group.compute(u_max=u_max)
+    assert len(gpc_system_group.object_mesh_gpc_systems.overflow) > 0
+
+    template_matrix = create_template_matrix(n_radial=2, n_angular=4, radius=.75 * u_max, in_cart=True)
+    np.testing.assert_array_equal(
+        interpolate_all(gpc_system_group, template_matrix, processes=2),
+        interpolate_all(gpc_system_group, template_matrix, processes=1)
+    )
+
+
+def test_native_engine_writes_into_buffer(monkeypatch):
+    """Rows written by the c-extension must equal the GPC-systems computed one after another"""
+    u_max = .3
+    gpc_system_group = GPCSystemGroup(trimesh.creation.icosphere(subdivisions=3), processes=2, backend="threads")
+    # Rows only have room for the smallest GPC-systems, such that the c-extension has to return the others
+    monkeypatch.setattr(gpc_system_group, "measure_costs", lambda u_max, n_samples=8: (1e-3, 0, 0))
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        gpc_system_group.compute(u_max=u_max)
+        payloads = gpc_system_group.compute_payloads(np.arange(gpc_system_group.mesh_topology.n_vertices), u_max)
+    buffer = gpc_system_group.object_mesh_gpc_systems
+    assert 0 < len(buffer.overflow) < len(buffer)
+
+    for source_point, (vertex_ids, radial, angular, _, faces) in enumerate(payloads):
+        local_vertex_ids, coordinates = buffer.get_local_gpc_system(source_point)
+        np.testing.assert_array_equal(local_vertex_ids, vertex_ids)
+        np.testing.assert_array_equal(coordinates, np.stack([radial, angular], axis=-1))
+        np.testing.assert_array_equal(
+            buffer.get_face_ids(source_point), gpc_system_group.mesh_topology.get_face_ids(faces)
+        )